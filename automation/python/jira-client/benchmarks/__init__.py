@@ -0,0 +1 @@
+"""Offline benchmarks for jira-client, run against a local fake Jira server."""
@@ -0,0 +1,184 @@
+"""Micro-benchmark: ADF ↔ text conversion against the previous recursive implementation.
+
+Run from the repository root::
+
+    python benchmarks/bench_adf.py [--number N]
+
+Each document is converted with the legacy recursive converter (kept below as the
+baseline) and with ``jira_client.utils``; the table shows the best time per call.
+"""
+
+import argparse
+import json
+import sys
+import timeit
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from jira_client.utils import adf_to_text, text_to_adf  # noqa: E402
+
+
+def legacy_text_to_adf(text: str) -> dict[str, Any]:
+    paragraphs = []
+    for para in text.split("\n\n"):
+        lines = para.strip().split("\n")
+        content: list[dict[str, Any]] = []
+        for i, line in enumerate(lines):
+            if line:
+                content.append({"type": "text", "text": line})
+            if i < len(lines) - 1 and line:
+                content.append({"type": "hardBreak"})
+        if content:
+            paragraphs.append({"type": "paragraph", "content": content})
+    if not paragraphs:
+        paragraphs = [{"type": "paragraph", "content": [{"type": "text", "text": text}]}]
+    return {"type": "doc", "version": 1, "content": paragraphs}
+
+
+def legacy_adf_to_text(adf: dict[str, Any] | str | None) -> str | None:
+    if not adf:
+        return None
+    if isinstance(adf, str):
+        return adf or None
+    texts: list[str] = []
+
+    def _traverse(node: dict[str, Any]) -> None:
+        node_type = node.get("type")
+        if node_type == "text":
+            texts.append(node.get("text", ""))
+        elif node_type == "hardBreak":
+            texts.append("\n")
+        for child in node.get("content", []):
+            _traverse(child)
+        if node_type == "paragraph" and texts and texts[-1] != "\n":
+            texts.append("\n")
+
+    _traverse(adf)
+    return "".join(texts).strip() or None
+
+
+# ----------------------------------------------------------------------
+# Realistic documents
+# ----------------------------------------------------------------------
+
+
+def _text(value: str, **marks: Any) -> dict[str, Any]:
+    node: dict[str, Any] = {"type": "text", "text": value}
+    if marks:
+        node["marks"] = [{"type": name, "attrs": attrs} for name, attrs in marks.items()]
+    return node
+
+
+def _para(*content: dict[str, Any]) -> dict[str, Any]:
+    return {"type": "paragraph", "content": list(content)}
+
+
+def bug_report() -> dict[str, Any]:
+    """A typical bug: prose, steps list, a mention and a short stack trace."""
+    return {
+        "type": "doc",
+        "version": 1,
+        "content": [
+            {"type": "heading", "attrs": {"level": 2}, "content": [_text("Summary")]},
+            _para(
+                _text("Checkout fails for "),
+                {"type": "mention", "attrs": {"id": "abc", "text": "@Dana"}},
+                _text(" when the cart contains a gift card."),
+            ),
+            {
+                "type": "orderedList",
+                "content": [
+                    {"type": "listItem", "content": [_para(_text(f"Step {i}: do thing {i}"))]}
+                    for i in range(1, 8)
+                ],
+            },
+            {
+                "type": "codeBlock",
+                "attrs": {"language": "python"},
+                "content": [
+                    _text("\n".join(f'  File "app.py", line {i}, in f{i}' for i in range(30)))
+                ],
+            },
+        ],
+    }
+
+
+def log_paste(lines: int = 2000) -> dict[str, Any]:
+    """A description that is mostly a pasted log, one hard break per line."""
+    content: list[dict[str, Any]] = []
+    for i in range(lines):
+        if content:
+            content.append({"type": "hardBreak"})
+        content.append(_text(f"2024-05-01T10:{i % 60:02d}:00Z INFO worker-{i % 8} handled {i}"))
+    return {"type": "doc", "version": 1, "content": [_para(*content)]}
+
+
+def release_table(rows: int = 200) -> dict[str, Any]:
+    """A release checklist table."""
+
+    def _cell(kind: str, value: str) -> dict[str, Any]:
+        return {"type": kind, "content": [_para(_text(value))]}
+
+    header = {
+        "type": "tableRow",
+        "content": [_cell("tableHeader", h) for h in ("Component", "Owner", "Status")],
+    }
+    body = [
+        {
+            "type": "tableRow",
+            "content": [
+                _cell("tableCell", f"service-{i}"),
+                _cell("tableCell", f"team-{i % 7}"),
+                _cell("tableCell", "done" if i % 3 else "pending"),
+            ],
+        }
+        for i in range(rows)
+    ]
+    return {"type": "doc", "version": 1, "content": [{"type": "table", "content": [header, *body]}]}
+
+
+def nested_lists(depth: int = 1500) -> dict[str, Any]:
+    """A pathologically deep list; the recursive converter exceeds the recursion limit."""
+    node: dict[str, Any] = {"type": "listItem", "content": [_para(_text("leaf"))]}
+    for level in range(depth):
+        lst = {"type": "bulletList", "content": [node]}
+        node = {"type": "listItem", "content": [_para(_text(f"level {level}")), lst]}
+    return {"type": "doc", "version": 1, "content": [{"type": "bulletList", "content": [node]}]}
+
+
+def _best(fn: Any, arg: Any, number: int) -> float | None:
+    try:
+        fn(arg)
+    except RecursionError:
+        return None
+    return min(timeit.repeat(lambda: fn(arg), number=number, repeat=5)) / number
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=200, help="calls per timing run")
+    args = parser.parse_args()
+
+    log_text = legacy_adf_to_text(log_paste())
+    cases = [
+        ("adf_to_text  bug report", legacy_adf_to_text, adf_to_text, bug_report()),
+        ("adf_to_text  2000-line log", legacy_adf_to_text, adf_to_text, log_paste()),
+        ("adf_to_text  200-row table", legacy_adf_to_text, adf_to_text, release_table()),
+        ("adf_to_text  1500-deep list", legacy_adf_to_text, adf_to_text, nested_lists()),
+        ("adf_to_text  raw JSON bytes", None, adf_to_text, json.dumps(log_paste()).encode()),
+        ("text_to_adf  2000-line log", legacy_text_to_adf, text_to_adf, log_text),
+    ]
+
+    print(f"{'case':32} {'legacy':>12} {'current':>12} {'speedup':>8}")
+    for name, legacy, current, doc in cases:
+        old = _best(legacy, doc, args.number) if legacy else None
+        new = _best(current, doc, args.number)
+        old_s = f"{old * 1e6:10.1f}µs" if old else "         n/a"
+        speedup = f"{old / new:7.2f}x" if old and new else "       -"
+        print(f"{name:32} {old_s} {new * 1e6:10.1f}µs {speedup}")
+
+
+if __name__ == "__main__":
+    main()
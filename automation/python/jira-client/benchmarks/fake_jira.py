@@ -0,0 +1,712 @@
+"""A local stand-in for the Jira Cloud REST v3 API, for offline benchmarks.
+
+Implements the endpoints the client's hot paths use, with realistic payloads:
+
+- ``GET search/jql`` — ``project = X`` / ``key in (...)`` / ``labels in (...)`` /
+  ``updated >= "-Nm"`` JQL, field projection and ``nextPageToken`` pagination (unknown
+  keys in ``key in (...)`` are rejected with 400, as Jira does), and
+  ``POST search/approximate-count``;
+- ``POST issue/bulk`` (up to 50 items; a summary starting with ``FAIL`` is rejected);
+- ``POST issue`` and ``GET`` / ``PUT`` / ``DELETE issue/{key}``;
+- ``GET`` / ``POST issue/{key}/transitions``, ``issue/{key}/comment`` and
+  ``issue/{key}/watchers``, and ``PUT issue/{key}/assignee``;
+- ``GET issue/{key}/changelog`` and ``POST changelog/bulkfetch`` (seeded status and
+  assignee changes, plus one entry per transition applied);
+- ``GET user/search`` (substring match on display name and email) and ``GET user``;
+- ``GET project`` and ``GET project/{key}``.
+
+Every response is delayed by ``latency`` seconds, page sizes are capped at
+``max_results``, and a ``throttle`` fraction of requests is answered with 429 and
+``Retry-After``. Control endpoints under ``/_fake/`` report request statistics
+(``GET /_fake/stats``) and restore the seeded data (``POST /_fake/reset``).
+
+Run it standalone with::
+
+    python -m benchmarks.fake_jira --issues 5000 --latency 0.01 --port 8080
+
+and point a client at it with ``JiraConfig(domain="http://127.0.0.1:8080", ...)``.
+"""
+
+import argparse
+import json
+import random
+import re
+import subprocess
+import sys
+import threading
+import time
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any
+from urllib.parse import parse_qs, urlparse
+
+API_PREFIX = "/rest/api/3/"
+PROJECT = "BENCH"
+BULK_LIMIT = 50
+CHANGELOG_BULK_LIMIT = 1_000
+
+_STATUSES = [
+    ("1", "To Do", "new"),
+    ("3", "In Progress", "indeterminate"),
+    ("10001", "Done", "done"),
+]
+_TRANSITIONS = [
+    {"id": "11", "name": "To Do", "to": {"id": "1", "name": "To Do"}},
+    {"id": "21", "name": "Start", "to": {"id": "3", "name": "In Progress"}},
+    {"id": "31", "name": "Done", "to": {"id": "10001", "name": "Done"}},
+]
+_PRIORITIES = ["Highest", "High", "Medium", "Low", "Lowest"]
+_TYPES = ["Task", "Bug", "Story", "Epic"]
+_WORDS = (
+    "request timeout cache worker queue retry payload index shard replica "
+    "latency backlog deploy rollback config schema migration parser token"
+).split()
+_KEY_IN_RE = re.compile(r"\bkey\s+in\s*\(([^)]*)\)", re.IGNORECASE)
+_LABELS_RE = re.compile(r"\blabels\s+in\s*\(([^)]*)\)", re.IGNORECASE)
+_UPDATED_RE = re.compile(r'\bupdated\s*>=\s*"?-(\d+)m"?', re.IGNORECASE)
+_PROJECT_RE = re.compile(r"\bproject\s*(?:=|in)\s*\(?\s*([^)\s]+(?:\s*,\s*[^)\s]+)*)", re.I)
+
+
+# ----------------------------------------------------------------------
+# Data
+# ----------------------------------------------------------------------
+
+
+_USERS = 50  # seeded accounts: User 0 ... User 49
+
+
+def _user(n: int) -> dict[str, Any]:
+    return {
+        "accountId": f"5b10ac8d82e05b22cc7d{n:04d}",
+        "displayName": f"User {n}",
+        "emailAddress": f"user{n}@example.com",
+        "active": True,
+        "timeZone": "Europe/Rome",
+        "avatarUrls": {"48x48": f"https://avatar.example.com/{n}.png"},
+    }
+
+
+def _sentence(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(_WORDS) for _ in range(words)).capitalize()
+
+
+def _paragraph(text: str) -> dict[str, Any]:
+    return {"type": "paragraph", "content": [{"type": "text", "text": text}]}
+
+
+def _description(rng: random.Random) -> dict[str, Any]:
+    content = [_paragraph(_sentence(rng, 25)) for _ in range(rng.randint(1, 4))]
+    content.append(
+        {
+            "type": "bulletList",
+            "content": [
+                {"type": "listItem", "content": [_paragraph(_sentence(rng, 6))]}
+                for _ in range(rng.randint(1, 5))
+            ],
+        }
+    )
+    return {"type": "doc", "version": 1, "content": content}
+
+
+def make_issue(n: int, project: str = PROJECT, seed: int = 0) -> dict[str, Any]:
+    """Return a deterministic, realistically sized issue payload (as ``GET issue``)."""
+    rng = random.Random(seed * 1_000_003 + n)
+    status_id, status, category = rng.choice(_STATUSES)
+    issue_type = rng.choice(_TYPES)
+    created = 1_704_067_200 + n * 3_600 + rng.randint(0, 3_599)  # from 2024-01-01
+    updated = created + rng.randint(60, 30 * 86_400)
+    issue_id = str(10_000 + n)
+    fields: dict[str, Any] = {
+        "summary": _sentence(rng, 8),
+        "description": _description(rng),
+        "issuetype": {
+            "id": str(_TYPES.index(issue_type) + 1),
+            "name": issue_type,
+            "subtask": False,
+        },
+        "status": {
+            "id": status_id,
+            "name": status,
+            "statusCategory": {"id": 2, "key": category, "name": status},
+        },
+        "priority": {"id": str(rng.randint(1, 5)), "name": rng.choice(_PRIORITIES)},
+        "assignee": _user(rng.randint(0, _USERS - 1)) if rng.random() < 0.8 else None,
+        "reporter": _user(rng.randint(0, _USERS - 1)),
+        "labels": rng.sample(_WORDS, rng.randint(0, 3)),
+        "components": [{"id": "10100", "name": "backend"}] if rng.random() < 0.5 else [],
+        "fixVersions": [],
+        "project": {"id": "10000", "key": project, "name": f"{project} project"},
+        "created": _timestamp(created),
+        "updated": _timestamp(updated),
+        "resolutiondate": _timestamp(updated) if category == "done" else None,
+        "duedate": None,
+        "parent": None,
+    }
+    for i in range(10):  # instances typically carry many custom fields
+        fields[f"customfield_{10_020 + i}"] = rng.choice(
+            [None, rng.randint(0, 100), _sentence(rng, 3)]
+        )
+    return {
+        "expand": "renderedFields,names,schema,operations",
+        "id": issue_id,
+        "key": f"{project}-{n}",
+        "self": f"https://example.atlassian.net/rest/api/3/issue/{issue_id}",
+        "fields": fields,
+    }
+
+
+def _timestamp(epoch: int) -> str:
+    return time.strftime("%Y-%m-%dT%H:%M:%S.000+0000", time.gmtime(epoch))
+
+
+def _comment(n: int) -> dict[str, Any]:
+    created = _timestamp(1_704_067_200 + n * 60)
+    return {
+        "id": str(20_000 + n),
+        "author": _user(n % 50),
+        "body": {"type": "doc", "version": 1, "content": [_paragraph(f"Comment {n}")]},
+        "created": created,
+        "updated": created,
+    }
+
+
+def _history(n: int, i: int) -> dict[str, Any]:
+    """The ``i``-th seeded changelog entry of issue ``n``: mostly status moves."""
+    if i % 3 == 2:
+        user = _user(i % 50)
+        item = {
+            "field": "assignee",
+            "fieldtype": "jira",
+            "fieldId": "assignee",
+            "from": None,
+            "fromString": None,
+            "to": user["accountId"],
+            "toString": user["displayName"],
+        }
+    else:
+        old, new = _STATUSES[i % 3], _STATUSES[(i + 1) % 3]
+        item = _status_item(old, new)
+    return {
+        "id": str(n * 1_000 + i),
+        "author": _user(i % 50),
+        "created": _timestamp(1_704_067_200 + n * 3_600 + i * 600),
+        "items": [item],
+    }
+
+
+def _status_item(old: tuple[str, str, str], new: tuple[str, str, str]) -> dict[str, Any]:
+    return {
+        "field": "status",
+        "fieldtype": "jira",
+        "fieldId": "status",
+        "from": old[0],
+        "fromString": old[1],
+        "to": new[0],
+        "toString": new[1],
+    }
+
+
+class Store:
+    """The server's issue data; every method is called with the server lock held."""
+
+    def __init__(self, issues: int, comments: int, seed: int, changes: int = 6) -> None:
+        self.seed = seed
+        self.comments_per_issue = comments
+        self.changes_per_issue = changes
+        self.initial = issues
+        self.reset()
+
+    def reset(self) -> None:
+        self.issues = {
+            f"{PROJECT}-{n}": make_issue(n, seed=self.seed) for n in range(1, self.initial + 1)
+        }
+        self.added_comments: dict[str, list[dict[str, Any]]] = {}
+        self.added_changes: dict[str, list[dict[str, Any]]] = {}
+        self.watchers: dict[str, list[str]] = {}
+        self.next_number = self.initial + 1
+
+    def create(self, fields: dict[str, Any]) -> dict[str, Any]:
+        project = (fields.get("project") or {}).get("key") or PROJECT
+        issue = make_issue(self.next_number, project, self.seed)
+        _apply_fields(issue, fields)
+        self.next_number += 1
+        self.issues[issue["key"]] = issue
+        return {"id": issue["id"], "key": issue["key"], "self": issue["self"]}
+
+    def comments(self, key: str) -> list[dict[str, Any]]:
+        number = int(key.rsplit("-", 1)[1])
+        seeded = [_comment(number * 1_000 + i) for i in range(self.comments_per_issue)]
+        return seeded + self.added_comments.get(key, [])
+
+    def changelog(self, key: str) -> list[dict[str, Any]]:
+        number = int(key.rsplit("-", 1)[1])
+        seeded = [_history(number, i) for i in range(self.changes_per_issue)]
+        return seeded + self.added_changes.get(key, [])
+
+
+def _apply_fields(issue: dict[str, Any], fields: dict[str, Any]) -> None:
+    """Apply a create/update ``fields`` payload, expanding name references as Jira does."""
+    current = issue["fields"]
+    for name, value in fields.items():
+        if name == "issuetype" and isinstance(value, dict) and value.get("name") in _TYPES:
+            type_id = str(_TYPES.index(value["name"]) + 1)
+            current[name] = {"id": type_id, "name": value["name"], "subtask": False}
+        elif name == "priority" and isinstance(value, dict) and value.get("name") in _PRIORITIES:
+            priority_id = str(_PRIORITIES.index(value["name"]) + 1)
+            current[name] = {"id": priority_id, "name": value["name"]}
+        elif name == "assignee":
+            account = (value or {}).get("accountId")
+            current[name] = {**_user(int(account[-4:])), "accountId": account} if account else None
+        elif name == "components":
+            current[name] = [{"id": "10100", "name": c["name"]} for c in value or []]
+        elif name in ("summary", "description", "labels", "duedate"):
+            current[name] = value
+
+
+# ----------------------------------------------------------------------
+# Server
+# ----------------------------------------------------------------------
+
+
+class FakeJiraServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 512
+
+    def __init__(
+        self,
+        address: tuple[str, int] = ("127.0.0.1", 0),
+        issues: int = 1_000,
+        latency: float = 0.0,
+        max_results: int = 100,
+        throttle: float = 0.0,
+        retry_after: float = 0.0,
+        comments: int = 5,
+        changes: int = 6,
+        seed: int = 0,
+    ) -> None:
+        super().__init__(address, _Handler)
+        self.latency = latency
+        self.max_results = max_results
+        self.throttle = throttle
+        self.retry_after = retry_after
+        self.store = Store(issues, comments, seed, changes)
+        self.lock = threading.Lock()
+        self.stats: Counter[str] = Counter()
+        self._throttle_debt = 0.0
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def should_throttle(self) -> bool:
+        """Answer a steady ``throttle`` fraction of requests with 429 (deterministically)."""
+        if not self.throttle:
+            return False
+        self._throttle_debt += self.throttle
+        if self._throttle_debt >= 1:
+            self._throttle_debt -= 1
+            return True
+        return False
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: FakeJiraServer
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+    def do_GET(self) -> None:
+        self._dispatch("GET")
+
+    def do_POST(self) -> None:
+        self._dispatch("POST")
+
+    def do_PUT(self) -> None:
+        self._dispatch("PUT")
+
+    def do_DELETE(self) -> None:
+        self._dispatch("DELETE")
+
+    def _send(self, status: int, body: Any = None, headers: dict[str, str] | None = None) -> None:
+        raw = json.dumps(body, separators=(",", ":")).encode() if body is not None else b""
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(raw)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(raw)
+
+    def _error(self, status: int, message: str) -> None:
+        self._send(status, {"errorMessages": [message], "errors": {}})
+
+    def _dispatch(self, method: str) -> None:
+        url = urlparse(self.path)
+        query = {name: values[0] for name, values in parse_qs(url.query).items()}
+        length = int(self.headers.get("Content-Length") or 0)
+        body = json.loads(self.rfile.read(length)) if length else None
+        server = self.server
+
+        if url.path.startswith("/_fake/"):
+            return self._control(method, url.path[len("/_fake/") :])
+        if not url.path.startswith(API_PREFIX):
+            return self._error(404, f"No such endpoint: {url.path}")
+        path = url.path[len(API_PREFIX) :]
+
+        with server.lock:
+            server.stats["requests"] += 1
+            throttled = server.should_throttle()
+            if throttled:
+                server.stats["throttled"] += 1
+        if server.latency:
+            time.sleep(server.latency)
+        if throttled:
+            return self._send(
+                429,
+                {"errorMessages": ["Rate limit exceeded"]},
+                {"Retry-After": f"{server.retry_after:g}"},
+            )
+        with server.lock:
+            server.stats[f"{method} {_route_name(path)}"] += 1
+            status, data = _route(server, method, path, query, body)
+        if isinstance(data, str):
+            return self._error(status, data)
+        self._send(status, data)
+
+    def _control(self, method: str, action: str) -> None:
+        server = self.server
+        with server.lock:
+            if method == "GET" and action == "stats":
+                return self._send(200, {**server.stats, "issues": len(server.store.issues)})
+            if method == "POST" and action == "reset":
+                server.store.reset()
+                server.stats.clear()
+                server._throttle_debt = 0.0
+                return self._send(204)
+        self._error(404, f"Unknown control action {method} {action}")
+
+
+def _route_name(path: str) -> str:
+    """Replace the id in a path with a placeholder: ``issue/{key}/comment``."""
+    parts = path.split("/")
+    if len(parts) > 1 and parts[0] in ("issue", "project") and parts[1] != "bulk":
+        parts[1] = "{key}"
+    return "/".join(parts)
+
+
+def _route(
+    server: FakeJiraServer,
+    method: str,
+    path: str,
+    query: dict[str, str],
+    body: Any,
+) -> tuple[int, Any]:
+    """Handle one API request; return ``(status, payload)`` or ``(status, error message)``."""
+    store = server.store
+    parts = path.strip("/").split("/")
+
+    if path == "search/jql" and method == "GET":
+        return _search(server, query)
+    if path == "search/approximate-count" and method == "POST":
+        matched = _match(server.store, body.get("jql", ""))
+        return (400, matched) if isinstance(matched, str) else (200, {"count": len(matched)})
+    if path == "issue/bulk" and method == "POST":
+        return _bulk_create(store, body)
+    if path == "issue" and method == "POST":
+        return 201, store.create(body.get("fields", {}))
+    if parts[0] == "issue" and len(parts) >= 2:
+        issue = store.issues.get(parts[1])
+        if issue is None:
+            return 404, "Issue does not exist or you do not have permission to see it."
+        sub = parts[2] if len(parts) > 2 else ""
+        if not sub:
+            if method == "GET":
+                return 200, _project_fields(issue, query.get("fields"))
+            if method == "PUT":
+                _apply_fields(issue, (body or {}).get("fields", {}))
+                issue["fields"]["updated"] = _timestamp(int(time.time()))
+                return 204, None
+            if method == "DELETE":
+                del store.issues[parts[1]]
+                return 204, None
+        if sub == "transitions":
+            current = issue["fields"]["status"]["id"]
+            offered = [t for t in _TRANSITIONS if t["to"]["id"] != current]
+            if method == "GET":
+                return 200, {"transitions": offered}
+            target = next((t for t in offered if t["id"] == body["transition"]["id"]), None)
+            if target is None:
+                return 400, "Transition id is not valid for this issue."
+            old = next(s for s in _STATUSES if s[0] == current)
+            status_id, name, category = new = next(
+                s for s in _STATUSES if s[0] == target["to"]["id"]
+            )
+            store.added_changes.setdefault(parts[1], []).append(
+                {
+                    "id": str(900_000 + sum(map(len, store.added_changes.values()))),
+                    "author": _user(0),
+                    "created": _timestamp(int(time.time())),
+                    "items": [_status_item(old, new)],
+                }
+            )
+            issue["fields"]["updated"] = _timestamp(int(time.time()))
+            issue["fields"]["status"] = {
+                "id": status_id,
+                "name": name,
+                "statusCategory": {"id": 2, "key": category, "name": name},
+            }
+            return 204, None
+        if sub == "assignee" and method == "PUT":
+            _apply_fields(issue, {"assignee": body})
+            issue["fields"]["updated"] = _timestamp(int(time.time()))
+            return 204, None
+        if sub == "watchers":
+            watchers = store.watchers.setdefault(parts[1], [])
+            if method == "POST":
+                if body not in watchers:
+                    watchers.append(body)
+                return 204, None
+            return 200, {
+                "watchCount": len(watchers),
+                "watchers": [{"accountId": a} for a in watchers],
+            }
+        if sub == "comment":
+            if method == "POST":
+                comment = {**_comment(len(store.comments(parts[1]))), "body": body.get("body")}
+                store.added_comments.setdefault(parts[1], []).append(comment)
+                return 201, comment
+            comments = store.comments(parts[1])
+            start = int(query.get("startAt", 0))
+            size = min(int(query.get("maxResults", server.max_results)), server.max_results)
+            return 200, {
+                "startAt": start,
+                "maxResults": size,
+                "total": len(comments),
+                "comments": comments[start : start + size],
+            }
+        if sub == "changelog" and method == "GET":
+            histories = store.changelog(parts[1])
+            start = int(query.get("startAt", 0))
+            size = min(int(query.get("maxResults", server.max_results)), server.max_results)
+            return 200, {
+                "startAt": start,
+                "maxResults": size,
+                "total": len(histories),
+                "isLast": start + size >= len(histories),
+                "values": histories[start : start + size],
+            }
+    if path == "user/search" and method == "GET":
+        needle = query.get("query", "").casefold()
+        size = min(int(query.get("maxResults", 50)), 1000)
+        users = [_user(n) for n in range(_USERS)]
+        hits = [u for u in users if needle in f"{u['displayName']} {u['emailAddress']}".casefold()]
+        return 200, hits[:size]
+    if path == "user" and method == "GET":
+        account = query.get("accountId", "")
+        if not account.startswith(_user(0)["accountId"][:-4]) or int(account[-4:]) >= _USERS:
+            return 404, f"User {account!r} does not exist."
+        return 200, _user(int(account[-4:]))
+    if path == "changelog/bulkfetch" and method == "POST":
+        return _bulk_changelog(store, body)
+    if path == "project" and method == "GET":
+        return 200, [_project(PROJECT)]
+    if parts[0] == "project" and len(parts) == 2 and method == "GET":
+        return 200, _project(parts[1])
+    return 404, f"No route for {method} {path}"
+
+
+def _match(store: Store, jql: str) -> list[dict[str, Any]] | str:
+    """Return the issues matching ``jql``, or an error message."""
+    if match := _KEY_IN_RE.search(jql):
+        keys = [k.strip().strip("\"'").upper() for k in match.group(1).split(",") if k.strip()]
+        unknown = [k for k in keys if k not in store.issues]
+        if unknown:
+            return f"An issue with key '{unknown[0]}' does not exist for field 'key'."
+        return [store.issues[k] for k in keys]
+    issues = list(store.issues.values())
+    if match := _PROJECT_RE.search(jql):
+        projects = {p.strip().strip("\"'").upper() for p in match.group(1).split(",")}
+        issues = [i for i in issues if i["fields"]["project"]["key"] in projects]
+    if match := _LABELS_RE.search(jql):
+        labels = {label.strip().strip("\"'") for label in match.group(1).split(",")}
+        issues = [i for i in issues if labels & set(i["fields"]["labels"] or [])]
+    if match := _UPDATED_RE.search(jql):
+        cutoff = _timestamp(int(time.time()) - 60 * int(match.group(1)))
+        issues = [i for i in issues if i["fields"]["updated"] >= cutoff]
+    return issues
+
+
+def _search(server: FakeJiraServer, query: dict[str, str]) -> tuple[int, Any]:
+    issues = _match(server.store, query.get("jql", ""))
+    if isinstance(issues, str):
+        return 400, issues
+
+    size = min(int(query.get("maxResults", 50)), server.max_results)
+    start = int(query.get("nextPageToken") or 0)
+    page = issues[start : start + size]
+    data: dict[str, Any] = {
+        "issues": [_project_fields(issue, query.get("fields")) for issue in page],
+        "isLast": start + size >= len(issues),
+    }
+    if not data["isLast"]:
+        data["nextPageToken"] = str(start + size)
+    return 200, data
+
+
+def _bulk_changelog(store: Store, body: Any) -> tuple[int, Any]:
+    """Serve ``changelog/bulkfetch``: histories of many issues, by issue id, token-paged."""
+    wanted = body.get("issueIdsOrKeys", [])
+    if len(wanted) > CHANGELOG_BULK_LIMIT:
+        return 400, f"At most {CHANGELOG_BULK_LIMIT} issues are accepted."
+    by_id = {issue["id"]: key for key, issue in store.issues.items()}
+    keys = [by_id.get(str(ref), str(ref).upper()) for ref in wanted]
+    keys = [key for key in keys if key in store.issues]
+    field_ids = set(body.get("fieldIds") or [])
+    size = min(int(body.get("maxResults", CHANGELOG_BULK_LIMIT)), CHANGELOG_BULK_LIMIT)
+
+    # The token is "<issue index>:<history index>", so every page resumes in place.
+    position, offset = map(int, (body.get("nextPageToken") or "0:0").split(":"))
+    logs: list[dict[str, Any]] = []
+    count = 0
+    while position < len(keys) and count < size:
+        histories = store.changelog(keys[position])
+        log = {"issueId": store.issues[keys[position]]["id"], "changeHistories": []}
+        while offset < len(histories) and count < size:
+            history = histories[offset]
+            offset += 1
+            items = [i for i in history["items"] if not field_ids or i["fieldId"] in field_ids]
+            if items:
+                log["changeHistories"].append({**history, "items": items})
+                count += 1
+        if log["changeHistories"]:
+            logs.append(log)
+        if offset >= len(histories):
+            position, offset = position + 1, 0
+    data: dict[str, Any] = {"issueChangeLogs": logs}
+    if position < len(keys):
+        data["nextPageToken"] = f"{position}:{offset}"
+    return 200, data
+
+
+def _bulk_create(store: Store, body: Any) -> tuple[int, Any]:
+    updates = body.get("issueUpdates", [])
+    if len(updates) > BULK_LIMIT:
+        return 400, f"Bulk create accepts at most {BULK_LIMIT} issues."
+    created: list[dict[str, Any]] = []
+    errors: list[dict[str, Any]] = []
+    for index, update in enumerate(updates):
+        fields = update.get("fields", {})
+        if str(fields.get("summary", "")).startswith("FAIL"):
+            errors.append(
+                {
+                    "status": 400,
+                    "failedElementNumber": index,
+                    "elementErrors": {"errorMessages": [], "errors": {"summary": "Rejected"}},
+                }
+            )
+            continue
+        created.append(store.create(fields))
+    return (201 if created else 400), {"issues": created, "errors": errors}
+
+
+def _project_fields(issue: dict[str, Any], fields: str | None) -> dict[str, Any]:
+    if not fields or fields in ("*all", "*navigable"):
+        return issue
+    wanted = set(fields.split(","))
+    return {
+        **issue,
+        "fields": {name: value for name, value in issue["fields"].items() if name in wanted},
+    }
+
+
+def _project(key: str) -> dict[str, Any]:
+    return {
+        "id": "10000",
+        "key": key,
+        "name": f"{key} project",
+        "projectTypeKey": "software",
+        "issueTypes": [{"id": str(i + 1), "name": name} for i, name in enumerate(_TYPES)],
+    }
+
+
+# ----------------------------------------------------------------------
+# Running
+# ----------------------------------------------------------------------
+
+
+@contextmanager
+def serve(**options: Any) -> Iterator[FakeJiraServer]:
+    """Run a fake server on a background thread of this process."""
+    server = FakeJiraServer(**options)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+@contextmanager
+def serve_subprocess(**options: Any) -> Iterator[str]:
+    """Run a fake server in a child process and yield its base URL.
+
+    Keeps the server's JSON encoding and request handling off the benchmarked
+    process, so it does not compete with the client for the GIL.
+    """
+    args = [sys.executable, "-m", "benchmarks.fake_jira", "--port", "0"]
+    for name, value in options.items():
+        args += [f"--{name.replace('_', '-')}", str(value)]
+    root = Path(__file__).resolve().parents[1]
+    process = subprocess.Popen(args, stdout=subprocess.PIPE, text=True, cwd=root)
+    try:
+        line = process.stdout.readline() if process.stdout else ""
+        if not line.startswith("http"):
+            raise RuntimeError(f"Fake Jira server failed to start: {line!r}")
+        yield line.strip()
+    finally:
+        process.terminate()
+        process.wait(timeout=10)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--issues", type=int, default=1_000, help="issues to seed")
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds per response")
+    parser.add_argument("--max-results", type=int, default=100, help="page size cap")
+    parser.add_argument("--throttle", type=float, default=0.0, help="fraction answered 429")
+    parser.add_argument("--retry-after", type=float, default=0.0, help="Retry-After seconds")
+    parser.add_argument("--comments", type=int, default=5, help="comments per issue")
+    parser.add_argument("--changes", type=int, default=6, help="changelog entries per issue")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    server = FakeJiraServer(
+        (args.host, args.port),
+        issues=args.issues,
+        latency=args.latency,
+        max_results=args.max_results,
+        throttle=args.throttle,
+        retry_after=args.retry_after,
+        comments=args.comments,
+        changes=args.changes,
+        seed=args.seed,
+    )
+    print(server.url, flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,340 @@
+"""Throughput benchmarks against a local fake Jira server.
+
+Run from the repository root::
+
+    python -m benchmarks.run [--issues 5000] [--latency 0.005] [--throttle 0.02]
+                             [--output results.json] [--compare baseline.json]
+
+Each scenario is run once to warm up and then ``--repeat`` times against a freshly
+reset server (see :mod:`benchmarks.fake_jira`, started in a child process):
+
+- ``search``      — walk every issue of the project with ``iter_search``;
+- ``get_many``    — fetch a random sample of keys with ``get_many``;
+- ``bulk_create`` — create issues with ``bulk_create`` (hydrated);
+- ``parse``       — ``Issue.from_dict`` over raw payloads, without HTTP.
+
+Per scenario the results hold the median and best wall time, operations (issues)
+per second, HTTP requests per second (retries included), p50/p99 request latency
+as seen by the caller (retries and backoff included), the number of 429 responses,
+and the peak Python heap (``tracemalloc``) of one extra run. ``--output`` writes
+them as JSON; ``--compare`` prints the change against an earlier results file.
+"""
+
+import argparse
+import json
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+import urllib.request
+from collections.abc import Callable
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from benchmarks.fake_jira import PROJECT, make_issue, serve_subprocess  # noqa: E402
+from jira_client import JiraClient, JiraConfig  # noqa: E402
+from jira_client.codec import get_codec  # noqa: E402
+from jira_client.instrumentation import RequestEvent, RequestHook  # noqa: E402
+from jira_client.models.issue import Issue, IssueCreate  # noqa: E402
+
+SCHEMA_VERSION = 1
+SCENARIOS = ("search", "get_many", "bulk_create", "parse")
+
+
+class _LatencyRecorder(RequestHook):
+    """Records the latency of every request and counts HTTP attempts."""
+
+    def __init__(self) -> None:
+        self.latencies: list[float] = []
+        self.attempts = 0
+
+    def after_request(self, event: RequestEvent) -> None:
+        self.latencies.append(event.latency)
+        self.attempts += 1 + event.retries
+
+    def clear(self) -> None:
+        self.latencies.clear()
+        self.attempts = 0
+
+
+# ----------------------------------------------------------------------
+# Scenarios: each returns the number of operations (issues) it processed
+# ----------------------------------------------------------------------
+
+
+def _search(client: JiraClient, args: argparse.Namespace) -> int:
+    jql = f"project = {PROJECT} ORDER BY key"
+    return sum(1 for _ in client.issues.iter_search(jql, page_size=args.page_size))
+
+
+def _get_many(client: JiraClient, args: argparse.Namespace) -> int:
+    rng = random.Random(args.seed)
+    numbers = rng.sample(range(1, args.issues + 1), min(args.sample, args.issues))
+    return len(client.issues.get_many([f"{PROJECT}-{n}" for n in numbers]).issues)
+
+
+def _bulk_create(client: JiraClient, args: argparse.Namespace) -> int:
+    issues = [
+        IssueCreate(PROJECT, f"Benchmark issue {i}", description=f"Created by run {i}")
+        for i in range(args.bulk)
+    ]
+    return len(client.issues.bulk_create(issues).issues)
+
+
+_HTTP_SCENARIOS: dict[str, Callable[[JiraClient, argparse.Namespace], int]] = {
+    "search": _search,
+    "get_many": _get_many,
+    "bulk_create": _bulk_create,
+}
+
+
+def _parse(payloads: list[dict[str, Any]]) -> int:
+    for payload in payloads:
+        Issue.from_dict(payload)
+    return len(payloads)
+
+
+# ----------------------------------------------------------------------
+# Measurement
+# ----------------------------------------------------------------------
+
+
+def _control(url: str, action: str) -> dict[str, Any]:
+    method = "GET" if action == "stats" else "POST"
+    request = urllib.request.Request(f"{url}/_fake/{action}", method=method)
+    with urllib.request.urlopen(request) as response:
+        body = response.read()
+    return json.loads(body) if body else {}
+
+
+def _percentile(values: list[float], pct: float) -> float | None:
+    if not values:
+        return None
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def _measure(
+    run: Callable[[], int],
+    repeat: int,
+    reset: Callable[[], None] = lambda: None,
+    collect: Callable[[], None] = lambda: None,
+) -> dict[str, Any]:
+    """Time ``run`` (after a warm-up), then measure its peak heap in one more run.
+
+    ``reset`` is called before every run; ``collect`` after every timed run, outside
+    the timed region.
+    """
+    reset()
+    run()
+    timings: list[float] = []
+    ops = 0
+    for _ in range(repeat):
+        reset()
+        start = time.perf_counter()
+        ops = run()
+        timings.append(time.perf_counter() - start)
+        collect()
+
+    reset()
+    tracemalloc.start()
+    try:
+        run()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    median = statistics.median(timings)
+    return {
+        "ops": ops,
+        "seconds_median": median,
+        "seconds_best": min(timings),
+        "ops_per_sec": ops / median if median else None,
+        "peak_heap_mib": peak / 2**20,
+    }
+
+
+def run_http_scenario(name: str, url: str, args: argparse.Namespace) -> dict[str, Any]:
+    config = JiraConfig(
+        domain=url,
+        api_token="benchmark",
+        email="benchmark@example.com",
+        max_workers=args.workers,
+        max_retries=8,
+        backoff_factor=0.01,
+        pool_maxsize=args.workers,
+    )
+    recorder = _LatencyRecorder()
+    client = JiraClient(config, hooks=[recorder])
+    scenario = _HTTP_SCENARIOS[name]
+    latencies: list[float] = []
+    requests: list[int] = []
+    throttled: list[int] = []
+
+    def reset() -> None:
+        recorder.clear()
+        _control(url, "reset")
+
+    def collect() -> None:
+        latencies.extend(recorder.latencies)
+        requests.append(recorder.attempts)
+        throttled.append(_control(url, "stats").get("throttled", 0))
+
+    try:
+        result = _measure(lambda: scenario(client, args), args.repeat, reset, collect)
+    finally:
+        client._session.close()
+    result.update(
+        requests=statistics.median(requests),
+        requests_per_sec=statistics.median(requests) / result["seconds_median"],
+        latency_p50_ms=_ms(_percentile(latencies, 50)),
+        latency_p99_ms=_ms(_percentile(latencies, 99)),
+        throttled=statistics.median(throttled),
+    )
+    return result
+
+
+def _ms(seconds: float | None) -> float | None:
+    return None if seconds is None else seconds * 1000
+
+
+def run_parse_scenario(args: argparse.Namespace) -> dict[str, Any]:
+    payloads = [make_issue(n, seed=args.seed) for n in range(1, args.issues + 1)]
+    return _measure(lambda: _parse(payloads), args.repeat)
+
+
+# ----------------------------------------------------------------------
+# Reporting
+# ----------------------------------------------------------------------
+
+
+def _meta(codec: str) -> dict[str, Any]:
+    try:
+        from importlib.metadata import version
+
+        package_version = version("jira-client")
+    except Exception:
+        package_version = None
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=Path(__file__).parent,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "version": package_version,
+        "commit": commit,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "json_codec": codec,
+    }
+
+
+_COLUMNS = [
+    ("ops_per_sec", "ops/s", "{:,.0f}"),
+    ("requests_per_sec", "req/s", "{:,.1f}"),
+    ("latency_p50_ms", "p50 ms", "{:.2f}"),
+    ("latency_p99_ms", "p99 ms", "{:.2f}"),
+    ("peak_heap_mib", "heap MiB", "{:.1f}"),
+    ("throttled", "429s", "{:g}"),
+]
+
+
+def _format(value: Any, spec: str) -> str:
+    return "-" if value is None else spec.format(value)
+
+
+def print_table(results: dict[str, dict[str, Any]], baseline: dict[str, Any] | None) -> None:
+    print(f"{'scenario':<12}" + "".join(f"{title:>12}" for _, title, _ in _COLUMNS))
+    for name, result in results.items():
+        print(
+            f"{name:<12}"
+            + "".join(f"{_format(result.get(key), spec):>12}" for key, _, spec in _COLUMNS)
+        )
+        old = (baseline or {}).get("results", {}).get(name)
+        if old:
+            print(
+                f"{'  vs base':<12}"
+                + "".join(f"{_change(old.get(key), result.get(key)):>12}" for key, _, _ in _COLUMNS)
+            )
+
+
+def _change(old: float | None, new: float | None) -> str:
+    if not old or new is None:
+        return "-"
+    return f"{(new - old) / old:+.1%}"
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--scenarios", default=",".join(SCENARIOS), help="comma-separated")
+    parser.add_argument("--issues", type=int, default=2_000, help="issues seeded on the server")
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--sample", type=int, default=1_000, help="keys fetched by get_many")
+    parser.add_argument("--bulk", type=int, default=500, help="issues created by bulk_create")
+    parser.add_argument("--workers", type=int, default=8, help="client max_workers")
+    parser.add_argument("--latency", type=float, default=0.005, help="server seconds/response")
+    parser.add_argument("--max-results", type=int, default=100, help="server page size cap")
+    parser.add_argument("--throttle", type=float, default=0.0, help="fraction answered 429")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", type=Path, help="write results as JSON")
+    parser.add_argument("--compare", type=Path, help="earlier results JSON to compare with")
+    args = parser.parse_args(argv)
+
+    names = [n.strip() for n in args.scenarios.split(",") if n.strip()]
+    unknown = set(names) - set(SCENARIOS)
+    if unknown:
+        parser.error(f"unknown scenarios: {', '.join(sorted(unknown))}")
+
+    results: dict[str, dict[str, Any]] = {}
+    server = {
+        "issues": args.issues,
+        "latency": args.latency,
+        "max_results": args.max_results,
+        "throttle": args.throttle,
+        "seed": args.seed,
+    }
+    if set(names) & set(_HTTP_SCENARIOS):
+        with serve_subprocess(**server) as url:
+            for name in names:
+                if name in _HTTP_SCENARIOS:
+                    results[name] = run_http_scenario(name, url, args)
+    if "parse" in names:
+        results["parse"] = run_parse_scenario(args)
+    results = {name: results[name] for name in names}
+
+    report = {
+        "schema": SCHEMA_VERSION,
+        "meta": _meta(get_codec().name),
+        "params": {
+            **server,
+            "page_size": args.page_size,
+            "sample": args.sample,
+            "bulk": args.bulk,
+            "workers": args.workers,
+            "repeat": args.repeat,
+        },
+        "results": results,
+    }
+    baseline = json.loads(args.compare.read_text()) if args.compare else None
+    print_table(results, baseline)
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2) + "\n")
+        print(f"\nResults written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,4 @@
-"""Example: bulk-create multiple issues in one API call (useful for LLM pipelines).
+"""Example: bulk-create multiple issues in as few API calls as possible (useful for LLM pipelines).
 
 Reads the project key from JIRA_PROJECT in .env.
 
@@ -7,7 +7,7 @@ Usage:
 """
 
 from jira_client import JiraClient
-from jira_client.models import IssueCreate
+from jira_client.models import Issue, IssueCreate
 
 client = JiraClient.from_env()
 project_key = client._config.default_project
@@ -39,7 +39,12 @@ issues_to_create = [
     ),
 ]
 
-created = client.issues.bulk_create(issues_to_create)
-print(f"Created {len(created)} issue(s):")
-for issue in created:
-    print(f"  [{issue.key}] {issue.summary}")
+result = client.issues.bulk_create(issues_to_create)
+print(f"Created {len(result.issues)} issue(s):")
+for issue in result.issues:
+    # Issues that could not be read back yet are CreatedIssue references (no summary).
+    summary = issue.summary if isinstance(issue, Issue) else "(not fetched yet)"
+    print(f"  [{issue.key}] {summary}")
+
+for error in result.errors:
+    print(f"  Item #{error.index} failed ({error.status}): {error.message}")
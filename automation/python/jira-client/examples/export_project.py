@@ -0,0 +1,20 @@
+"""Example: stream a whole project to JSONL, resuming if a previous run was interrupted."""
+
+from jira_client import JiraClient
+from jira_client.export import export_issues
+
+client = JiraClient.from_env()
+
+project_key = client._config.default_project
+if not project_key:
+    raise ValueError("Set JIRA_PROJECT in your .env file")
+
+result = export_issues(
+    client,
+    f'project = "{project_key}" ORDER BY key ASC',
+    f"{project_key.lower()}_issues.jsonl",
+    fields=["summary", "status", "issuetype", "assignee", "created", "resolutiondate"],
+    checkpoint=f"{project_key.lower()}_issues.checkpoint",
+)
+resumed = " (resumed)" if result.resumed else ""
+print(f"Exported {result.rows} issues to {result.path}{resumed}")
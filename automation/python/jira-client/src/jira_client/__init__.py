@@ -3,6 +3,7 @@ from jira_client.config import JiraConfig
 from jira_client.exceptions import (
     JiraAuthError,
     JiraClientError,
+    JiraFieldNotLoadedError,
     JiraNotFoundError,
     JiraRateLimitError,
     JiraValidationError,
@@ -15,5 +16,6 @@ __all__ = [
     "JiraAuthError",
     "JiraNotFoundError",
     "JiraValidationError",
+    "JiraFieldNotLoadedError",
     "JiraRateLimitError",
 ]
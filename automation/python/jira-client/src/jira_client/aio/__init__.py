@@ -0,0 +1,8 @@
+"""Native asyncio client for Jira Cloud (requires the optional ``aiohttp`` dependency).
+
+Install with ``pip install "jira-client[async]"``.
+"""
+
+from jira_client.aio.client import AsyncJiraClient
+
+__all__ = ["AsyncJiraClient"]
@@ -0,0 +1,71 @@
+import asyncio
+from abc import ABC
+from collections.abc import Awaitable, Callable, Iterable
+from typing import Any, TypeVar
+
+from jira_client.aio.transport import AsyncResponse, AsyncTransport
+from jira_client.api.base import _is_read, raise_for_status
+from jira_client.coalesce import request_key
+from jira_client.config import JiraConfig
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class AsyncBaseAPI(ABC):
+    """Abstract base class for all async Jira API resource groups."""
+
+    def __init__(self, config: JiraConfig, transport: AsyncTransport) -> None:
+        self._config = config
+        self._transport = transport
+
+    def _url(self, path: str) -> str:
+        return f"{self._config.base_url}/{path.lstrip('/')}"
+
+    async def _request(self, method: str, path: str, **kwargs: Any) -> AsyncResponse:
+        """Send a request through the shared transport (retries, backoff, pacing)."""
+        if self._transport.flight is not None and not _is_read(method, kwargs):
+            self._transport.flight.forget()  # a write may change what reads return
+        return await self._transport.request(method, self._url(path), path=path, **kwargs)
+
+    async def _get(self, path: str, params: dict[str, Any] | None = None) -> Any:
+        """GET ``path`` and return the decoded body, coalescing identical concurrent GETs."""
+
+        async def fetch() -> Any:
+            return self._handle_response(await self._request("GET", path, params=params))
+
+        flight = self._transport.flight
+        if flight is None:
+            return await fetch()
+        return await flight.do(request_key(path, params), fetch)
+
+    async def _query(self, path: str, body: Any) -> Any:
+        """POST a read-only query (retried and coalesced like a GET); return the body."""
+
+        async def fetch() -> Any:
+            response = await self._request("POST", path, json=body, idempotent=True)
+            return self._handle_response(response)
+
+        flight = self._transport.flight
+        if flight is None:
+            return await fetch()
+        return await flight.do(request_key(path, None, body), fetch)
+
+    async def _gather(self, fn: Callable[[T], Awaitable[R]], items: Iterable[T]) -> list[R]:
+        """Run ``fn`` over every item concurrently and return results in input order.
+
+        The transport's concurrency cap bounds how many requests are actually in flight.
+        """
+        return list(await asyncio.gather(*(fn(item) for item in items)))
+
+    def _json(self, response: AsyncResponse) -> Any:
+        """Decode a response body with the client's codec ({} when empty)."""
+        content = response.content
+        return self._transport.codec.loads(content) if content else {}
+
+    def _handle_response(self, response: AsyncResponse) -> Any:
+        if response.status_code == 204:
+            return {}
+        if response.ok:
+            return self._json(response)
+        raise_for_status(response)
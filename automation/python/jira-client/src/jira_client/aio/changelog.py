@@ -0,0 +1,132 @@
+from collections.abc import AsyncIterator
+from datetime import datetime
+from typing import Any
+
+from jira_client.aio.base import AsyncBaseAPI
+from jira_client.aio.issues import AsyncIssuesAPI
+from jira_client.aio.transport import AsyncTransport
+from jira_client.api.changelog import (
+    _BULK_ISSUE_LIMIT,
+    _ID_FIELDS,
+    _bulk_body,
+    _changes,
+    _delta_jql,
+    _page_size,
+    _reached,
+    _watermark,
+)
+from jira_client.config import JiraConfig
+from jira_client.models.changelog import FieldChange
+
+
+class AsyncChangelogAPI(AsyncBaseAPI):
+    """Async issue changelogs (same surface as ``ChangelogAPI``)."""
+
+    def __init__(
+        self,
+        config: JiraConfig,
+        transport: AsyncTransport,
+        issues: AsyncIssuesAPI | None = None,
+    ) -> None:
+        super().__init__(config, transport)
+        self._issues = issues or AsyncIssuesAPI(config, transport)
+
+    async def iter_issue(
+        self,
+        issue_key: str,
+        fields: list[str] | None = None,
+        since: datetime | None = None,
+        page_size: int = 100,
+    ) -> AsyncIterator[FieldChange]:
+        """Yield the changes of one issue, oldest first, from its paged changelog."""
+        wanted = set(fields) if fields is not None else None
+        since = _watermark(since)
+        path = f"issue/{issue_key}/changelog"
+        async for histories in self._history_pages(path, page_size, since):
+            for change in _changes(issue_key, histories, wanted, since):
+                yield change
+
+    async def iter_issues(
+        self,
+        issue_keys: list[str],
+        fields: list[str] | None = None,
+        since: datetime | None = None,
+    ) -> AsyncIterator[FieldChange]:
+        """Yield the changes of many issues through ``changelog/bulkfetch``."""
+        keys = list(dict.fromkeys(k.strip().upper() for k in issue_keys))
+        wanted = set(fields) if fields is not None else None
+        since = _watermark(since)
+        for offset in range(0, len(keys), _BULK_ISSUE_LIMIT):
+            chunk = keys[offset : offset + _BULK_ISSUE_LIMIT]
+            found = await self._issues.get_many(chunk, _ID_FIELDS)
+            async for change in self._bulk({i.id: i.key for i in found.issues}, wanted, since):
+                yield change
+
+    async def iter_search(
+        self,
+        jql: str,
+        fields: list[str] | None = None,
+        since: datetime | None = None,
+        page_size: int = 100,
+    ) -> AsyncIterator[FieldChange]:
+        """Yield the changes of every issue matching ``jql``, updated since ``since``."""
+        wanted = set(fields) if fields is not None else None
+        since = _watermark(since)
+        ids: dict[str, str] = {}
+        async for issue in self._issues.iter_search(_delta_jql(jql, since), page_size, _ID_FIELDS):
+            ids[issue.id] = issue.key
+            if len(ids) == _BULK_ISSUE_LIMIT:
+                async for change in self._bulk(ids, wanted, since):
+                    yield change
+                ids = {}
+        if ids:
+            async for change in self._bulk(ids, wanted, since):
+                yield change
+
+    async def _bulk(
+        self, keys_by_id: dict[str, str], fields: set[str] | None, since: datetime | None
+    ) -> AsyncIterator[FieldChange]:
+        body = _bulk_body(list(keys_by_id), fields)
+        while True:
+            data = await self._query("changelog/bulkfetch", body)
+            for log in data.get("issueChangeLogs", []):
+                key = keys_by_id.get(log.get("issueId", ""), log.get("issueId", ""))
+                for change in _changes(key, log.get("changeHistories", []), fields, since):
+                    yield change
+            if not (token := data.get("nextPageToken")):
+                return
+            body = {**body, "nextPageToken": token}
+
+    async def _history_pages(
+        self, path: str, page_size: int, since: datetime | None
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        first = await self._get(path, params={"startAt": 0, "maxResults": page_size})
+        head = first.get("values", [])
+        total = first.get("total", len(head))
+        size = _page_size(first, page_size)
+        if since is None or len(head) >= total:
+            yield head
+            start = len(head)
+            while head and start < total:
+                data = await self._get(path, params={"startAt": start, "maxResults": size})
+                head = data.get("values", [])
+                yield head
+                start += len(head)
+            return
+
+        tail: list[list[dict[str, Any]]] = []
+        end = total
+        while end > len(head):
+            start = max(len(head), end - size)
+            data = await self._get(path, params={"startAt": start, "maxResults": end - start})
+            values = data.get("values", [])
+            if not values:
+                break
+            tail.append(values)
+            end = start
+            if _reached(values, since):
+                break
+        else:
+            tail.append(head)
+        for histories in reversed(tail):
+            yield histories
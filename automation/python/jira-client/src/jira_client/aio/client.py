@@ -0,0 +1,102 @@
+import aiohttp
+
+from jira_client.aio.changelog import AsyncChangelogAPI
+from jira_client.aio.comments import AsyncCommentsAPI
+from jira_client.aio.issues import AsyncIssuesAPI
+from jira_client.aio.projects import AsyncProjectsAPI
+from jira_client.aio.transport import AsyncTransport
+from jira_client.aio.users import AsyncUsersAPI
+from jira_client.cache.issue_cache import IssueCache
+from jira_client.codec import JsonCodec
+from jira_client.config import AUTH_BEARER, JiraConfig
+from jira_client.instrumentation import RequestHook
+from jira_client.transport import accept_encoding
+
+
+class AsyncJiraClient:
+    """Asyncio entry point for the Jira Cloud API client.
+
+    Exposes the same ``projects`` / ``issues`` / ``comments`` / ``changelog`` / ``users``
+    groups, models and exceptions as ``JiraClient``, with every operation as a
+    coroutine. All requests share one pooled ``aiohttp.ClientSession``;
+    ``max_concurrency`` caps how many are in flight at once.
+
+    Reads do not go through the SQLite issue cache, but with ``JiraConfig.cache_path``
+    set, writes drop what they change from it (``client.cache``), so sync clients and
+    later runs sharing the file do not serve stale copies.
+
+    Usage::
+
+        from jira_client.aio import AsyncJiraClient
+
+        async with AsyncJiraClient.from_env(max_concurrency=100) as client:
+            issues = await asyncio.gather(*(client.issues.get(k) for k in keys))
+    """
+
+    def __init__(
+        self,
+        config: JiraConfig,
+        max_concurrency: int = 64,
+        codec: JsonCodec | None = None,
+        hooks: list[RequestHook] | None = None,
+    ) -> None:
+        self._config = config
+        self._max_concurrency = max_concurrency
+        self._transport = AsyncTransport.from_config(
+            self._build_session, config, max_concurrency, codec, hooks
+        )
+        self.codec = self._transport.codec
+        self.hooks = self._transport.hooks
+        self.projects = AsyncProjectsAPI(config, self._transport)
+        self.cache = (
+            IssueCache(config.cache_path, config.cache_max_age, self.codec)
+            if config.cache_path
+            else None
+        )
+        self.issues = AsyncIssuesAPI(config, self._transport, self.cache)
+        self.comments = AsyncCommentsAPI(config, self._transport)
+        self.changelog = AsyncChangelogAPI(config, self._transport, self.issues)
+        self.users = AsyncUsersAPI(config, self._transport, self.cache)
+
+    def _build_session(self) -> aiohttp.ClientSession:
+        headers = {
+            "Accept": "application/json",
+            "Content-Type": "application/json",
+            "Accept-Encoding": accept_encoding() if self._config.compression else "identity",
+        }
+        auth = None
+        if self._config.auth_type == AUTH_BEARER:
+            headers["Authorization"] = f"Bearer {self._config.api_token}"
+        else:
+            auth = aiohttp.BasicAuth(self._config.email, self._config.api_token)
+        connector = aiohttp.TCPConnector(
+            limit=self._max_concurrency,
+            limit_per_host=max(self._config.pool_maxsize, self._max_concurrency),
+        )
+        timeout = aiohttp.ClientTimeout(
+            sock_connect=self._config.connect_timeout,
+            sock_read=self._config.read_timeout,
+        )
+        return aiohttp.ClientSession(
+            auth=auth,
+            headers=headers,
+            connector=connector,
+            timeout=timeout,
+            auto_decompress=True,
+        )
+
+    @classmethod
+    def from_env(cls, env_file: str = ".env", max_concurrency: int = 64) -> "AsyncJiraClient":
+        """Create an AsyncJiraClient by loading credentials from a .env file."""
+        config = JiraConfig.from_env(env_file)
+        return cls(config, max_concurrency)
+
+    async def aclose(self) -> None:
+        """Close the underlying connection pool."""
+        await self._transport.close()
+
+    async def __aenter__(self) -> "AsyncJiraClient":
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
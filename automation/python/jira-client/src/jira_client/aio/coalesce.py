@@ -0,0 +1,65 @@
+"""Async counterpart of :mod:`jira_client.coalesce`."""
+
+import asyncio
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any, TypeVar
+
+R = TypeVar("R")
+
+
+class AsyncSingleFlight:
+    """Runs one coroutine per key at a time and shares its outcome with concurrent awaiters.
+
+    Behaves like :class:`jira_client.coalesce.SingleFlight`: callers awaiting a key
+    that is already in flight receive the leader's result or exception, and with a
+    ``window`` > 0 successful results are served for that many seconds afterwards.
+    Cancelling a waiter, the leader included, does not cancel the shared call.
+    """
+
+    def __init__(self, window: float = 0.0) -> None:
+        self.window = window
+        self._calls: dict[Hashable, tuple[asyncio.Future[Any], float]] = {}
+        self._expiry: deque[tuple[float, Hashable, asyncio.Future[Any]]] = deque()
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[R]]) -> R:
+        now = time.monotonic()
+        self._prune(now)
+        entry = self._calls.get(key)
+        if entry is not None and (not entry[0].done() or entry[1] > now):
+            return await asyncio.shield(entry[0])
+
+        # The call runs as its own task, so cancelling the leader only stops it waiting.
+        task: asyncio.Future[Any] = asyncio.ensure_future(fn())
+        self._calls[key] = (task, 0.0)
+        task.add_done_callback(lambda done: self._settle(key, done))
+        return await asyncio.shield(task)
+
+    def forget(self) -> None:
+        """Drop every result, so the next call of each key runs again.
+
+        Calls still in flight become stale, as with ``SingleFlight.forget``.
+        """
+        self._calls.clear()
+        self._expiry.clear()
+
+    def _settle(self, key: Hashable, task: asyncio.Future[Any]) -> None:
+        """Keep a finished call's result for ``window`` seconds, or drop it."""
+        # exception() also marks a failure as retrieved, so it is not logged as unawaited.
+        failed = task.cancelled() or task.exception() is not None
+        if self._calls.get(key, (None,))[0] is not task:
+            return  # forgotten, or already replaced
+        if failed or self.window <= 0:
+            del self._calls[key]
+            return
+        expires = time.monotonic() + self.window
+        self._calls[key] = (task, expires)
+        self._expiry.append((expires, key, task))
+
+    def _prune(self, now: float) -> None:
+        expiry = self._expiry
+        while expiry and expiry[0][0] <= now:
+            _, key, future = expiry.popleft()
+            if self._calls.get(key, (None,))[0] is future:
+                del self._calls[key]
@@ -0,0 +1,75 @@
+from collections.abc import AsyncIterator
+from datetime import datetime
+
+from jira_client.aio.base import AsyncBaseAPI
+from jira_client.api.comments import _next_start, _page_comments, _page_params
+from jira_client.exceptions import JiraNotFoundError
+from jira_client.models.comment import Comment, CommentCreate, CommentUpdate
+
+
+class AsyncCommentsAPI(AsyncBaseAPI):
+    """Async API operations for Jira issue comments."""
+
+    async def get_all(
+        self, issue_key: str, since: datetime | None = None, page_size: int = 100
+    ) -> list[Comment]:
+        """Return all comments for an issue, oldest first, optionally only since ``since``."""
+        return [c async for c in self.iter_all(issue_key, since, page_size)]
+
+    async def iter_all(
+        self, issue_key: str, since: datetime | None = None, page_size: int = 100
+    ) -> AsyncIterator[Comment]:
+        """Yield the comments of an issue oldest first, fetching ``page_size`` at a time."""
+        start_at: int | None = 0
+        while start_at is not None:
+            data = await self._get(
+                f"issue/{issue_key}/comment", params=_page_params(start_at, page_size)
+            )
+            for comment in _page_comments(data, since):
+                yield comment
+            start_at = _next_start(data, start_at)
+
+    async def get_for_issues(
+        self, issue_keys: list[str], since: datetime | None = None
+    ) -> dict[str, list[Comment]]:
+        """Fetch the comment threads of many issues concurrently (see ``CommentsAPI``)."""
+        unique = list(dict.fromkeys(issue_keys))
+
+        async def fetch(key: str) -> list[Comment] | None:
+            try:
+                return await self.get_all(key, since)
+            except JiraNotFoundError:
+                return None
+
+        threads = await self._gather(fetch, unique)
+        return {key: thread for key, thread in zip(unique, threads) if thread is not None}
+
+    async def get(self, issue_key: str, comment_id: str) -> Comment:
+        """Return a single comment by ID."""
+        data = await self._get(f"issue/{issue_key}/comment/{comment_id}")
+        return Comment.from_dict(data)
+
+    async def add(self, issue_key: str, comment: CommentCreate) -> Comment:
+        """Add a new comment to an issue."""
+        response = await self._request(
+            "POST",
+            f"issue/{issue_key}/comment",
+            json=comment.to_payload(),
+        )
+        data = self._handle_response(response)
+        return Comment.from_dict(data)
+
+    async def update(self, issue_key: str, comment_id: str, update: CommentUpdate) -> Comment:
+        """Update the body of an existing comment."""
+        response = await self._request(
+            "PUT",
+            f"issue/{issue_key}/comment/{comment_id}",
+            json=update.to_payload(),
+        )
+        data = self._handle_response(response)
+        return Comment.from_dict(data)
+
+    async def delete(self, issue_key: str, comment_id: str) -> None:
+        """Delete a comment permanently."""
+        response = await self._request("DELETE", f"issue/{issue_key}/comment/{comment_id}")
+        self._handle_response(response)
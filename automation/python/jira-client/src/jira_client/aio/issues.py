@@ -0,0 +1,473 @@
+import asyncio
+import copy
+from collections.abc import AsyncIterator
+from datetime import date, datetime
+from typing import Any
+
+import aiohttp
+
+from jira_client.aio.base import AsyncBaseAPI
+from jira_client.aio.transport import AsyncTransport
+from jira_client.api.issues import (
+    _ISSUE_FIELDS,
+    _TRANSITION_FIELDS,
+    _UNRESOLVED,
+    _bulk_chunks,
+    _chunk_errors,
+    _closed_jql,
+    _cold_positions,
+    _created_ranges,
+    _find_transition,
+    _in_status,
+    _jql_datetime,
+    _key_batches,
+    _key_in_jql,
+    _link_payload,
+    _next_cursor,
+    _no_transition,
+    _normalized_keys,
+    _open_jql,
+    _parse_bulk_created,
+    _projection,
+    _search_params,
+    _split_order_by,
+    _transition_key,
+    _transition_result,
+)
+from jira_client.cache.issue_cache import IssueCache
+from jira_client.cache.ttl import TTLCache
+from jira_client.config import JiraConfig
+from jira_client.exceptions import JiraClientError, JiraValidationError
+from jira_client.models.issue import (
+    BulkCreateError,
+    BulkCreateResult,
+    BulkTransitionResult,
+    CreatedIssue,
+    Issue,
+    IssueBatchResult,
+    IssueCreate,
+    IssueSearchResult,
+    IssueUpdate,
+    TransitionOutcome,
+)
+
+
+class AsyncIssuesAPI(AsyncBaseAPI):
+    """Async API operations for Jira issues (same surface as ``IssuesAPI``)."""
+
+    def __init__(
+        self,
+        config: JiraConfig,
+        transport: AsyncTransport,
+        cache: IssueCache | None = None,
+    ) -> None:
+        super().__init__(config, transport)
+        self._cache = cache  # only kept consistent here; reads do not go through it
+        self._transitions = TTLCache(config.metadata_cache_size, config.metadata_cache_ttl)
+
+    # ------------------------------------------------------------------
+    # CRUD
+    # ------------------------------------------------------------------
+
+    async def create(self, issue: IssueCreate, hydrate: bool = True) -> Issue | CreatedIssue:
+        """Create a new issue and return the created issue (or a reference if not hydrated)."""
+        response = await self._request("POST", "issue", json=issue.to_payload())
+        self._invalidate()
+        data = self._handle_response(response)
+        if not hydrate:
+            return CreatedIssue.from_dict(data)
+        return await self.get(data["key"])
+
+    async def get(self, issue_key: str, fields: list[str] | None = None) -> Issue:
+        """Return a single issue by key (e.g. "PROJ-42"), partial if ``fields`` is given."""
+        fields = _projection(self._config, fields)
+        data = await self._get(
+            f"issue/{issue_key}",
+            params={"fields": ",".join(fields) if fields else _ISSUE_FIELDS},
+        )
+        return Issue.from_dict(data, fields)
+
+    async def get_many(self, keys: list[str], fields: list[str] | None = None) -> IssueBatchResult:
+        """Fetch many issues by key with concurrent ``key in (...)`` batches."""
+        inputs = _normalized_keys(keys)
+        unique = list(inputs)
+        found: dict[str, Issue] = {}
+        for batch in await self._gather(
+            lambda batch: self._fetch_existing(batch, fields), _key_batches(unique)
+        ):
+            found.update(batch)
+        return IssueBatchResult(
+            issues=[found[k] for k in unique if k in found],
+            missing=[inputs[k] for k in unique if k not in found],
+        )
+
+    async def update(self, issue_key: str, update: IssueUpdate) -> None:
+        """Update fields of an existing issue."""
+        await self.update_fields(issue_key, update.to_payload()["fields"])
+
+    async def update_fields(self, issue_key: str, fields: dict[str, Any]) -> None:
+        """Update an issue from raw Jira field values (field id → REST v3 value)."""
+        response = await self._request(
+            "PUT",
+            f"issue/{issue_key}",
+            json={"fields": fields},
+        )
+        self._invalidate(issue_key)
+        self._handle_response(response)
+
+    async def delete(self, issue_key: str, delete_subtasks: bool = False) -> None:
+        """Delete an issue. Set delete_subtasks=True to also remove child issues."""
+        response = await self._request(
+            "DELETE",
+            f"issue/{issue_key}",
+            params={"deleteSubtasks": str(delete_subtasks).lower()},
+        )
+        self._invalidate(issue_key)
+        self._handle_response(response)
+
+    # ------------------------------------------------------------------
+    # Search / filtering
+    # ------------------------------------------------------------------
+
+    async def search(
+        self,
+        jql: str,
+        max_results: int = 50,
+        start_at: int = 0,
+        fields: list[str] | None = None,
+        next_page_token: str | None = None,
+    ) -> IssueSearchResult:
+        """Search issues using a JQL query string."""
+        fields = _projection(self._config, fields)
+        data = await self._search_page(jql, max_results, start_at, fields, next_page_token)
+        return IssueSearchResult.from_dict(data, fields)
+
+    async def iter_search(
+        self,
+        jql: str,
+        page_size: int = 100,
+        fields: list[str] | None = None,
+        prefetch: bool = True,
+    ) -> AsyncIterator[Issue]:
+        """Yield every issue matching a JQL query, prefetching the next page."""
+        fields = _projection(self._config, fields)
+        async for page in self._iter_pages(jql, page_size, fields, prefetch):
+            for item in page.get("issues", []):
+                yield Issue.from_dict(item, fields)
+
+    async def search_parallel(
+        self,
+        jql: str,
+        page_size: int = 100,
+        fields: list[str] | None = None,
+    ) -> list[Issue]:
+        """Fetch every issue matching a JQL query using concurrent requests.
+
+        Same strategy as ``IssuesAPI.search_parallel``: ``startAt`` windows when the
+        server reports a total, ``created`` date ranges otherwise.
+        """
+        fields = _projection(self._config, fields)
+        first = await self._search_page(jql, page_size, 0, fields)
+        issues = [Issue.from_dict(i, fields) for i in first.get("issues", [])]
+        if _next_cursor(first, 0, page_size) is None:
+            return issues
+
+        if "total" in first:
+            step = first.get("maxResults") or page_size
+            pages = await self._gather(
+                lambda start: self._search_page(jql, step, start, fields),
+                range(len(issues), first["total"], step),
+            )
+            return issues + [Issue.from_dict(i, fields) for p in pages for i in p.get("issues", [])]
+
+        base, _ = _split_order_by(jql)
+
+        def _scoped(clause: str, order: str) -> str:
+            where = " AND ".join(f"({c})" for c in (base, clause) if c)
+            return f"{where} ORDER BY created {order}".strip()
+
+        async def _edge(order: str) -> datetime | None:
+            data = await self._search_page(_scoped("", order), 1, 0, ["created"])
+            issues = data.get("issues")
+            return _jql_datetime(issues[0]["fields"]["created"]) if issues else None
+
+        async def _walk(clause: str) -> list[Issue]:
+            return [
+                Issue.from_dict(i, fields)
+                async for page in self._iter_pages(_scoped(clause, "ASC"), page_size, fields)
+                for i in page.get("issues", [])
+            ]
+
+        oldest, newest = await asyncio.gather(_edge("ASC"), _edge("DESC"))
+        if oldest is None or newest is None:
+            return []  # the matching issues were deleted since the first page
+        chunks = await self._gather(_walk, _created_ranges(oldest, newest, 32))
+        return [issue for chunk in chunks for issue in chunk]
+
+    async def count(self, jql: str) -> int:
+        """Return the approximate number of issues matching ``jql`` without fetching any."""
+        data = await self._query("search/approximate-count", {"jql": _split_order_by(jql)[0]})
+        return int(data.get("count", 0))
+
+    async def count_many(self, jqls: list[str]) -> dict[str, int]:
+        """Count many JQL queries concurrently; return ``{jql: count}`` in input order."""
+        unique = list(dict.fromkeys(jqls))
+        return dict(zip(unique, await self._gather(self.count, unique)))
+
+    async def _search_page(
+        self,
+        jql: str,
+        max_results: int,
+        start_at: int = 0,
+        fields: list[str] | None = None,
+        next_page_token: str | None = None,
+    ) -> dict[str, Any]:
+        fields = _projection(self._config, fields)
+        params = _search_params(jql, max_results, start_at, fields, next_page_token)
+        return await self._get("search/jql", params=params)
+
+    async def _iter_pages(
+        self,
+        jql: str,
+        page_size: int,
+        fields: list[str] | None = None,
+        prefetch: bool = False,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Yield raw search pages, optionally fetching the next one as a background task."""
+        start_at, next_page_token = 0, None
+        pending: asyncio.Task[dict[str, Any]] | None = None
+        try:
+            data = await self._search_page(jql, page_size, start_at, fields)
+            while True:
+                cursor = _next_cursor(data, start_at, page_size)
+                if cursor is not None and prefetch:
+                    pending = asyncio.create_task(
+                        self._search_page(jql, page_size, cursor[0], fields, cursor[1])
+                    )
+                yield data
+                if cursor is None:
+                    return
+                start_at, next_page_token = cursor
+                if pending is not None:
+                    data, pending = await pending, None
+                else:
+                    data = await self._search_page(
+                        jql, page_size, start_at, fields, next_page_token
+                    )
+        finally:
+            if pending is not None:
+                pending.cancel()
+
+    async def get_open(
+        self,
+        project_key: str | None = None,
+        max_results: int = 50,
+        start_at: int = 0,
+    ) -> IssueSearchResult:
+        """Return open (not-done) issues, optionally filtered by project."""
+        jql = _open_jql(project_key or self._config.default_project)
+        return await self.search(jql, max_results=max_results, start_at=start_at)
+
+    async def get_closed(
+        self,
+        project_key: str | None = None,
+        date_from: date | None = None,
+        date_to: date | None = None,
+        max_results: int = 50,
+        start_at: int = 0,
+    ) -> IssueSearchResult:
+        """Return closed issues, optionally filtered by project and resolution date range."""
+        project = project_key or self._config.default_project
+        jql = _closed_jql(project, date_from, date_to)
+        return await self.search(jql, max_results=max_results, start_at=start_at)
+
+    # ------------------------------------------------------------------
+    # Transitions, assignee, watchers, links
+    # ------------------------------------------------------------------
+
+    async def get_transitions(self, issue_key: str) -> list[dict[str, Any]]:
+        """Return the available workflow transitions for an issue."""
+        data = await self._get(f"issue/{issue_key}/transitions")
+        return copy.deepcopy(data.get("transitions", []))
+
+    async def transition(self, issue_key: str, transition_id: str) -> None:
+        """Apply a workflow transition to change the issue status."""
+        response = await self._request(
+            "POST",
+            f"issue/{issue_key}/transitions",
+            json={"transition": {"id": transition_id}},
+        )
+        self._invalidate(issue_key)
+        self._handle_response(response)
+
+    async def bulk_transition(self, keys: list[str], target_status: str) -> BulkTransitionResult:
+        """Move many issues to the status named ``target_status``, concurrently.
+
+        Same lookup, caching and per-issue report as ``IssuesAPI.bulk_transition``;
+        the transport's concurrency cap bounds how many requests are in flight.
+        """
+        unique = list(dict.fromkeys(k.strip().upper() for k in keys))
+        batch = await self.get_many(unique, fields=_TRANSITION_FIELDS)
+        pending = [i for i in batch.issues if not _in_status(i, target_status)]
+
+        async def prime(issue: Issue) -> None:
+            try:
+                await self._resolve_transition(issue, target_status)
+            except JiraClientError:
+                pass  # reported by the issue's own attempt below
+
+        await self._gather(prime, _cold_positions(self._transitions, pending, target_status))
+        outcomes = await self._gather(
+            lambda issue: self._transition_to(issue, target_status), pending
+        )
+        return _transition_result(unique, batch, outcomes, target_status)
+
+    async def _resolve_transition(self, issue: Issue, target_status: str) -> str | None:
+        key = _transition_key(issue, target_status)
+        transition_id = self._transitions.get(key, _UNRESOLVED)
+        if transition_id is _UNRESOLVED:
+            transitions = await self.get_transitions(issue.key)
+            transition_id = _find_transition(transitions, target_status)
+            self._transitions.set(key, transition_id)
+        return transition_id
+
+    async def _transition_to(self, issue: Issue, target_status: str) -> TransitionOutcome:
+        try:
+            transition_id = await self._resolve_transition(issue, target_status)
+            if transition_id is None:
+                return _no_transition(issue, target_status)
+            try:
+                await self.transition(issue.key, transition_id)
+            except JiraValidationError:
+                own = _find_transition(await self.get_transitions(issue.key), target_status)
+                if own in (None, transition_id):
+                    raise
+                await self.transition(issue.key, own)
+        except JiraClientError as exc:
+            return TransitionOutcome(
+                issue.key, "failed", issue.status.name, str(exc), exc.status_code
+            )
+        return TransitionOutcome(issue.key, "transitioned", issue.status.name)
+
+    async def assign(self, issue_key: str, account_id: str | None) -> None:
+        """Assign an issue to a user. Pass None to unassign."""
+        response = await self._request(
+            "PUT",
+            f"issue/{issue_key}/assignee",
+            json={"accountId": account_id},
+        )
+        self._invalidate(issue_key)
+        self._handle_response(response)
+
+    async def get_watchers(self, issue_key: str) -> list[dict[str, Any]]:
+        """Return the list of watchers for an issue."""
+        data = await self._get(f"issue/{issue_key}/watchers")
+        return copy.deepcopy(data.get("watchers", []))
+
+    async def add_watcher(self, issue_key: str, account_id: str) -> None:
+        """Add a user as a watcher."""
+        response = await self._request(
+            "POST",
+            f"issue/{issue_key}/watchers",
+            json=account_id,
+        )
+        self._handle_response(response)
+
+    async def link(
+        self,
+        link_type: str,
+        inward_issue_key: str,
+        outward_issue_key: str,
+        comment: str | None = None,
+    ) -> None:
+        """Create an issue link between two issues."""
+        payload = _link_payload(link_type, inward_issue_key, outward_issue_key, comment)
+        response = await self._request("POST", "issueLink", json=payload)
+        self._handle_response(response)
+
+    # ------------------------------------------------------------------
+    # Bulk operations
+    # ------------------------------------------------------------------
+
+    async def bulk_create(
+        self, issues: list[IssueCreate], hydrate: bool = True
+    ) -> BulkCreateResult:
+        """Create many issues in concurrent chunks; see ``IssuesAPI.bulk_create``."""
+        outcomes = await self._gather(
+            lambda chunk: self._bulk_create_chunk(*chunk, hydrate=hydrate),
+            _bulk_chunks(issues),
+        )
+        result = BulkCreateResult()
+        for created, errors in outcomes:
+            result.issues.extend(created)
+            result.errors.extend(errors)
+        if hydrate:
+            result.unhydrated = [i.key for i in result.issues if isinstance(i, CreatedIssue)]
+        if result.issues:
+            self._invalidate()
+        return result
+
+    async def _bulk_create_chunk(
+        self, offset: int, chunk: list[IssueCreate], hydrate: bool
+    ) -> tuple[list[Issue | CreatedIssue], list[BulkCreateError]]:
+        payload = {"issueUpdates": [i.to_payload() for i in chunk]}
+        try:
+            response = await self._request("POST", "issue/bulk", json=payload)
+            if response.status_code == 400:
+                data = self._json(response)
+                if not data.get("errors"):
+                    self._handle_response(response)
+            else:
+                data = self._handle_response(response)
+        except (JiraClientError, aiohttp.ClientError, asyncio.TimeoutError) as exc:
+            return [], _chunk_errors(offset, len(chunk), exc)
+
+        refs, errors = _parse_bulk_created(data, offset)
+        if not hydrate or not refs:
+            return list(refs), errors
+        try:
+            hydrated = await self._fetch_by_keys([ref.key for ref in refs])
+        except (JiraClientError, aiohttp.ClientError, asyncio.TimeoutError):
+            hydrated = {}
+        # The search index lags new issues; a direct GET does not.
+        missing = [ref.key for ref in refs if ref.key not in hydrated]
+        fetched = await asyncio.gather(*map(self.get, missing), return_exceptions=True)
+        hydrated.update((key, i) for key, i in zip(missing, fetched) if isinstance(i, Issue))
+        return [hydrated.get(ref.key, ref) for ref in refs], errors
+
+    def _invalidate(self, issue_key: str | None = None) -> None:
+        """Drop what a write may have made stale from the issue cache.
+
+        That is the written issue, if any, and every cached search page, since any
+        write can change which issues a query matches.
+        """
+        if self._cache is not None:
+            if issue_key is not None:
+                self._cache.invalidate(issue_key.strip().upper())
+            self._cache.invalidate_queries()
+
+    async def _fetch_existing(
+        self, keys: list[str], fields: list[str] | None = None
+    ) -> dict[str, Issue]:
+        """Fetch a key batch, bisecting it to leave out keys that JQL rejects."""
+        try:
+            return await self._fetch_by_keys(keys, fields)
+        except JiraValidationError:
+            if len(keys) == 1:
+                return {}
+            middle = len(keys) // 2
+            left, right = await asyncio.gather(
+                self._fetch_existing(keys[:middle], fields),
+                self._fetch_existing(keys[middle:], fields),
+            )
+            return {**left, **right}
+
+    async def _fetch_by_keys(
+        self, keys: list[str], fields: list[str] | None = None
+    ) -> dict[str, Issue]:
+        fields = _projection(self._config, fields)
+        return {
+            item["key"]: Issue.from_dict(item, fields)
+            async for page in self._iter_pages(_key_in_jql(keys), len(keys), fields)
+            for item in page.get("issues", [])
+        }
@@ -0,0 +1,44 @@
+import copy
+from typing import Any
+
+from jira_client.aio.base import AsyncBaseAPI
+from jira_client.models.project import Project
+
+
+class AsyncProjectsAPI(AsyncBaseAPI):
+    """Async API operations for Jira projects."""
+
+    async def get_all(self) -> list[Project]:
+        """Return all accessible Jira projects."""
+        data = await self._get("project", params={"expand": "description,lead,category"})
+        return [Project.from_dict(p) for p in data]
+
+    async def get(self, project_key: str) -> Project:
+        """Return a single project by its key."""
+        data = await self._get(
+            f"project/{project_key}", params={"expand": "description,lead,category"}
+        )
+        return Project.from_dict(data)
+
+    async def get_issue_types(self, project_key: str) -> list[dict[str, Any]]:
+        """Return the issue types available in a project."""
+        project_id = await self._get_project_id(project_key)
+        data = await self._get("issuetype/project", params={"projectId": project_id})
+        if isinstance(data, list):
+            return copy.deepcopy(data)
+        # fallback: expand from project endpoint
+        data = await self._get(f"project/{project_key}", params={"expand": "issueTypes"})
+        return copy.deepcopy(data.get("issueTypes", []))
+
+    async def _get_project_id(self, project_key: str) -> str:
+        """Resolve a project key to its numeric ID."""
+        data = await self._get(f"project/{project_key}")
+        return data["id"]
+
+    async def get_components(self, project_key: str) -> list[dict[str, Any]]:
+        """Return all components defined in a project."""
+        return copy.deepcopy(await self._get(f"project/{project_key}/components"))
+
+    async def get_versions(self, project_key: str) -> list[dict[str, Any]]:
+        """Return all versions defined in a project."""
+        return copy.deepcopy(await self._get(f"project/{project_key}/versions"))
@@ -0,0 +1,173 @@
+"""Async counterpart of :mod:`jira_client.transport`, built on ``aiohttp``."""
+
+import asyncio
+from collections.abc import Callable, Mapping
+from typing import Any
+
+try:
+    import aiohttp
+except ImportError as exc:  # pragma: no cover - depends on the environment
+    raise ImportError(
+        "AsyncJiraClient requires aiohttp. Install it with: pip install 'jira-client[async]'"
+    ) from exc
+
+from jira_client.aio.coalesce import AsyncSingleFlight
+from jira_client.codec import STDLIB, JsonCodec, get_codec
+from jira_client.config import JiraConfig
+from jira_client.instrumentation import RequestEvent, RequestHook
+from jira_client.transport import (
+    IDEMPOTENT_METHODS,
+    RetryPolicy,
+    TokenBucket,
+    encode_body,
+    finish_event,
+    is_retryable,
+    observe_response,
+    start_event,
+)
+
+
+class AsyncResponse:
+    """A fully read HTTP response.
+
+    Mirrors the parts of ``requests.Response`` the API layer relies on
+    (``status_code``, ``headers``, ``content``, ``text``, ``json()``), so error
+    mapping is shared with the sync client.
+    """
+
+    __slots__ = ("status_code", "headers", "content")
+
+    def __init__(self, status_code: int, headers: Mapping[str, str], content: bytes) -> None:
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+
+    @property
+    def ok(self) -> bool:
+        return self.status_code < 400
+
+    @property
+    def text(self) -> str:
+        return self.content.decode("utf-8", errors="replace")
+
+    def json(self) -> Any:
+        return STDLIB.loads(self.content)
+
+
+class AsyncTransport:
+    """Sends requests through one pooled ``aiohttp.ClientSession`` with retries and pacing.
+
+    A semaphore caps the number of requests in flight; it is released while a
+    request waits for the bucket or sleeps before a retry. The session is created
+    lazily so that it is bound to the running event loop.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], aiohttp.ClientSession],
+        retry: RetryPolicy | None = None,
+        bucket: TokenBucket | None = None,
+        max_concurrency: int = 64,
+        codec: JsonCodec | None = None,
+        hooks: list[RequestHook] | None = None,
+        flight: AsyncSingleFlight | None = None,
+    ) -> None:
+        self._session_factory = session_factory
+        self._session: aiohttp.ClientSession | None = None
+        self.retry = retry or RetryPolicy()
+        self.bucket = bucket or TokenBucket()
+        self.codec = codec or get_codec()
+        self.hooks = list(hooks or [])
+        self.flight = flight
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+
+    @classmethod
+    def from_config(
+        cls,
+        session_factory: Callable[[], aiohttp.ClientSession],
+        config: JiraConfig,
+        max_concurrency: int,
+        codec: JsonCodec | None = None,
+        hooks: list[RequestHook] | None = None,
+    ) -> "AsyncTransport":
+        return cls(
+            session_factory,
+            RetryPolicy(config.max_retries, config.backoff_factor, config.max_backoff),
+            TokenBucket(config.rate_limit, config.rate_limit_burst),
+            max_concurrency,
+            codec or get_codec(config.json_backend),
+            hooks,
+            AsyncSingleFlight(config.coalesce_window) if config.coalesce_reads else None,
+        )
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            self._session = self._session_factory()
+        return self._session
+
+    async def close(self) -> None:
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        idempotent: bool | None = None,
+        path: str | None = None,
+        **kwargs: Any,
+    ) -> AsyncResponse:
+        """Send a request, retrying throttled and transient failures."""
+        method = method.upper()
+        if idempotent is None:
+            idempotent = method in IDEMPOTENT_METHODS
+        encode_body(self.codec, kwargs)
+        if not self.hooks:
+            return await self._send(method, url, idempotent, kwargs, None)
+
+        event = start_event(self.hooks, method, url, path, kwargs)
+        try:
+            response = await self._send(method, url, idempotent, kwargs, event)
+        except BaseException as exc:
+            finish_event(self.hooks, event, None, exc)
+            raise
+        finish_event(self.hooks, event, response, None)
+        return response
+
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        idempotent: bool,
+        kwargs: dict[str, Any],
+        event: RequestEvent | None,
+    ) -> AsyncResponse:
+        attempt = 0
+        while True:
+            wait = self.bucket.reserve()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            try:
+                async with self._semaphore:
+                    async with self.session.request(method, url, **kwargs) as raw:
+                        response = AsyncResponse(raw.status, raw.headers, await raw.read())
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                if not idempotent or attempt >= self.retry.max_retries:
+                    raise
+                await asyncio.sleep(self.retry.delay(attempt))
+                attempt += 1
+                if event is not None:
+                    event.retries = attempt
+                continue
+
+            retry_after = observe_response(self.bucket, response, self.retry.max_backoff)
+            if not is_retryable(response.status_code, idempotent) or not self.retry.should_retry(
+                attempt, retry_after
+            ):
+                return response
+            await asyncio.sleep(self.retry.delay(attempt, retry_after))
+            attempt += 1
+            if event is not None:
+                event.retries = attempt
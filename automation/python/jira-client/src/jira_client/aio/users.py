@@ -0,0 +1,77 @@
+from collections.abc import Iterable
+from typing import Any
+
+from jira_client.aio.base import AsyncBaseAPI
+from jira_client.aio.transport import AsyncTransport
+from jira_client.api.users import (
+    _LOOKUP_RESULTS,
+    _aliases,
+    _pick,
+    _query_key,
+    _recalled,
+    _remember,
+)
+from jira_client.cache.issue_cache import IssueCache
+from jira_client.cache.ttl import TTLCache
+from jira_client.config import JiraConfig
+from jira_client.models.user import User
+
+
+class AsyncUsersAPI(AsyncBaseAPI):
+    """Async user lookups (same surface as ``UsersAPI``).
+
+    Lookups are cached in process only; ``store`` (the client's SQLite cache) is
+    not read, but ``invalidate`` clears its stored lookups as ``UsersAPI`` does.
+    """
+
+    def __init__(
+        self, config: JiraConfig, transport: AsyncTransport, store: IssueCache | None = None
+    ) -> None:
+        super().__init__(config, transport)
+        self._lookups = TTLCache(config.user_cache_size, config.user_cache_ttl)
+        self._misses = TTLCache(config.user_cache_size, config.user_miss_ttl)
+        self._store = store
+
+    async def get(self, account_id: str) -> User:
+        """Return a user by account id."""
+        return User.from_dict(await self._get("user", params={"accountId": account_id}))
+
+    async def search(self, query: str, max_results: int = 50) -> list[User]:
+        """Return the users whose display name or email matches ``query`` (uncached)."""
+        params = {"query": query, "maxResults": max_results}
+        return [User.from_dict(u) for u in await self._get("user/search", params=params)]
+
+    async def find(self, query: str) -> User | None:
+        """Return the single user an email or display name refers to."""
+        return (await self.find_many([query]))[query]
+
+    async def find_many(self, queries: Iterable[str]) -> dict[str, User | None]:
+        """Map each email or display name to its user (None if none or several match)."""
+        keys = {query: _query_key(query) for query in queries}
+        found = _recalled(self._lookups, self._misses, set(keys.values()))
+        todo = [key for key in dict.fromkeys(keys.values()) if key not in found]
+        for key, user in zip(todo, await self._gather(self._lookup, todo)):
+            for alias, value in _aliases(key, user).items():
+                _remember(self._lookups, self._misses, alias, value)
+                found[alias] = value
+        return {
+            query: User.from_dict(u) if (u := found[key]) else None for query, key in keys.items()
+        }
+
+    async def resolve_many(self, queries: Iterable[str]) -> dict[str, str | None]:
+        """Map each email or display name to an account id (None if not resolvable)."""
+        users = await self.find_many(queries)
+        return {query: user.account_id if user else None for query, user in users.items()}
+
+    def invalidate(self) -> int:
+        """Forget every lookup result, also in the persistent store.
+
+        Returns how many in-process results were dropped.
+        """
+        if self._store is not None:
+            self._store.invalidate_users()
+        return self._lookups.invalidate() + self._misses.invalidate()
+
+    async def _lookup(self, key: str) -> dict[str, Any] | None:
+        params = {"query": key, "maxResults": _LOOKUP_RESULTS}
+        return _pick(key, await self._get("user/search", params=params))
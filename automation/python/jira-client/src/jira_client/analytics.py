@@ -0,0 +1,298 @@
+"""Columnar issue data for vectorized analytics (requires the optional ``numpy`` dependency).
+
+An :class:`IssueFrame` is built straight from raw search pages, without creating
+``Issue`` objects. Timestamps become ``datetime64[ms]`` arrays (UTC, ``NaT`` when
+missing). Status, issue type, priority, assignee and project become categorical
+columns: an ``int32`` code array plus a list of labels, with ``-1`` for missing
+values. Typical use::
+
+    frame = client.issues.search_frame("project = MYPROJ AND statusCategory = Done")
+    frame.resolution_time_stats()
+    frame.counts("assignee")
+    frame.created_vs_resolved("W")
+
+Install with ``pip install "jira-client[analytics]"`` (add ``pandas`` for
+:meth:`IssueFrame.to_pandas`).
+"""
+
+from array import array
+from collections.abc import Iterable
+from typing import Any
+
+try:
+    import numpy as np
+except ImportError as exc:  # pragma: no cover - depends on the environment
+    raise ImportError(
+        "IssueFrame requires numpy. Install it with: pip install 'jira-client[analytics]'"
+    ) from exc
+
+from jira_client.models.issue import _parse_datetime
+
+# Jira fields needed to build a frame; request only these to keep pages small.
+FRAME_FIELDS = [
+    "project",
+    "status",
+    "issuetype",
+    "priority",
+    "assignee",
+    "created",
+    "updated",
+    "resolutiondate",
+]
+
+DATETIME_COLUMNS = ("created", "updated", "resolved")
+CATEGORICAL_COLUMNS = (
+    "project",
+    "status",
+    "status_category",
+    "issue_type",
+    "priority",
+    "assignee",
+)
+
+_NAT = np.iinfo(np.int64).min  # the int64 representation of NaT
+_UNITS = {"s": 1_000, "m": 60_000, "h": 3_600_000, "d": 86_400_000}
+_MONDAY = 4  # 1970-01-05, the first Monday after the epoch, in days
+
+
+class IssueFrame:
+    """Column-oriented view of many issues.
+
+    ``keys`` is an object array of issue keys; datetime columns are available as
+    attributes (``frame.created``) and categorical ones through :meth:`codes`,
+    :meth:`categories` and :meth:`labels`.
+    """
+
+    def __init__(
+        self,
+        keys: np.ndarray,
+        datetimes: dict[str, np.ndarray],
+        codes: dict[str, np.ndarray],
+        categories: dict[str, list[str]],
+    ) -> None:
+        self.keys = keys
+        self._datetimes = datetimes
+        self._codes = codes
+        self._categories = categories
+
+    @classmethod
+    def from_pages(cls, pages: Iterable[dict[str, Any]]) -> "IssueFrame":
+        """Build a frame from raw ``search/jql`` response pages."""
+        builder = _FrameBuilder()
+        for page in pages:
+            builder.add(page.get("issues", []))
+        return builder.build()
+
+    @classmethod
+    def from_issues(cls, issues: Iterable[dict[str, Any]]) -> "IssueFrame":
+        """Build a frame from raw issue payloads (``{"key": ..., "fields": {...}}``)."""
+        builder = _FrameBuilder()
+        builder.add(issues)
+        return builder.build()
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def __repr__(self) -> str:
+        return f"IssueFrame({len(self)} issues)"
+
+    @property
+    def created(self) -> np.ndarray:
+        return self._datetimes["created"]
+
+    @property
+    def updated(self) -> np.ndarray:
+        return self._datetimes["updated"]
+
+    @property
+    def resolved(self) -> np.ndarray:
+        return self._datetimes["resolved"]
+
+    # ------------------------------------------------------------------
+    # Categorical columns
+    # ------------------------------------------------------------------
+
+    def codes(self, column: str) -> np.ndarray:
+        """Return the ``int32`` codes of a categorical column (-1 = missing)."""
+        return self._codes[column]
+
+    def categories(self, column: str) -> list[str]:
+        """Return the labels of a categorical column, indexed by code."""
+        return self._categories[column]
+
+    def labels(self, column: str) -> np.ndarray:
+        """Return a categorical column decoded to an object array of labels (None = missing)."""
+        lookup = np.array([*self._categories[column], None], dtype=object)
+        return lookup[self._codes[column]]  # code -1 picks the trailing None
+
+    def mask(self, column: str, *values: str) -> np.ndarray:
+        """Return a boolean mask of the issues whose ``column`` is one of ``values``."""
+        wanted = [i for i, label in enumerate(self._categories[column]) if label in values]
+        return np.isin(self._codes[column], wanted)
+
+    def where(self, mask: np.ndarray) -> "IssueFrame":
+        """Return the issues selected by a boolean mask (or index array) as a new frame."""
+        return IssueFrame(
+            self.keys[mask],
+            {name: col[mask] for name, col in self._datetimes.items()},
+            {name: col[mask] for name, col in self._codes.items()},
+            self._categories,
+        )
+
+    def counts(self, column: str, dropna: bool = True) -> dict[str | None, int]:
+        """Return issue counts per label of a categorical column, largest first."""
+        codes = self._codes[column]
+        tally = np.bincount(codes + 1, minlength=len(self._categories[column]) + 1)
+        result: dict[str | None, int] = {
+            label: int(n) for label, n in zip(self._categories[column], tally[1:]) if n
+        }
+        if not dropna and tally[0]:
+            result[None] = int(tally[0])
+        return dict(sorted(result.items(), key=lambda item: -item[1]))
+
+    # ------------------------------------------------------------------
+    # Time-based metrics
+    # ------------------------------------------------------------------
+
+    def resolution_times(self, unit: str = "h") -> np.ndarray:
+        """Return created → resolved durations (lead time) of resolved issues.
+
+        ``unit`` is one of ``"s"``, ``"m"``, ``"h"`` or ``"d"``.
+        """
+        resolved = ~np.isnat(self.resolved) & ~np.isnat(self.created)
+        elapsed = (self.resolved[resolved] - self.created[resolved]).astype(np.int64)
+        return elapsed / _UNITS[unit]
+
+    def resolution_time_stats(
+        self, unit: str = "h", percentiles: Iterable[float] = (50, 75, 90, 95)
+    ) -> dict[str, float]:
+        """Summarise the resolution-time distribution: count, mean, min, max and percentiles."""
+        times = self.resolution_times(unit)
+        if not len(times):
+            return {"count": 0}
+        percentiles = list(percentiles)
+        stats = {
+            "count": len(times),
+            "mean": float(times.mean()),
+            "min": float(times.min()),
+            "max": float(times.max()),
+        }
+        for p, value in zip(percentiles, np.percentile(times, percentiles)):
+            stats[f"p{p:g}"] = float(value)
+        return stats
+
+    def resolution_time_histogram(
+        self, bins: int | Iterable[float] = 20, unit: str = "d"
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Return ``(counts, bin_edges)`` of the resolution-time distribution."""
+        return np.histogram(self.resolution_times(unit), bins=bins)
+
+    def created_vs_resolved(self, freq: str = "W") -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Count created and resolved issues per period.
+
+        ``freq`` is ``"D"`` (days), ``"W"`` (weeks starting on Monday) or ``"M"``
+        (calendar months). Returns ``(periods, created_counts, resolved_counts)`` where
+        ``periods`` holds the start of each period, contiguous from the first to the
+        last event; the resolved counts are the throughput per period.
+        """
+        created = _periods(self.created, freq)
+        resolved = _periods(self.resolved, freq)
+        both = np.concatenate([created, resolved])
+        if not len(both):
+            return np.array([], dtype="datetime64[D]"), np.array([], int), np.array([], int)
+        first, last = both.min(), both.max()
+        size = last - first + 1
+        created_counts = np.bincount(created - first, minlength=size)
+        resolved_counts = np.bincount(resolved - first, minlength=size)
+        return _period_starts(np.arange(first, last + 1), freq), created_counts, resolved_counts
+
+    # ------------------------------------------------------------------
+    # Interop
+    # ------------------------------------------------------------------
+
+    def to_pandas(self) -> Any:
+        """Return a ``pandas.DataFrame`` with categorical and UTC datetime columns."""
+        try:
+            import pandas as pd
+        except ImportError as exc:
+            raise ImportError(
+                "IssueFrame.to_pandas requires pandas. Install it with: pip install pandas"
+            ) from exc
+        data: dict[str, Any] = {"key": self.keys}
+        for name in CATEGORICAL_COLUMNS:
+            data[name] = pd.Categorical.from_codes(
+                self._codes[name], categories=pd.Index(self._categories[name], dtype=object)
+            )
+        for name in DATETIME_COLUMNS:
+            data[name] = pd.to_datetime(self._datetimes[name]).tz_localize("UTC")
+        return pd.DataFrame(data)
+
+
+def _periods(values: np.ndarray, freq: str) -> np.ndarray:
+    """Map datetimes (NaT dropped) to integer period numbers."""
+    values = values[~np.isnat(values)]
+    if freq == "D":
+        return values.astype("datetime64[D]").astype(np.int64)
+    if freq == "W":
+        return (values.astype("datetime64[D]").astype(np.int64) - _MONDAY) // 7
+    if freq == "M":
+        return values.astype("datetime64[M]").astype(np.int64)
+    raise ValueError(f"Unsupported frequency {freq!r}; expected 'D', 'W' or 'M'")
+
+
+def _period_starts(periods: np.ndarray, freq: str) -> np.ndarray:
+    if freq == "W":
+        return (periods * 7 + _MONDAY).astype("datetime64[D]")
+    if freq == "M":
+        return periods.astype("datetime64[M]").astype("datetime64[D]")
+    return periods.astype("datetime64[D]")
+
+
+class _FrameBuilder:
+    """Accumulates issues into compact typed buffers, one page at a time."""
+
+    def __init__(self) -> None:
+        self._keys: list[str] = []
+        self._datetimes = {name: array("q") for name in DATETIME_COLUMNS}
+        self._codes = {name: array("i") for name in CATEGORICAL_COLUMNS}
+        self._lookup: dict[str, dict[str, int]] = {name: {} for name in CATEGORICAL_COLUMNS}
+
+    def add(self, issues: Iterable[dict[str, Any]]) -> None:
+        for issue in issues:
+            fields = issue.get("fields") or {}
+            status = fields.get("status") or {}
+            self._keys.append(issue["key"])
+            self._datetime("created", fields.get("created"))
+            self._datetime("updated", fields.get("updated"))
+            self._datetime("resolved", fields.get("resolutiondate"))
+            self._category("project", (fields.get("project") or {}).get("key"))
+            self._category("status", status.get("name"))
+            self._category("status_category", (status.get("statusCategory") or {}).get("key"))
+            self._category("issue_type", (fields.get("issuetype") or {}).get("name"))
+            self._category("priority", (fields.get("priority") or {}).get("name"))
+            self._category("assignee", (fields.get("assignee") or {}).get("displayName"))
+
+    def build(self) -> IssueFrame:
+        return IssueFrame(
+            np.array(self._keys, dtype=object),
+            {
+                name: np.frombuffer(buf, dtype=np.int64).astype("datetime64[ms]")
+                for name, buf in self._datetimes.items()
+            },
+            {name: np.frombuffer(buf, dtype=np.int32) for name, buf in self._codes.items()},
+            {name: list(lookup) for name, lookup in self._lookup.items()},
+        )
+
+    def _datetime(self, column: str, value: str | None) -> None:
+        when = _parse_datetime(value)
+        self._datetimes[column].append(_NAT if when is None else round(when.timestamp() * 1000))
+
+    def _category(self, column: str, label: str | None) -> None:
+        if label is None:
+            self._codes[column].append(-1)
+            return
+        lookup = self._lookup[column]
+        code = lookup.get(label)
+        if code is None:
+            code = lookup[label] = len(lookup)
+        self._codes[column].append(code)
@@ -1,5 +1,8 @@
+from jira_client.api.changelog import ChangelogAPI
 from jira_client.api.comments import CommentsAPI
 from jira_client.api.issues import IssuesAPI
 from jira_client.api.projects import ProjectsAPI
+from jira_client.api.upsert import UpsertAPI
+from jira_client.api.users import UsersAPI
 
-__all__ = ["ProjectsAPI", "IssuesAPI", "CommentsAPI"]
+__all__ = ["ProjectsAPI", "IssuesAPI", "CommentsAPI", "ChangelogAPI", "UsersAPI", "UpsertAPI"]
@@ -1,7 +1,11 @@
 from abc import ABC
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, NoReturn, TypeVar
 
 import requests
 
+from jira_client.coalesce import request_key
 from jira_client.config import JiraConfig
 from jira_client.exceptions import (
     JiraAuthError,
@@ -10,41 +14,128 @@ from jira_client.exceptions import (
     JiraRateLimitError,
     JiraValidationError,
 )
+from jira_client.transport import Transport, parse_retry_after
+
+T = TypeVar("T")
+R = TypeVar("R")
 
 
 class BaseAPI(ABC):
     """Abstract base class for all Jira API resource groups."""
 
-    def __init__(self, config: JiraConfig, session: requests.Session) -> None:
+    def __init__(
+        self,
+        config: JiraConfig,
+        session: requests.Session,
+        transport: Transport | None = None,
+    ) -> None:
         self._config = config
         self._session = session
+        self._transport = transport or Transport.from_config(session, config)
 
     def _url(self, path: str) -> str:
         return f"{self._config.base_url}/{path.lstrip('/')}"
 
+    def _request(self, method: str, path: str, **kwargs: Any) -> requests.Response:
+        """Send a request through the shared transport (retries, backoff, pacing)."""
+        if self._transport.flight is not None and not _is_read(method, kwargs):
+            self._transport.flight.forget()  # a write may change what reads return
+        return self._transport.request(method, self._url(path), path=path, **kwargs)
+
+    def _get(self, path: str, params: dict[str, Any] | None = None) -> Any:
+        """GET ``path`` and return the decoded body.
+
+        With read coalescing enabled, concurrent identical GETs share one request and
+        its decoded body, which callers must therefore not modify.
+        """
+
+        def fetch() -> Any:
+            return self._handle_response(self._request("GET", path, params=params))
+
+        flight = self._transport.flight
+        if flight is None:
+            return fetch()
+        return flight.do(request_key(path, params), fetch)
+
+    def _query(self, path: str, body: Any) -> Any:
+        """POST a read-only query and return the decoded body.
+
+        For endpoints that take their input as a JSON body but change nothing (e.g.
+        counts): retried like a GET on transient errors and coalesced like one.
+        """
+
+        def fetch() -> Any:
+            return self._handle_response(
+                self._request("POST", path, json=body, idempotent=True)
+            )
+
+        flight = self._transport.flight
+        if flight is None:
+            return fetch()
+        return flight.do(request_key(path, None, body), fetch)
+
+    def _map_concurrent(
+        self,
+        fn: Callable[[T], R],
+        items: Iterable[T],
+        max_workers: int | None = None,
+    ) -> list[R]:
+        """Apply ``fn`` to every item on a thread pool and return results in input order.
+
+        All workers share the client's session (and therefore its connection pool).
+        """
+        items = list(items)
+        workers = min(max_workers or self._config.max_workers, len(items))
+        if workers <= 1:
+            return [fn(item) for item in items]
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(fn, items))
+
+    def _json(self, response: requests.Response) -> Any:
+        """Decode a response body with the client's codec ({} when empty)."""
+        content = response.content
+        return self._transport.codec.loads(content) if content else {}
+
     def _handle_response(self, response: requests.Response) -> dict:
         if response.status_code == 204:
             return {}
         if response.ok:
-            return response.json() if response.content else {}
+            return self._json(response)
         self._raise_for_status(response)
         return {}  # unreachable, but satisfies type checkers
 
     def _raise_for_status(self, response: requests.Response) -> None:
-        status = response.status_code
-        try:
-            body = response.json()
-            errors = body.get("errorMessages", []) or list(body.get("errors", {}).values())
-            message = "; ".join(errors) if errors else response.text
-        except Exception:
-            message = response.text
-
-        if status in (401, 403):
-            raise JiraAuthError(f"Authentication failed ({status}): {message}", status)
-        if status == 404:
-            raise JiraNotFoundError(f"Not found: {message}", status)
-        if status == 400:
-            raise JiraValidationError(f"Bad request: {message}", status)
-        if status == 429:
-            raise JiraRateLimitError(f"Rate limit exceeded: {message}", status)
-        raise JiraClientError(f"Jira API error ({status}): {message}", status)
+        raise_for_status(response)
+
+
+def _is_read(method: str, kwargs: dict[str, Any]) -> bool:
+    """Whether a request only reads: a GET, or a POST explicitly marked idempotent."""
+    method = method.upper()
+    return method == "GET" or (method == "POST" and kwargs.get("idempotent") is True)
+
+
+def raise_for_status(response: Any) -> NoReturn:
+    """Raise the exception matching an error response.
+
+    Accepts any response object exposing ``status_code``, ``headers``, ``json()`` and
+    ``text`` (``requests.Response`` or ``AsyncResponse``), so sync and async clients
+    map errors alike.
+    """
+    status = response.status_code
+    try:
+        body = response.json()
+        errors = body.get("errorMessages", []) or list(body.get("errors", {}).values())
+        message = "; ".join(errors) if errors else response.text
+    except Exception:
+        message = response.text
+
+    if status in (401, 403):
+        raise JiraAuthError(f"Authentication failed ({status}): {message}", status)
+    if status == 404:
+        raise JiraNotFoundError(f"Not found: {message}", status)
+    if status == 400:
+        raise JiraValidationError(f"Bad request: {message}", status)
+    if status == 429:
+        retry_after = parse_retry_after(response.headers.get("Retry-After"))
+        raise JiraRateLimitError(f"Rate limit exceeded: {message}", status, retry_after)
+    raise JiraClientError(f"Jira API error ({status}): {message}", status)
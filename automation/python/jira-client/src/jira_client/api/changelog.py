@@ -0,0 +1,198 @@
+import math
+from collections.abc import Iterator
+from datetime import datetime, timezone
+from typing import Any
+
+import requests
+
+from jira_client.api.base import BaseAPI
+from jira_client.api.issues import IssuesAPI, _split_order_by
+from jira_client.config import JiraConfig
+from jira_client.models.changelog import FieldChange
+from jira_client.models.issue import _parse_datetime
+from jira_client.transport import Transport
+
+# POST changelog/bulkfetch accepts up to 1000 issues and 10 field ids per call.
+_BULK_ISSUE_LIMIT = 1000
+_BULK_FIELD_LIMIT = 10
+
+# Issues are looked up only to map the ids that bulkfetch returns back to keys.
+_ID_FIELDS = ["updated"]
+
+
+def _watermark(since: datetime | None) -> datetime | None:
+    if since is not None and since.tzinfo is None:
+        return since.astimezone()  # naive: local time
+    return since
+
+
+def _changes(
+    issue_key: str,
+    histories: list[dict[str, Any]],
+    fields: set[str] | None,
+    since: datetime | None,
+) -> list[FieldChange]:
+    """Flatten changelog entries into the changes to ``fields`` made after ``since``."""
+    changes: list[FieldChange] = []
+    for history in histories:
+        entry = FieldChange.from_history(issue_key, history)
+        if entry and since is not None and entry[0].created <= since:
+            continue
+        changes.extend(c for c in entry if fields is None or c.field in fields)
+    return changes
+
+
+def _delta_jql(jql: str, since: datetime | None) -> str:
+    """Restrict ``jql`` to issues updated since the watermark (with a minute of overlap)."""
+    clause = _split_order_by(jql)[0]
+    if since is None:
+        return clause
+    # Relative JQL dates avoid any dependence on the user's Jira time zone.
+    age = (datetime.now(timezone.utc) - since).total_seconds()
+    updated = f'updated >= "-{max(1, math.ceil(age / 60) + 1)}m"'
+    return f"({clause}) AND {updated}" if clause else updated
+
+
+def _bulk_body(issue_ids: list[str], fields: set[str] | None) -> dict[str, Any]:
+    body: dict[str, Any] = {"issueIdsOrKeys": issue_ids, "maxResults": _BULK_ISSUE_LIMIT}
+    if fields and len(fields) <= _BULK_FIELD_LIMIT:
+        body["fieldIds"] = sorted(fields)  # filtered server-side; else only client-side
+    return body
+
+
+def _page_size(first: dict[str, Any], page_size: int) -> int:
+    """The page size the server actually honours (it may cap ``maxResults``)."""
+    return min(page_size, first.get("maxResults") or page_size)
+
+
+def _reached(histories: list[dict[str, Any]], since: datetime) -> bool:
+    """Whether a page of histories (oldest first) starts at or before ``since``."""
+    return bool(histories) and _parse_datetime(histories[0]["created"]) <= since
+
+
+class ChangelogAPI(BaseAPI):
+    """Issue changelogs (field history), streamed as :class:`FieldChange` records.
+
+    Every method takes ``fields``, the field ids to keep (e.g. ``["status"]``; all
+    fields if None), and ``since``, a watermark: only changes made strictly after it
+    are returned (a naive datetime is taken as local time). Keep the latest
+    ``created`` seen and pass it back on the next run to process only the delta.
+    """
+
+    def __init__(
+        self,
+        config: JiraConfig,
+        session: requests.Session,
+        transport: Transport | None = None,
+        issues: IssuesAPI | None = None,
+    ) -> None:
+        super().__init__(config, session, transport)
+        self._issues = issues or IssuesAPI(config, session, self._transport)
+
+    def iter_issue(
+        self,
+        issue_key: str,
+        fields: list[str] | None = None,
+        since: datetime | None = None,
+        page_size: int = 100,
+    ) -> Iterator[FieldChange]:
+        """Yield the changes of one issue, oldest first, from its paged changelog.
+
+        With ``since``, pages are read from the newest end backwards until one reaches
+        the watermark, so a long history costs one request plus the pages holding new
+        changes.
+        """
+        wanted = set(fields) if fields is not None else None
+        since = _watermark(since)
+        for histories in self._history_pages(f"issue/{issue_key}/changelog", page_size, since):
+            yield from _changes(issue_key, histories, wanted, since)
+
+    def iter_issues(
+        self,
+        issue_keys: list[str],
+        fields: list[str] | None = None,
+        since: datetime | None = None,
+    ) -> Iterator[FieldChange]:
+        """Yield the changes of many issues through ``changelog/bulkfetch``.
+
+        Up to 1000 issues are fetched per request; keys that do not exist or are not
+        visible are skipped. Changes come grouped by issue, each issue oldest first.
+        """
+        keys = list(dict.fromkeys(k.strip().upper() for k in issue_keys))
+        wanted = set(fields) if fields is not None else None
+        since = _watermark(since)
+        for offset in range(0, len(keys), _BULK_ISSUE_LIMIT):
+            found = self._issues.get_many(keys[offset : offset + _BULK_ISSUE_LIMIT], _ID_FIELDS)
+            yield from self._bulk({i.id: i.key for i in found.issues}, wanted, since)
+
+    def iter_search(
+        self,
+        jql: str,
+        fields: list[str] | None = None,
+        since: datetime | None = None,
+        page_size: int = 100,
+    ) -> Iterator[FieldChange]:
+        """Yield the changes of every issue matching ``jql`` (see ``iter_issues``).
+
+        With ``since``, only issues updated since the watermark are searched, so a
+        daily run reads the changelogs of what changed that day and nothing else.
+        """
+        wanted = set(fields) if fields is not None else None
+        since = _watermark(since)
+        ids: dict[str, str] = {}
+        for issue in self._issues.iter_search(_delta_jql(jql, since), page_size, _ID_FIELDS):
+            ids[issue.id] = issue.key
+            if len(ids) == _BULK_ISSUE_LIMIT:
+                yield from self._bulk(ids, wanted, since)
+                ids = {}
+        if ids:
+            yield from self._bulk(ids, wanted, since)
+
+    def _bulk(
+        self, keys_by_id: dict[str, str], fields: set[str] | None, since: datetime | None
+    ) -> Iterator[FieldChange]:
+        """Page through ``changelog/bulkfetch`` for up to 1000 issues (id -> key)."""
+        body = _bulk_body(list(keys_by_id), fields)
+        while True:
+            data = self._query("changelog/bulkfetch", body)
+            for log in data.get("issueChangeLogs", []):
+                key = keys_by_id.get(log.get("issueId", ""), log.get("issueId", ""))
+                yield from _changes(key, log.get("changeHistories", []), fields, since)
+            if not (token := data.get("nextPageToken")):
+                return
+            body = {**body, "nextPageToken": token}
+
+    def _history_pages(
+        self, path: str, page_size: int, since: datetime | None
+    ) -> Iterator[list[dict[str, Any]]]:
+        """Yield pages of an issue's changelog histories in chronological order."""
+        first = self._get(path, params={"startAt": 0, "maxResults": page_size})
+        head = first.get("values", [])
+        total = first.get("total", len(head))
+        size = _page_size(first, page_size)
+        if since is None or len(head) >= total:
+            yield head
+            start = len(head)
+            while head and start < total:
+                data = self._get(path, params={"startAt": start, "maxResults": size})
+                head = data.get("values", [])
+                yield head
+                start += len(head)
+            return
+
+        # Walk back from the newest page until one reaches the watermark.
+        tail: list[list[dict[str, Any]]] = []
+        end = total
+        while end > len(head):
+            start = max(len(head), end - size)
+            data = self._get(path, params={"startAt": start, "maxResults": end - start})
+            values = data.get("values", [])
+            if not values:
+                break
+            tail.append(values)
+            end = start
+            if _reached(values, since):
+                break
+        else:
+            tail.append(head)
+        yield from reversed(tail)
@@ -1,35 +1,100 @@
+from collections.abc import Iterator
+from datetime import datetime
+from typing import Any
+
 import requests
 
 from jira_client.api.base import BaseAPI
 from jira_client.config import JiraConfig
+from jira_client.exceptions import JiraNotFoundError
 from jira_client.models.comment import Comment, CommentCreate, CommentUpdate
+from jira_client.transport import Transport
+
+
+def _page_params(start_at: int, page_size: int) -> dict[str, Any]:
+    return {"orderBy": "created", "startAt": start_at, "maxResults": page_size}
+
+
+def _page_comments(data: dict[str, Any], since: datetime | None) -> list[Comment]:
+    """Parse one page of comments, keeping those created or edited at/after ``since``."""
+    comments = [Comment.from_dict(c) for c in data.get("comments", [])]
+    if since is None:
+        return comments
+    if since.tzinfo is None:
+        since = since.astimezone()  # naive: local time
+    return [c for c in comments if c.updated >= since]
+
+
+def _next_start(data: dict[str, Any], start_at: int) -> int | None:
+    """Return the ``startAt`` of the following page, or None after the last one."""
+    start_at += len(data.get("comments", []))
+    return start_at if data.get("comments") and start_at < data.get("total", 0) else None
 
 
 class CommentsAPI(BaseAPI):
     """API operations for Jira issue comments."""
 
-    def __init__(self, config: JiraConfig, session: requests.Session) -> None:
-        super().__init__(config, session)
+    def __init__(
+        self,
+        config: JiraConfig,
+        session: requests.Session,
+        transport: Transport | None = None,
+    ) -> None:
+        super().__init__(config, session, transport)
 
-    def get_all(self, issue_key: str) -> list[Comment]:
-        """Return all comments for an issue, ordered oldest first."""
-        response = self._session.get(
-            self._url(f"issue/{issue_key}/comment"),
-            params={"orderBy": "created"},
-        )
-        data = self._handle_response(response)
-        return [Comment.from_dict(c) for c in data.get("comments", [])]
+    def get_all(
+        self, issue_key: str, since: datetime | None = None, page_size: int = 100
+    ) -> list[Comment]:
+        """Return all comments for an issue, ordered oldest first.
+
+        With ``since``, only comments created or edited at or after that time are
+        returned (a naive datetime is taken as local time).
+        """
+        return list(self.iter_all(issue_key, since, page_size))
+
+    def iter_all(
+        self, issue_key: str, since: datetime | None = None, page_size: int = 100
+    ) -> Iterator[Comment]:
+        """Yield the comments of an issue oldest first, fetching ``page_size`` at a time."""
+        start_at: int | None = 0
+        while start_at is not None:
+            data = self._get(f"issue/{issue_key}/comment", params=_page_params(start_at, page_size))
+            yield from _page_comments(data, since)
+            start_at = _next_start(data, start_at)
+
+    def get_for_issues(
+        self,
+        issue_keys: list[str],
+        since: datetime | None = None,
+        max_workers: int | None = None,
+    ) -> dict[str, list[Comment]]:
+        """Fetch the comment threads of many issues concurrently.
+
+        Returns ``{key: comments}`` in input order (duplicates removed), each thread
+        oldest first and filtered by ``since`` as in ``get_all``. Issues that do not
+        exist or are not visible are left out; any other error is raised.
+        """
+        unique = list(dict.fromkeys(issue_keys))
+
+        def fetch(key: str) -> list[Comment] | None:
+            try:
+                return self.get_all(key, since)
+            except JiraNotFoundError:
+                return None
+
+        threads = self._map_concurrent(fetch, unique, max_workers)
+        return {key: thread for key, thread in zip(unique, threads) if thread is not None}
 
     def get(self, issue_key: str, comment_id: str) -> Comment:
         """Return a single comment by ID."""
-        response = self._session.get(self._url(f"issue/{issue_key}/comment/{comment_id}"))
-        data = self._handle_response(response)
+        data = self._get(f"issue/{issue_key}/comment/{comment_id}")
         return Comment.from_dict(data)
 
     def add(self, issue_key: str, comment: CommentCreate) -> Comment:
         """Add a new comment to an issue."""
-        response = self._session.post(
-            self._url(f"issue/{issue_key}/comment"),
+        response = self._request(
+            "POST",
+            f"issue/{issue_key}/comment",
             json=comment.to_payload(),
         )
         data = self._handle_response(response)
@@ -37,8 +102,9 @@ class CommentsAPI(BaseAPI):
 
     def update(self, issue_key: str, comment_id: str, update: CommentUpdate) -> Comment:
         """Update the body of an existing comment."""
-        response = self._session.put(
-            self._url(f"issue/{issue_key}/comment/{comment_id}"),
+        response = self._request(
+            "PUT",
+            f"issue/{issue_key}/comment/{comment_id}",
             json=update.to_payload(),
         )
         data = self._handle_response(response)
@@ -46,7 +112,5 @@ class CommentsAPI(BaseAPI):
 
     def delete(self, issue_key: str, comment_id: str) -> None:
         """Delete a comment permanently."""
-        response = self._session.delete(
-            self._url(f"issue/{issue_key}/comment/{comment_id}")
-        )
+        response = self._request("DELETE", f"issue/{issue_key}/comment/{comment_id}")
         self._handle_response(response)
@@ -1,57 +1,395 @@
-from datetime import date
-from typing import Any
+import copy
+import json
+import math
+import re
+import time
+from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import date, datetime
+from typing import TYPE_CHECKING, Any
 
 import requests
 
 from jira_client.api.base import BaseAPI
+from jira_client.cache.issue_cache import IssueCache
+from jira_client.cache.ttl import TTLCache
 from jira_client.config import JiraConfig
-from jira_client.models.issue import Issue, IssueCreate, IssueSearchResult, IssueUpdate
+from jira_client.exceptions import JiraClientError, JiraValidationError
+from jira_client.models.issue import (
+    BulkCreateError,
+    BulkCreateResult,
+    BulkTransitionResult,
+    CreatedIssue,
+    Issue,
+    IssueBatchResult,
+    IssueCreate,
+    IssueSearchResult,
+    IssueUpdate,
+    TransitionOutcome,
+)
+from jira_client.transport import Transport
+from jira_client.utils import text_to_adf
+
+if TYPE_CHECKING:
+    from jira_client.analytics import IssueFrame
 
 _ISSUE_FIELDS = (
     "summary,description,issuetype,status,priority,"
     "assignee,reporter,labels,components,project,created,updated,resolutiondate"
 )
 
+# Jira Cloud accepts at most 50 issues per POST /issue/bulk call.
+_BULK_CREATE_LIMIT = 50
+
+# Key batches for "key in (...)" lookups: one search page per batch, and a JQL
+# string short enough to keep the GET URL well under common proxy limits.
+_KEY_BATCH_SIZE = 100
+_KEY_BATCH_JQL_CHARS = 4000
+
+# Fields a bulk transition needs to pick a transition: its workflow position.
+_TRANSITION_FIELDS = ["project", "issuetype", "status"]
+_UNRESOLVED = object()
+
+# A quoted string (skipped, group 1) or an ORDER BY keyword starting the query or a word.
+_ORDER_BY_RE = re.compile(
+    r"""("(?:[^"\\]|\\.)*"|'(?:[^'\\]|\\.)*')|(?:^|(?<=[\s)]))ORDER\s+BY\b""",
+    re.IGNORECASE,
+)
+
+
+def _next_cursor(
+    data: dict[str, Any], start_at: int, page_size: int
+) -> tuple[int, str | None] | None:
+    """Return the (startAt, nextPageToken) of the page after ``data``, or None if last.
+
+    ``search/jql`` paginates with ``nextPageToken``/``isLast``; offset-based responses
+    carry ``total`` instead. Both shapes are supported.
+    """
+    count = len(data.get("issues", []))
+    if not count or data.get("isLast"):
+        return None
+    if token := data.get("nextPageToken"):
+        return start_at + count, token
+    if "total" in data:
+        return (start_at + count, None) if start_at + count < data["total"] else None
+    if "isLast" in data or count < page_size:
+        return None
+    return start_at + count, None
+
+
+def _split_order_by(jql: str) -> tuple[str, str]:
+    """Split a JQL query into its filter clause and its ORDER BY clause (either may be empty).
+
+    ``ORDER BY`` inside a quoted string is not a clause.
+    """
+    for match in _ORDER_BY_RE.finditer(jql):
+        if match.group(1) is None:
+            return jql[: match.start()].strip(), jql[match.start() :].strip()
+    return jql.strip(), ""
+
+
+def _jql_datetime(value: str) -> datetime:
+    """Parse a Jira timestamp keeping its wall-clock time, as JQL date literals expect."""
+    return datetime.fromisoformat(value[:19])
+
+
+def _created_ranges(oldest: datetime, newest: datetime, slices: int) -> list[str]:
+    """Return JQL clauses that partition ``created`` into contiguous minute-aligned ranges.
+
+    The first range is open below and the last open above, so every issue lands in
+    exactly one range whatever its timestamp.
+    """
+    span = newest - oldest
+    bounds = list(
+        dict.fromkeys(
+            (oldest + span * i / slices).strftime('"%Y/%m/%d %H:%M"') for i in range(1, slices)
+        )
+    )
+    clauses = []
+    for i in range(len(bounds) + 1):
+        parts = []
+        if i > 0:
+            parts.append(f"created >= {bounds[i - 1]}")
+        if i < len(bounds):
+            parts.append(f"created < {bounds[i]}")
+        clauses.append(" AND ".join(parts))
+    return clauses
+
+
+def _projection(config: JiraConfig, fields: list[str] | None) -> list[str] | None:
+    """Return the fields to request: ``fields`` if given, else the client default.
+
+    None means the full ``_ISSUE_FIELDS`` set.
+    """
+    return config.issue_fields if fields is None else fields
+
+
+def _search_params(
+    jql: str,
+    max_results: int,
+    start_at: int = 0,
+    fields: list[str] | None = None,
+    next_page_token: str | None = None,
+) -> dict[str, Any]:
+    """Build the query parameters for one ``search/jql`` page."""
+    params: dict[str, Any] = {
+        "jql": jql,
+        "maxResults": max_results,
+        "startAt": start_at,
+        "fields": ",".join(fields or _ISSUE_FIELDS.split(",")),
+    }
+    if next_page_token:
+        params["nextPageToken"] = next_page_token
+    return params
+
+
+def _open_jql(project: str | None) -> str:
+    conditions = ["statusCategory != Done"]
+    if project:
+        conditions.insert(0, f'project = "{project}"')
+    return " AND ".join(conditions) + " ORDER BY created DESC"
+
+
+def _closed_jql(project: str | None, date_from: date | None, date_to: date | None) -> str:
+    conditions = ["statusCategory = Done"]
+    if project:
+        conditions.insert(0, f'project = "{project}"')
+    if date_from:
+        conditions.append(f'resolutiondate >= "{date_from.isoformat()}"')
+    if date_to:
+        conditions.append(f'resolutiondate <= "{date_to.isoformat()}"')
+    return " AND ".join(conditions) + " ORDER BY resolutiondate DESC"
+
+
+def _link_payload(
+    link_type: str, inward_issue_key: str, outward_issue_key: str, comment: str | None
+) -> dict[str, Any]:
+    payload: dict[str, Any] = {
+        "type": {"name": link_type},
+        "inwardIssue": {"key": inward_issue_key},
+        "outwardIssue": {"key": outward_issue_key},
+    }
+    if comment:
+        payload["comment"] = {"body": text_to_adf(comment)}
+    return payload
+
+
+def _bulk_chunks(issues: list[IssueCreate]) -> list[tuple[int, list[IssueCreate]]]:
+    """Split bulk-create input into (offset, chunk) pairs sized to the per-call limit."""
+    return [
+        (offset, issues[offset : offset + _BULK_CREATE_LIMIT])
+        for offset in range(0, len(issues), _BULK_CREATE_LIMIT)
+    ]
+
+
+def _parse_bulk_created(
+    data: dict[str, Any], offset: int
+) -> tuple[list[CreatedIssue], list[BulkCreateError]]:
+    """Extract created references and per-item errors from an ``issue/bulk`` response."""
+    refs = [CreatedIssue.from_dict(item) for item in data.get("issues", [])]
+    errors = [BulkCreateError.from_dict(e, offset) for e in data.get("errors", [])]
+    return refs, errors
+
+
+def _chunk_errors(offset: int, size: int, exc: Exception) -> list[BulkCreateError]:
+    """Report every item of a bulk-create chunk whose request failed as a whole."""
+    status = exc.status_code if isinstance(exc, JiraClientError) else None
+    return [BulkCreateError(offset + i, status, str(exc)) for i in range(size)]
+
+
+def _jql_string(value: str) -> str:
+    """Quote a value as a JQL string literal."""
+    return '"' + value.replace("\\", "\\\\").replace('"', '\\"') + '"'
+
+
+def _key_in_jql(keys: list[str]) -> str:
+    return f"key in ({', '.join(map(_jql_string, keys))})"
+
+
+def _normalized_keys(keys: list[str]) -> dict[str, str]:
+    """Map each distinct normalized key to the first input spelling of it."""
+    inputs: dict[str, str] = {}
+    for key in keys:
+        inputs.setdefault(key.strip().upper(), key)
+    return inputs
+
+
+def _key_batches(keys: list[str]) -> list[list[str]]:
+    """Group issue keys into batches bounded by count and by JQL length."""
+    batches: list[list[str]] = []
+    current: list[str] = []
+    length = 0
+    for key in keys:
+        if current and (
+            len(current) >= _KEY_BATCH_SIZE or length + len(key) + 4 > _KEY_BATCH_JQL_CHARS
+        ):
+            batches.append(current)
+            current, length = [], 0
+        current.append(key)
+        length += len(key) + 4  # quotes and separator
+    if current:
+        batches.append(current)
+    return batches
+
+
+def _in_status(issue: Issue, status_name: str) -> bool:
+    return issue.status.name.casefold() == status_name.casefold()
+
+
+def _transition_key(issue: Issue, target_status: str) -> tuple[str, str, str, str]:
+    """Cache key of a transition lookup: the available transitions depend on the
+    workflow, i.e. on project and issue type, and on the current status."""
+    return (issue.project_key, issue.issue_type.id, issue.status.id, target_status.casefold())
+
+
+def _find_transition(transitions: list[dict[str, Any]], target_status: str) -> str | None:
+    """Return the id of the transition leading to ``target_status``, if one is offered."""
+    target = target_status.casefold()
+    for transition in transitions:
+        if (transition.get("to") or {}).get("name", "").casefold() == target:
+            return transition["id"]
+    return None
+
+
+def _cold_positions(cache: TTLCache, issues: list[Issue], target_status: str) -> list[Issue]:
+    """Return one issue per workflow position whose transition is not cached yet."""
+    cold: dict[tuple[str, str, str, str], Issue] = {}
+    for issue in issues:
+        key = _transition_key(issue, target_status)
+        if key not in cold and cache.get(key, _UNRESOLVED) is _UNRESOLVED:
+            cold[key] = issue
+    return list(cold.values())
+
+
+def _no_transition(issue: Issue, target_status: str) -> TransitionOutcome:
+    return TransitionOutcome(
+        issue.key,
+        "failed",
+        issue.status.name,
+        f"No transition to '{target_status}' from '{issue.status.name}'",
+    )
+
+
+def _transition_result(
+    keys: list[str],
+    batch: IssueBatchResult,
+    outcomes: list[TransitionOutcome],
+    target_status: str,
+) -> BulkTransitionResult:
+    """Merge attempted, skipped and missing issues into one report in ``keys`` order."""
+    by_key = {o.key: o for o in outcomes}
+    for issue in batch.issues:
+        if _in_status(issue, target_status):
+            by_key[issue.key] = TransitionOutcome(issue.key, "skipped", issue.status.name)
+    for key in batch.missing:
+        by_key[key] = TransitionOutcome(
+            key, "failed", message="Issue does not exist or is not visible", status_code=404
+        )
+    return BulkTransitionResult([by_key[key] for key in keys])
+
 
 class IssuesAPI(BaseAPI):
     """API operations for Jira issues."""
 
-    def __init__(self, config: JiraConfig, session: requests.Session) -> None:
-        super().__init__(config, session)
+    def __init__(
+        self,
+        config: JiraConfig,
+        session: requests.Session,
+        transport: Transport | None = None,
+        cache: IssueCache | None = None,
+    ) -> None:
+        super().__init__(config, session, transport)
+        self._cache = cache
+        self._transitions = TTLCache(config.metadata_cache_size, config.metadata_cache_ttl)
 
     # ------------------------------------------------------------------
     # CRUD
     # ------------------------------------------------------------------
 
-    def create(self, issue: IssueCreate) -> Issue:
-        """Create a new issue and return the created issue."""
-        response = self._session.post(self._url("issue"), json=issue.to_payload())
+    def create(self, issue: IssueCreate, hydrate: bool = True) -> Issue | CreatedIssue:
+        """Create a new issue and return the created issue.
+
+        With ``hydrate=False`` the follow-up GET is skipped and a ``CreatedIssue``
+        reference (id/key/self) is returned instead.
+        """
+        response = self._request("POST", "issue", json=issue.to_payload())
+        self._invalidate()
         data = self._handle_response(response)
+        if not hydrate:
+            return CreatedIssue.from_dict(data)
         return self.get(data["key"])
 
-    def get(self, issue_key: str) -> Issue:
-        """Return a single issue by key (e.g. "PROJ-42")."""
-        response = self._session.get(
-            self._url(f"issue/{issue_key}"),
-            params={"fields": _ISSUE_FIELDS},
+    def get(self, issue_key: str, fields: list[str] | None = None) -> Issue:
+        """Return a single issue by key (e.g. "PROJ-42").
+
+        Pass ``fields`` to fetch a partial issue. Full reads go through the issue
+        cache when one is configured.
+        """
+        fields = _projection(self._config, fields)
+        use_cache = self._cache is not None and fields is None
+        if use_cache and (cached := self._cache.get(issue_key.strip().upper())):
+            return Issue.from_dict(cached)
+        data = self._get(
+            f"issue/{issue_key}",
+            params={"fields": ",".join(fields) if fields else _ISSUE_FIELDS},
+        )
+        if use_cache:
+            self._cache.put_many([data])
+        return Issue.from_dict(data, fields)
+
+    def get_many(
+        self,
+        keys: list[str],
+        fields: list[str] | None = None,
+        max_workers: int | None = None,
+    ) -> IssueBatchResult:
+        """Fetch many issues by key with batched ``key in (...)`` searches.
+
+        Batches run concurrently; issues come back in input order (duplicates removed)
+        and keys that do not exist or are not visible are listed in ``missing``, as
+        they were passed in.
+        """
+        inputs = _normalized_keys(keys)
+        unique = list(inputs)
+        fields = _projection(self._config, fields)
+        found: dict[str, Issue] = {}
+        use_cache = self._cache is not None and fields is None
+        if use_cache:
+            found = {k: Issue.from_dict(v) for k, v in self._cache.get_many(unique).items()}
+        to_fetch = [k for k in unique if k not in found]
+        for batch in self._map_concurrent(
+            lambda batch: self._fetch_existing(batch, fields),
+            _key_batches(to_fetch),
+            max_workers,
+        ):
+            found.update(batch)
+        return IssueBatchResult(
+            issues=[found[k] for k in unique if k in found],
+            missing=[inputs[k] for k in unique if k not in found],
         )
-        data = self._handle_response(response)
-        return Issue.from_dict(data)
 
     def update(self, issue_key: str, update: IssueUpdate) -> None:
         """Update fields of an existing issue."""
-        response = self._session.put(
-            self._url(f"issue/{issue_key}"),
-            json=update.to_payload(),
+        self.update_fields(issue_key, update.to_payload()["fields"])
+
+    def update_fields(self, issue_key: str, fields: dict[str, Any]) -> None:
+        """Update an issue from raw Jira field values (field id → REST v3 value)."""
+        response = self._request(
+            "PUT",
+            f"issue/{issue_key}",
+            json={"fields": fields},
         )
+        self._invalidate(issue_key)
         self._handle_response(response)
 
     def delete(self, issue_key: str, delete_subtasks: bool = False) -> None:
         """Delete an issue. Set delete_subtasks=True to also remove child issues."""
-        response = self._session.delete(
-            self._url(f"issue/{issue_key}"),
+        response = self._request(
+            "DELETE",
+            f"issue/{issue_key}",
             params={"deleteSubtasks": str(delete_subtasks).lower()},
         )
+        self._invalidate(issue_key)
         self._handle_response(response)
 
     # ------------------------------------------------------------------
@@ -64,20 +402,211 @@ class IssuesAPI(BaseAPI):
         max_results: int = 50,
         start_at: int = 0,
         fields: list[str] | None = None,
+        next_page_token: str | None = None,
     ) -> IssueSearchResult:
-        """Search issues using a JQL query string."""
-        response = self._session.get(
-            self._url("search/jql"),
-            params={
-                "jql": jql,
-                "maxResults": max_results,
-                "startAt": start_at,
-                "fields": ",".join(fields or _ISSUE_FIELDS.split(",")),
-            },
-        )
-        data = self._handle_response(response)
+        """Search issues using a JQL query string.
+
+        Pass the ``next_page_token`` of a previous result to fetch the following page.
+        With an issue cache configured, identical searches (default fields) are served
+        from the cache while fresh, and returned issues are written to it.
+        """
+        fields = _projection(self._config, fields)
+        if self._cache is None or fields is not None:
+            data = self._search_page(jql, max_results, start_at, fields, next_page_token)
+            return IssueSearchResult.from_dict(data, fields)
+
+        query = json.dumps([jql, max_results, start_at, next_page_token])
+        data = self._cache.get_query(query)
+        if data is None:
+            data = self._search_page(jql, max_results, start_at, None, next_page_token)
+            self._cache.put_many(data.get("issues", []))
+            self._cache.put_query(query, data)
         return IssueSearchResult.from_dict(data)
 
+    def iter_search(
+        self,
+        jql: str,
+        page_size: int = 100,
+        fields: list[str] | None = None,
+        prefetch: bool = True,
+    ) -> Iterator[Issue]:
+        """Yield every issue matching a JQL query, following pagination transparently.
+
+        With ``prefetch`` enabled, page N+1 is requested in the background while the
+        caller consumes page N, so at most two pages are held in memory at any time.
+        """
+        fields = _projection(self._config, fields)
+        for page in self._iter_pages(jql, page_size, fields, prefetch):
+            for item in page.get("issues", []):
+                yield Issue.from_dict(item, fields)
+
+    def search_parallel(
+        self,
+        jql: str,
+        page_size: int = 100,
+        fields: list[str] | None = None,
+        max_workers: int | None = None,
+    ) -> list[Issue]:
+        """Fetch every issue matching a JQL query using concurrent requests.
+
+        When the server reports a ``total``, the remaining ``startAt`` windows are
+        fetched in parallel and merged in query order. Token-paginated responses
+        (no ``total``) are split into ``created`` date ranges instead, each walked on
+        its own worker; in that mode results are returned in ``created`` order.
+        """
+        fields = _projection(self._config, fields)
+        first = self._search_page(jql, page_size, 0, fields)
+        issues = [Issue.from_dict(i, fields) for i in first.get("issues", [])]
+        if _next_cursor(first, 0, page_size) is None:
+            return issues
+
+        if "total" in first:
+            step = first.get("maxResults") or page_size
+            windows = range(len(issues), first["total"], step)
+            pages = self._map_concurrent(
+                lambda start: self._search_page(jql, step, start, fields).get("issues", []),
+                windows,
+                max_workers,
+            )
+            return issues + [Issue.from_dict(i, fields) for page in pages for i in page]
+
+        return self._search_created_ranges(jql, page_size, fields, max_workers)
+
+    def search_frame(self, jql: str, page_size: int = 100, prefetch: bool = True) -> "IssueFrame":
+        """Fetch every issue matching a JQL query into a columnar ``IssueFrame``.
+
+        Only the fields the frame uses are requested and no ``Issue`` objects are
+        built, which keeps large analytics queries fast. Requires ``numpy``.
+        """
+        from jira_client.analytics import FRAME_FIELDS, IssueFrame
+
+        return IssueFrame.from_pages(self._iter_pages(jql, page_size, FRAME_FIELDS, prefetch))
+
+    def count(self, jql: str) -> int:
+        """Return the approximate number of issues matching ``jql`` without fetching any.
+
+        Backed by ``search/approximate-count``: one small request, but the count may
+        lag very recent changes. Any ``ORDER BY`` clause is ignored.
+        """
+        data = self._query("search/approximate-count", {"jql": _split_order_by(jql)[0]})
+        return int(data.get("count", 0))
+
+    def count_many(self, jqls: list[str], max_workers: int | None = None) -> dict[str, int]:
+        """Count many JQL queries concurrently; return ``{jql: count}`` in input order.
+
+        Duplicate queries are counted once. A failing query raises its error.
+        """
+        unique = list(dict.fromkeys(jqls))
+        return dict(zip(unique, self._map_concurrent(self.count, unique, max_workers)))
+
+    def sync(self, project_key: str, full: bool = False, page_size: int = 100) -> int:
+        """Bring the issue cache up to date for a project; return the number of issues fetched.
+
+        The first sync downloads the whole project. Later syncs only fetch issues with
+        ``updated`` at or after the previous sync's start (plus a one-minute overlap).
+        Deleted or moved issues are only dropped by a ``full=True`` sync.
+        """
+        if self._cache is None:
+            raise JiraClientError("sync() requires an issue cache (set JiraConfig.cache_path)")
+
+        started = time.time()
+        watermark = None if full else self._cache.watermark(project_key)
+        jql = f'project = "{project_key}"'
+        if watermark is not None:
+            # Relative JQL dates avoid any dependence on the user's Jira time zone.
+            minutes = math.ceil((started - watermark) / 60) + 1
+            jql += f' AND updated >= "-{minutes}m"'
+        jql += " ORDER BY updated ASC"
+
+        count = 0
+        for page in self._iter_pages(jql, page_size):
+            count += self._cache.put_many(page.get("issues", []))
+        if full:
+            self._cache.prune(project_key, started)
+        self._cache.set_watermark(project_key, started)
+        return count
+
+    def _search_created_ranges(
+        self,
+        jql: str,
+        page_size: int,
+        fields: list[str] | None,
+        max_workers: int | None,
+    ) -> list[Issue]:
+        """Split a query by ``created`` date ranges and walk each range concurrently."""
+        base, _ = _split_order_by(jql)
+
+        def _scoped(clause: str, order: str) -> str:
+            where = " AND ".join(f"({c})" for c in (base, clause) if c)
+            return f"{where} ORDER BY created {order}".strip()
+
+        def _edge(order: str) -> datetime | None:
+            data = self._search_page(_scoped("", order), 1, 0, ["created"])
+            issues = data.get("issues")
+            return _jql_datetime(issues[0]["fields"]["created"]) if issues else None
+
+        oldest, newest = _edge("ASC"), _edge("DESC")
+        if oldest is None or newest is None:
+            return []  # the matching issues were deleted since the first page
+        workers = max_workers or self._config.max_workers
+        ranges = _created_ranges(oldest, newest, workers * 4)
+
+        def _walk(clause: str) -> list[Issue]:
+            return [
+                Issue.from_dict(i, fields)
+                for page in self._iter_pages(_scoped(clause, "ASC"), page_size, fields, False)
+                for i in page.get("issues", [])
+            ]
+
+        results = self._map_concurrent(_walk, ranges, max_workers)
+        return [issue for chunk in results for issue in chunk]
+
+    def _search_page(
+        self,
+        jql: str,
+        max_results: int,
+        start_at: int = 0,
+        fields: list[str] | None = None,
+        next_page_token: str | None = None,
+    ) -> dict[str, Any]:
+        """Fetch one raw page of a JQL search."""
+        params = _search_params(jql, max_results, start_at, fields, next_page_token)
+        return self._get("search/jql", params=params)
+
+    def _iter_pages(
+        self,
+        jql: str,
+        page_size: int,
+        fields: list[str] | None = None,
+        prefetch: bool = True,
+        start_at: int = 0,
+        next_page_token: str | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Yield raw search pages, optionally fetching the next one ahead of time."""
+        executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+        pending: Future[dict[str, Any]] | None = None
+        try:
+            data = self._search_page(jql, page_size, start_at, fields, next_page_token)
+            while True:
+                cursor = _next_cursor(data, start_at, page_size)
+                if cursor is not None and executor is not None:
+                    pending = executor.submit(
+                        self._search_page, jql, page_size, cursor[0], fields, cursor[1]
+                    )
+                yield data
+                if cursor is None:
+                    return
+                start_at, next_page_token = cursor
+                if pending is not None:
+                    data, pending = pending.result(), None
+                else:
+                    data = self._search_page(jql, page_size, start_at, fields, next_page_token)
+        finally:
+            if pending is not None:
+                pending.cancel()
+            if executor is not None:
+                executor.shutdown(wait=False)
+
     def get_open(
         self,
         project_key: str | None = None,
@@ -85,11 +614,7 @@ class IssuesAPI(BaseAPI):
         start_at: int = 0,
     ) -> IssueSearchResult:
         """Return open (not-done) issues, optionally filtered by project."""
-        project = project_key or self._config.default_project
-        conditions = ["statusCategory != Done"]
-        if project:
-            conditions.insert(0, f'project = "{project}"')
-        jql = " AND ".join(conditions) + " ORDER BY created DESC"
+        jql = _open_jql(project_key or self._config.default_project)
         return self.search(jql, max_results=max_results, start_at=start_at)
 
     def get_closed(
@@ -102,14 +627,7 @@ class IssuesAPI(BaseAPI):
     ) -> IssueSearchResult:
         """Return closed issues, optionally filtered by project and resolution date range."""
         project = project_key or self._config.default_project
-        conditions = ["statusCategory = Done"]
-        if project:
-            conditions.insert(0, f'project = "{project}"')
-        if date_from:
-            conditions.append(f'resolutiondate >= "{date_from.isoformat()}"')
-        if date_to:
-            conditions.append(f'resolutiondate <= "{date_to.isoformat()}"')
-        jql = " AND ".join(conditions) + " ORDER BY resolutiondate DESC"
+        jql = _closed_jql(project, date_from, date_to)
         return self.search(jql, max_results=max_results, start_at=start_at)
 
     # ------------------------------------------------------------------
@@ -118,28 +636,93 @@ class IssuesAPI(BaseAPI):
 
     def get_transitions(self, issue_key: str) -> list[dict[str, Any]]:
         """Return the available workflow transitions for an issue."""
-        response = self._session.get(self._url(f"issue/{issue_key}/transitions"))
-        data = self._handle_response(response)
-        return data.get("transitions", [])
+        data = self._get(f"issue/{issue_key}/transitions")
+        return copy.deepcopy(data.get("transitions", []))
 
     def transition(self, issue_key: str, transition_id: str) -> None:
         """Apply a workflow transition to change the issue status."""
-        response = self._session.post(
-            self._url(f"issue/{issue_key}/transitions"),
+        response = self._request(
+            "POST",
+            f"issue/{issue_key}/transitions",
             json={"transition": {"id": transition_id}},
         )
+        self._invalidate(issue_key)
         self._handle_response(response)
 
+    def bulk_transition(
+        self,
+        keys: list[str],
+        target_status: str,
+        max_workers: int | None = None,
+    ) -> BulkTransitionResult:
+        """Move many issues to the status named ``target_status`` (case-insensitive).
+
+        Current statuses are read with batched searches. The transition to take is
+        looked up once per project, issue type and current status and cached for
+        ``metadata_cache_ttl`` seconds, so a sweep across one workflow costs a single
+        ``get_transitions`` call per starting status. The transitions are then sent
+        concurrently, paced and retried by the shared transport like any request.
+        Issues already in the target status are skipped; failures are reported per
+        issue rather than raised.
+        """
+        unique = list(dict.fromkeys(k.strip().upper() for k in keys))
+        batch = self.get_many(unique, fields=_TRANSITION_FIELDS, max_workers=max_workers)
+        pending = [i for i in batch.issues if not _in_status(i, target_status)]
+
+        def prime(issue: Issue) -> None:
+            try:
+                self._resolve_transition(issue, target_status)
+            except JiraClientError:
+                pass  # reported by the issue's own attempt below
+
+        cold = _cold_positions(self._transitions, pending, target_status)
+        self._map_concurrent(prime, cold, max_workers)
+        outcomes = self._map_concurrent(
+            lambda issue: self._transition_to(issue, target_status), pending, max_workers
+        )
+        return _transition_result(unique, batch, outcomes, target_status)
+
+    def _resolve_transition(self, issue: Issue, target_status: str) -> str | None:
+        """Return the transition id leading ``issue`` to ``target_status``, via the cache."""
+        key = _transition_key(issue, target_status)
+        transition_id = self._transitions.get(key, _UNRESOLVED)
+        if transition_id is _UNRESOLVED:
+            transition_id = _find_transition(self.get_transitions(issue.key), target_status)
+            self._transitions.set(key, transition_id)
+        return transition_id
+
+    def _transition_to(self, issue: Issue, target_status: str) -> TransitionOutcome:
+        try:
+            transition_id = self._resolve_transition(issue, target_status)
+            if transition_id is None:
+                return _no_transition(issue, target_status)
+            try:
+                self.transition(issue.key, transition_id)
+            except JiraValidationError:
+                # Workflow conditions can hide a transition from some issues in the
+                # same status: retry with this issue's own transitions, uncached.
+                own = _find_transition(self.get_transitions(issue.key), target_status)
+                if own in (None, transition_id):
+                    raise
+                self.transition(issue.key, own)
+        except JiraClientError as exc:
+            return TransitionOutcome(
+                issue.key, "failed", issue.status.name, str(exc), exc.status_code
+            )
+        return TransitionOutcome(issue.key, "transitioned", issue.status.name)
+
     # ------------------------------------------------------------------
     # Assignee
     # ------------------------------------------------------------------
 
     def assign(self, issue_key: str, account_id: str | None) -> None:
         """Assign an issue to a user. Pass None to unassign."""
-        response = self._session.put(
-            self._url(f"issue/{issue_key}/assignee"),
+        response = self._request(
+            "PUT",
+            f"issue/{issue_key}/assignee",
             json={"accountId": account_id},
         )
+        self._invalidate(issue_key)
         self._handle_response(response)
 
     # ------------------------------------------------------------------
@@ -148,14 +731,14 @@ class IssuesAPI(BaseAPI):
 
     def get_watchers(self, issue_key: str) -> list[dict[str, Any]]:
         """Return the list of watchers for an issue."""
-        response = self._session.get(self._url(f"issue/{issue_key}/watchers"))
-        data = self._handle_response(response)
-        return data.get("watchers", [])
+        data = self._get(f"issue/{issue_key}/watchers")
+        return copy.deepcopy(data.get("watchers", []))
 
     def add_watcher(self, issue_key: str, account_id: str) -> None:
         """Add a user as a watcher."""
-        response = self._session.post(
-            self._url(f"issue/{issue_key}/watchers"),
+        response = self._request(
+            "POST",
+            f"issue/{issue_key}/watchers",
             json=account_id,
         )
         self._handle_response(response)
@@ -175,25 +758,137 @@ class IssuesAPI(BaseAPI):
 
         Common link_type values: "Blocks", "Cloners", "Duplicate", "Relates".
         """
-        from jira_client.utils import text_to_adf
-
-        payload: dict[str, Any] = {
-            "type": {"name": link_type},
-            "inwardIssue": {"key": inward_issue_key},
-            "outwardIssue": {"key": outward_issue_key},
-        }
-        if comment:
-            payload["comment"] = {"body": text_to_adf(comment)}
-        response = self._session.post(self._url("issueLink"), json=payload)
+        payload = _link_payload(link_type, inward_issue_key, outward_issue_key, comment)
+        response = self._request("POST", "issueLink", json=payload)
         self._handle_response(response)
 
     # ------------------------------------------------------------------
     # Bulk operations
     # ------------------------------------------------------------------
 
-    def bulk_create(self, issues: list[IssueCreate]) -> list[Issue]:
-        """Create multiple issues in a single API call."""
-        payload = {"issueUpdates": [i.to_payload() for i in issues]}
-        response = self._session.post(self._url("issue/bulk"), json=payload)
-        data = self._handle_response(response)
-        return [self.get(item["key"]) for item in data.get("issues", [])]
+    def bulk_create(
+        self,
+        issues: list[IssueCreate],
+        hydrate: bool = True,
+        max_workers: int | None = None,
+    ) -> BulkCreateResult:
+        """Create many issues, chunked to the per-call limit and sent concurrently.
+
+        Each chunk's created issues are hydrated with a single ``key in (...)`` search;
+        pass ``hydrate=False`` to get ``CreatedIssue`` references with no extra requests.
+        Items rejected by Jira are reported in ``errors`` rather than raised, and so are
+        all items of a chunk whose request fails outright (e.g. a 500), so the issues
+        created by the other chunks are always returned. Issues the search does not
+        return yet (its index lags) are fetched one by one; any that still cannot be
+        read stay ``CreatedIssue`` references, listed in ``unhydrated``.
+        """
+        outcomes = self._map_concurrent(
+            lambda chunk: self._bulk_create_chunk(*chunk, hydrate=hydrate),
+            _bulk_chunks(issues),
+            max_workers,
+        )
+        result = BulkCreateResult()
+        for created, errors in outcomes:
+            result.issues.extend(created)
+            result.errors.extend(errors)
+        if hydrate:
+            result.unhydrated = [i.key for i in result.issues if isinstance(i, CreatedIssue)]
+        if result.issues:
+            self._invalidate()
+        return result
+
+    def _bulk_create_chunk(
+        self, offset: int, chunk: list[IssueCreate], hydrate: bool
+    ) -> tuple[list[Issue | CreatedIssue], list[BulkCreateError]]:
+        """POST one chunk to ``issue/bulk`` and optionally hydrate what was created."""
+        payload = {"issueUpdates": [i.to_payload() for i in chunk]}
+        try:
+            response = self._request("POST", "issue/bulk", json=payload)
+            if response.status_code == 400:
+                # A chunk in which every item failed comes back as 400 with per-item errors.
+                data = self._json(response)
+                if not data.get("errors"):
+                    self._raise_for_status(response)
+            else:
+                data = self._handle_response(response)
+        except (JiraClientError, requests.RequestException) as exc:
+            return [], _chunk_errors(offset, len(chunk), exc)
+
+        refs, errors = _parse_bulk_created(data, offset)
+        if not hydrate or not refs:
+            return list(refs), errors
+        try:
+            hydrated = self._fetch_by_keys([ref.key for ref in refs])
+        except (JiraClientError, requests.RequestException):
+            hydrated = {}
+        for ref in refs:
+            if ref.key not in hydrated:
+                # The search index lags new issues; a direct GET does not.
+                try:
+                    hydrated[ref.key] = self.get(ref.key)
+                except (JiraClientError, requests.RequestException):
+                    pass  # the issue exists: fall back to its reference
+        return [hydrated.get(ref.key, ref) for ref in refs], errors
+
+    def _invalidate(self, issue_key: str | None = None) -> None:
+        """Drop what a write may have made stale from the issue cache.
+
+        That is the written issue, if any, and every cached search page, since any
+        write can change which issues a query matches.
+        """
+        if self._cache is not None:
+            if issue_key is not None:
+                self._cache.invalidate(issue_key.strip().upper())
+            self._cache.invalidate_queries()
+
+    def _fetch_existing(
+        self, keys: list[str], fields: list[str] | None = None
+    ) -> dict[str, Issue]:
+        """Like ``_fetch_by_keys``, but isolates unknown keys instead of failing."""
+        return self._issues_by_key(self._search_existing_keys(keys, fields), fields)
+
+    def _fetch_by_keys(
+        self, keys: list[str], fields: list[str] | None = None
+    ) -> dict[str, Issue]:
+        """Fetch a batch of issues with one ``key in (...)`` search, keyed by issue key."""
+        return self._issues_by_key(self._search_keys(keys, fields), fields)
+
+    def _issues_by_key(
+        self, items: list[dict[str, Any]], fields: list[str] | None
+    ) -> dict[str, Issue]:
+        if self._cache is not None and fields is None:
+            self._cache.put_many(items)
+        return {item["key"]: Issue.from_dict(item, fields) for item in items}
+
+    def _search_existing_keys(
+        self, keys: list[str], fields: list[str] | None = None
+    ) -> list[dict[str, Any]]:
+        """Return the raw issues of a key batch, leaving out keys that do not exist.
+
+        JQL rejects a ``key in (...)`` clause naming a key that does not exist, so a
+        rejected batch is bisected until the offending keys are left out.
+        """
+        try:
+            return self._search_keys(keys, fields)
+        except JiraValidationError:
+            if len(keys) == 1:
+                return []
+            middle = len(keys) // 2
+            left = self._search_existing_keys(keys[:middle], fields)
+            return left + self._search_existing_keys(keys[middle:], fields)
+
+    def _search_keys(
+        self, keys: list[str], fields: list[str] | None = None
+    ) -> list[dict[str, Any]]:
+        """Return the raw issues of one ``key in (...)`` search."""
+        return self._search_all(_key_in_jql(keys), len(keys), fields)
+
+    def _search_all(
+        self, jql: str, page_size: int, fields: list[str] | None = None
+    ) -> list[dict[str, Any]]:
+        """Return every raw issue matching ``jql``, page by page without prefetching."""
+        return [
+            item
+            for page in self._iter_pages(jql, page_size, fields, prefetch=False)
+            for item in page.get("issues", [])
+        ]
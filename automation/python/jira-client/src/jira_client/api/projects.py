@@ -1,62 +1,104 @@
+import copy
 from typing import Any
 
 import requests
 
 from jira_client.api.base import BaseAPI
+from jira_client.cache.ttl import TTLCache
 from jira_client.config import JiraConfig
 from jira_client.models.project import Project
+from jira_client.transport import Transport
 
 
 class ProjectsAPI(BaseAPI):
-    """API operations for Jira projects."""
+    """API operations for Jira projects.
 
-    def __init__(self, config: JiraConfig, session: requests.Session) -> None:
-        super().__init__(config, session)
+    Mostly-static metadata (project key → id, issue types, components, versions,
+    priorities) is kept in a TTL/LRU cache configured by ``JiraConfig.metadata_cache_*``.
+    Expired entries are revalidated with ``If-None-Match`` when the server sent an ETag.
+    """
+
+    def __init__(
+        self,
+        config: JiraConfig,
+        session: requests.Session,
+        transport: Transport | None = None,
+    ) -> None:
+        super().__init__(config, session, transport)
+        self._metadata = TTLCache(config.metadata_cache_size, config.metadata_cache_ttl)
 
     def get_all(self) -> list[Project]:
         """Return all accessible Jira projects."""
-        response = self._session.get(
-            self._url("project"),
-            params={"expand": "description,lead,category"},
-        )
-        data = self._handle_response(response)
+        data = self._get("project", params={"expand": "description,lead,category"})
         return [Project.from_dict(p) for p in data]
 
     def get(self, project_key: str) -> Project:
         """Return a single project by its key."""
-        response = self._session.get(
-            self._url(f"project/{project_key}"),
-            params={"expand": "description,lead,category"},
-        )
-        data = self._handle_response(response)
+        data = self._get(f"project/{project_key}", params={"expand": "description,lead,category"})
         return Project.from_dict(data)
 
     def get_issue_types(self, project_key: str) -> list[dict[str, Any]]:
         """Return the issue types available in a project."""
-        response = self._session.get(self._url(f"issuetype/project"), params={"projectId": self._get_project_id(project_key)})
-        data = self._handle_response(response)
+        project_id = self._get_project_id(project_key)
+        data = self._get_metadata(
+            ("issue_types", project_key), "issuetype/project", {"projectId": project_id}
+        )
         if isinstance(data, list):
-            return data
+            return copy.deepcopy(data)
         # fallback: expand from project endpoint
-        response = self._session.get(
-            self._url(f"project/{project_key}"),
-            params={"expand": "issueTypes"},
+        data = self._get_metadata(
+            ("issue_types_expand", project_key),
+            f"project/{project_key}",
+            {"expand": "issueTypes"},
         )
-        data = self._handle_response(response)
-        return data.get("issueTypes", [])
+        return copy.deepcopy(data.get("issueTypes", []))
 
     def _get_project_id(self, project_key: str) -> str:
         """Resolve a project key to its numeric ID."""
-        response = self._session.get(self._url(f"project/{project_key}"))
-        data = self._handle_response(response)
+        data = self._get_metadata(("project", project_key), f"project/{project_key}")
         return data["id"]
 
     def get_components(self, project_key: str) -> list[dict[str, Any]]:
         """Return all components defined in a project."""
-        response = self._session.get(self._url(f"project/{project_key}/components"))
-        return self._handle_response(response)  # type: ignore[return-value]
+        key = ("components", project_key)
+        return copy.deepcopy(self._get_metadata(key, f"project/{project_key}/components"))
 
     def get_versions(self, project_key: str) -> list[dict[str, Any]]:
         """Return all versions defined in a project."""
-        response = self._session.get(self._url(f"project/{project_key}/versions"))
-        return self._handle_response(response)  # type: ignore[return-value]
+        key = ("versions", project_key)
+        return copy.deepcopy(self._get_metadata(key, f"project/{project_key}/versions"))
+
+    def get_priorities(self) -> list[dict[str, Any]]:
+        """Return the priorities defined on the Jira instance."""
+        return copy.deepcopy(self._get_metadata(("priorities", None), "priority"))
+
+    # ------------------------------------------------------------------
+    # Metadata cache
+    # ------------------------------------------------------------------
+
+    def invalidate(self, project_key: str | None = None) -> int:
+        """Drop cached metadata for one project, or everything; return the entry count."""
+        if project_key is None:
+            return self._metadata.invalidate()
+        return self._metadata.invalidate(lambda key: key[1] == project_key)
+
+    def _get_metadata(
+        self, key: tuple[str, str | None], path: str, params: dict[str, Any] | None = None
+    ) -> Any:
+        """GET a metadata resource through the TTL cache, revalidating with its ETag."""
+        entry = self._metadata.entry(key)
+        if entry is not None and not entry.expired:
+            return entry.value
+
+        headers = {}
+        if entry is not None and entry.etag and self._config.metadata_cache_etag:
+            headers["If-None-Match"] = entry.etag
+        response = self._request("GET", path, params=params, headers=headers)
+        if response.status_code == 304 and entry is not None:
+            self._metadata.refresh(key)
+            return entry.value
+
+        data = self._handle_response(response)
+        if self._config.metadata_cache_ttl > 0:
+            self._metadata.set(key, data, response.headers.get("ETag"))
+        return data
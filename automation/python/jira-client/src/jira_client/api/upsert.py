@@ -0,0 +1,344 @@
+"""Declarative bulk upserts; the engine behind :mod:`jira_client.upsert`."""
+
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
+from itertools import islice
+from typing import Any
+
+import requests
+
+from jira_client.api.base import BaseAPI
+from jira_client.api.issues import (
+    IssuesAPI,
+    _jql_string,
+    _key_batches,
+)
+from jira_client.config import JiraConfig
+from jira_client.exceptions import JiraClientError
+from jira_client.models.issue import IssueCreate, IssueUpdate
+from jira_client.transport import Transport
+from jira_client.utils import adf_to_text, text_to_adf
+
+MATCH_MODES = ("key", "label")
+
+# Row columns managed by an upsert, and the Jira fields read to diff them.
+UPSERT_COLUMNS = (
+    "summary",
+    "description",
+    "priority",
+    "assignee_account_id",
+    "labels",
+    "components",
+    "due_date",
+)
+_DIFF_FIELDS = [
+    "summary",
+    "description",
+    "priority",
+    "assignee",
+    "labels",
+    "components",
+    "duedate",
+]
+_LIST_COLUMNS = frozenset({"labels", "components"})
+_PAGE_SIZE = 100
+
+
+@dataclass
+class UpsertAction:
+    """What the upsert did (or, in a dry run, would do) for one input row."""
+
+    row: int  # position of the row in the input
+    action: str  # "create" | "update" | "unchanged" | "failed"
+    key: str | None = None  # None for rows not matched to an issue (yet)
+    changes: dict[str, tuple[Any, Any]] = field(default_factory=dict)  # column -> (old, new)
+    message: str = ""
+
+
+@dataclass
+class UpsertResult:
+    """Per-row outcome of an upsert, in input order."""
+
+    actions: list[UpsertAction] = field(default_factory=list)
+    dry_run: bool = False
+
+    def counts(self) -> dict[str, int]:
+        """Return the number of rows per action."""
+        counts = dict.fromkeys(("create", "update", "unchanged", "failed"), 0)
+        for action in self.actions:
+            counts[action.action] += 1
+        return counts
+
+    @property
+    def failed(self) -> list[UpsertAction]:
+        return [a for a in self.actions if a.action == "failed"]
+
+
+def diff_fields(fields: dict[str, Any], wanted: IssueUpdate) -> dict[str, tuple[Any, Any]]:
+    """Return ``{column: (current, wanted)}`` for the set fields of ``wanted`` that differ.
+
+    ``fields`` is an issue's raw ``fields`` payload. Text is compared after the same
+    plain-text/ADF round trip Jira applies, and lists regardless of order.
+    """
+    current = {
+        "summary": fields.get("summary"),
+        "description": adf_to_text(fields.get("description")),
+        "priority": (fields.get("priority") or {}).get("name"),
+        "assignee_account_id": (fields.get("assignee") or {}).get("accountId"),
+        "labels": fields.get("labels") or [],
+        "components": [c["name"] for c in fields.get("components") or []],
+        "due_date": fields.get("duedate"),
+    }
+    changes: dict[str, tuple[Any, Any]] = {}
+    for column in UPSERT_COLUMNS:
+        new = getattr(wanted, column)
+        if new is not None and _normalize(column, current[column]) != _normalize(column, new):
+            changes[column] = (current[column], new)
+    return changes
+
+
+def _normalize(column: str, value: Any) -> Any:
+    if column in _LIST_COLUMNS:
+        return sorted(set(value or []))
+    if column == "description":
+        return adf_to_text(text_to_adf(value or "")) or ""
+    return value
+
+
+def _wanted(row: Mapping[str, Any]) -> IssueUpdate:
+    """Build the wanted state of an issue from a row; empty cells are left unmanaged."""
+    values: dict[str, Any] = {}
+    for column in UPSERT_COLUMNS:
+        value = row.get(column)
+        if value is None or value == "":
+            continue
+        if column in _LIST_COLUMNS and isinstance(value, str):
+            value = [part.strip() for part in value.split(";") if part.strip()]
+        values[column] = value
+    return IssueUpdate(**values)
+
+
+class _Upsert:
+    """Matches, diffs and writes one batch of rows at a time.
+
+    Remembers which external ids it has planned to create, so that a later row with
+    the same id, in the same batch or a later one, does not create a second issue.
+    """
+
+    def __init__(
+        self,
+        api: "UpsertAPI",
+        project_key: str | None,
+        match: str,
+        id_column: str,
+        label_prefix: str,
+        issue_type: str,
+        max_workers: int | None,
+    ) -> None:
+        self.api = api
+        self.project_key = project_key
+        self.match = match
+        self.id_column = id_column
+        self.label_prefix = label_prefix
+        self.issue_type = issue_type
+        self.max_workers = max_workers
+        self.planned: dict[str, int] = {}  # external-id label -> row creating its issue
+
+    def run(
+        self, batch: list[tuple[int, Mapping[str, Any]]], create: bool, dry_run: bool
+    ) -> list[UpsertAction]:
+        refs = [self._ref(row) for _, row in batch]
+        found = self._lookup([ref for ref in refs if ref])
+
+        actions: list[UpsertAction] = []
+        updates: list[tuple[UpsertAction, IssueUpdate]] = []
+        creates: list[tuple[UpsertAction, IssueCreate]] = []
+        for (index, row), ref in zip(batch, refs):
+            wanted = _wanted(row)
+            if self.match == "label" and wanted.labels is not None and ref not in wanted.labels:
+                wanted.labels = [*wanted.labels, ref]  # never drop the external-id label
+            action = UpsertAction(index, "failed")
+            actions.append(action)
+            matches = found.get(ref, []) if ref else []
+            if not ref:
+                action.message = f"Row has no {self._ref_column()!r} value"
+            elif len(matches) > 1:
+                action.message = f"{ref!r} matches {len(matches)} issues: " + ", ".join(
+                    issue["key"] for issue in matches
+                )
+            elif matches:
+                action.key = matches[0]["key"]
+                action.changes = diff_fields(matches[0]["fields"], wanted)
+                action.action = "update" if action.changes else "unchanged"
+                if action.changes:
+                    updates.append((action, _changed(action.changes)))
+            elif self.match == "key":
+                action.message = "Issue does not exist or is not visible"
+            elif not create:
+                action.action, action.message = "unchanged", "No matching issue; not created"
+            elif ref in self.planned:
+                action.message = f"Duplicate {ref!r}: row {self.planned[ref]} creates that issue"
+            else:
+                self._plan_create(action, row, wanted, ref, creates)
+
+        if not dry_run:
+            self._apply_updates(updates)
+            self._apply_creates(creates)
+        return actions
+
+    # ------------------------------------------------------------------
+    # Matching
+    # ------------------------------------------------------------------
+
+    def _ref_column(self) -> str:
+        return "key" if self.match == "key" else self.id_column
+
+    def _ref(self, row: Mapping[str, Any]) -> str | None:
+        """Return the key, or the external-id label, that identifies a row's issue."""
+        value = str(row.get(self._ref_column()) or "").strip()
+        if not value:
+            return None
+        return value.upper() if self.match == "key" else self.label_prefix + value
+
+    def _lookup(self, refs: list[str]) -> dict[str, list[dict[str, Any]]]:
+        """Find the existing issues for ``refs`` with batched searches, concurrently."""
+        found: dict[str, list[dict[str, Any]]] = {}
+        unique = list(dict.fromkeys(refs))
+        for batch in self.api._map_concurrent(
+            self._search_batch, _key_batches(unique), self.max_workers
+        ):
+            for ref, issue in batch:
+                found.setdefault(ref, []).append(issue)
+        return found
+
+    def _search_batch(self, refs: list[str]) -> list[tuple[str, dict[str, Any]]]:
+        issues = self.api._issues
+        if self.match == "key":
+            return [(i["key"], i) for i in issues._search_existing_keys(refs, _DIFF_FIELDS)]
+        wanted = set(refs)
+        clause = "labels in ({})".format(", ".join(map(_jql_string, refs)))
+        if self.project_key:
+            clause = f"project = {_jql_string(self.project_key)} AND {clause}"
+        return [
+            (label, issue)
+            for issue in issues._search_all(clause, _PAGE_SIZE, _DIFF_FIELDS)
+            for label in issue["fields"].get("labels") or []
+            if label in wanted
+        ]
+
+    # ------------------------------------------------------------------
+    # Writing
+    # ------------------------------------------------------------------
+
+    def _plan_create(
+        self,
+        action: UpsertAction,
+        row: Mapping[str, Any],
+        wanted: IssueUpdate,
+        label: str,
+        creates: list[tuple[UpsertAction, IssueCreate]],
+    ) -> None:
+        project = row.get("project_key") or self.project_key
+        if not wanted.summary or not project:
+            action.message = "A summary and a project are required to create an issue"
+            return
+        issue = IssueCreate(
+            project_key=project,
+            summary=wanted.summary,
+            issue_type=row.get("issue_type") or self.issue_type,
+            description=wanted.description,
+            priority=wanted.priority,
+            assignee_account_id=wanted.assignee_account_id,
+            labels=wanted.labels or [label],
+            components=wanted.components or [],
+            due_date=wanted.due_date,
+        )
+        action.action = "create"
+        action.changes = {
+            column: (None, getattr(wanted, column))
+            for column in UPSERT_COLUMNS
+            if getattr(wanted, column) is not None
+        }
+        action.changes["labels"] = (None, issue.labels)
+        creates.append((action, issue))
+        self.planned[label] = action.row
+
+    def _apply_updates(self, updates: list[tuple[UpsertAction, IssueUpdate]]) -> None:
+        def send(item: tuple[UpsertAction, IssueUpdate]) -> None:
+            action, update = item
+            try:
+                self.api._issues.update(action.key, update)
+            except (JiraClientError, requests.RequestException) as exc:
+                action.action, action.message = "failed", str(exc)
+
+        self.api._map_concurrent(send, updates, self.max_workers)
+
+    def _apply_creates(self, creates: list[tuple[UpsertAction, IssueCreate]]) -> None:
+        if not creates:
+            return
+        # bulk_create reports rejected items and failed chunks in errors, by input
+        # index, and returns the issues created by the rest in input order.
+        result = self.api._issues.bulk_create(
+            [issue for _, issue in creates], hydrate=False, max_workers=self.max_workers
+        )
+        failed = {error.index: error for error in result.errors}
+        created = iter(result.issues)
+        for index, (action, _) in enumerate(creates):
+            if index in failed:
+                action.action, action.message = "failed", failed[index].message
+            elif (issue := next(created, None)) is not None:
+                action.key = issue.key
+            else:
+                action.action, action.message = "failed", "Jira did not report the issue created"
+
+
+def _changed(changes: dict[str, tuple[Any, Any]]) -> IssueUpdate:
+    return IssueUpdate(**{column: new for column, (_, new) in changes.items()})
+
+
+class UpsertAPI(BaseAPI):
+    """Brings Jira issues in line with rows from another system.
+
+    Existing issues are read with its own batched searches; writes go through the
+    ``IssuesAPI`` (``update`` and ``bulk_create``), so they invalidate its cache.
+    """
+
+    def __init__(
+        self,
+        config: JiraConfig,
+        session: requests.Session,
+        transport: Transport | None = None,
+        issues: IssuesAPI | None = None,
+    ) -> None:
+        super().__init__(config, session, transport)
+        self._issues = issues or IssuesAPI(config, session, self._transport)
+
+    def apply(
+        self,
+        rows: Iterable[Mapping[str, Any]],
+        project_key: str | None = None,
+        match: str = "key",
+        id_column: str = "external_id",
+        label_prefix: str = "ext-",
+        issue_type: str = "Task",
+        create: bool = True,
+        dry_run: bool = False,
+        batch_size: int = 500,
+        max_workers: int | None = None,
+    ) -> UpsertResult:
+        """Apply ``rows`` to Jira with as few writes as possible (see :mod:`jira_client.upsert`).
+
+        Rows are consumed ``batch_size`` at a time, so any iterable can be streamed.
+        ``project_key`` (default ``JiraConfig.default_project``) scopes label lookups
+        and receives created issues; a ``project_key`` or ``issue_type`` column
+        overrides it per row. Failures are reported per row rather than raised.
+        """
+        if match not in MATCH_MODES:
+            raise ValueError(f"Unsupported match mode {match!r}; expected one of {MATCH_MODES}")
+        project_key = project_key or self._config.default_project
+        engine = _Upsert(self, project_key, match, id_column, label_prefix, issue_type, max_workers)
+        result = UpsertResult(dry_run=dry_run)
+        numbered = enumerate(rows)
+        while batch := list(islice(numbered, batch_size)):
+            result.actions.extend(engine.run(batch, create, dry_run))
+        return result
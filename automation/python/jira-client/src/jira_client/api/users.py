@@ -0,0 +1,154 @@
+from collections.abc import Iterable
+from typing import Any
+
+import requests
+
+from jira_client.api.base import BaseAPI
+from jira_client.cache.issue_cache import IssueCache
+from jira_client.cache.ttl import TTLCache
+from jira_client.config import JiraConfig
+from jira_client.models.user import User
+from jira_client.transport import Transport
+
+# Candidates fetched per lookup; a query matching more users than this is ambiguous anyway.
+_LOOKUP_RESULTS = 20
+
+
+def _query_key(query: str) -> str:
+    """Normalize a lookup query so that case and spacing variants share one lookup."""
+    return " ".join(query.split()).casefold()
+
+
+def _pick(key: str, candidates: list[dict[str, Any]]) -> dict[str, Any] | None:
+    """Choose the account a normalized query names, or None if none or several do.
+
+    A candidate matches when its email or display name equals the query; active
+    accounts win over deactivated ones. Jira also matches emails that profile
+    visibility hides from the response, so a sole result for an email query is taken.
+    """
+    exact = [
+        u
+        for u in candidates
+        if key in (_query_key(u.get("emailAddress") or ""), _query_key(u.get("displayName", "")))
+    ]
+    if not exact and "@" in key and len(candidates) == 1:
+        exact = candidates
+    exact = [u for u in exact if u.get("active", True)] or exact
+    return exact[0] if len(exact) == 1 else None
+
+
+def _remember(hits: TTLCache, misses: TTLCache, key: str, user: dict[str, Any] | None) -> None:
+    """Cache a lookup result: users in ``hits``, misses (None) in the shorter-lived ``misses``."""
+    (hits if user else misses).set(key, user)
+
+
+def _recalled(
+    hits: TTLCache, misses: TTLCache, keys: Iterable[str]
+) -> dict[str, dict[str, Any] | None]:
+    """Return the unexpired cached lookup results for ``keys``."""
+    found: dict[str, dict[str, Any] | None] = {}
+    for key in keys:
+        for cache in (hits, misses):
+            entry = cache.entry(key)
+            if entry is not None and not entry.expired:
+                found[key] = entry.value
+                break
+    return found
+
+
+def _aliases(key: str, user: dict[str, Any] | None) -> dict[str, dict[str, Any] | None]:
+    """Cache entries for a lookup result: the query, plus the user's email if known."""
+    entries = {key: user}
+    if user and (email := user.get("emailAddress")):
+        entries[_query_key(email)] = user
+    return entries
+
+
+class UsersAPI(BaseAPI):
+    """User lookups, mainly to turn emails and display names into account ids.
+
+    ``find_many`` / ``resolve_many`` look up each distinct query once (queries differing
+    only in case or spacing are the same), run the lookups concurrently and remember
+    the results in an LRU cache for ``JiraConfig.user_cache_ttl`` seconds, misses
+    only for ``user_miss_ttl``. With a persistent ``store`` (the client's SQLite cache
+    when ``cache_path`` is set) found users also survive across runs.
+    """
+
+    def __init__(
+        self,
+        config: JiraConfig,
+        session: requests.Session,
+        transport: Transport | None = None,
+        store: IssueCache | None = None,
+    ) -> None:
+        super().__init__(config, session, transport)
+        self._lookups = TTLCache(config.user_cache_size, config.user_cache_ttl)
+        self._misses = TTLCache(config.user_cache_size, config.user_miss_ttl)
+        self._store = store
+
+    def get(self, account_id: str) -> User:
+        """Return a user by account id."""
+        return User.from_dict(self._get("user", params={"accountId": account_id}))
+
+    def search(self, query: str, max_results: int = 50) -> list[User]:
+        """Return the users whose display name or email matches ``query`` (uncached)."""
+        data = self._get("user/search", params={"query": query, "maxResults": max_results})
+        return [User.from_dict(u) for u in data]
+
+    def find(self, query: str) -> User | None:
+        """Return the single user an email or display name refers to (see ``find_many``)."""
+        return self.find_many([query])[query]
+
+    def find_many(
+        self, queries: Iterable[str], max_workers: int | None = None
+    ) -> dict[str, User | None]:
+        """Map each email or display name to its user.
+
+        A query maps to None when no account matches it exactly, or when several do
+        (e.g. two people with the same display name); use ``search`` to inspect those.
+        """
+        keys = {query: _query_key(query) for query in queries}
+        found = self._cached(set(keys.values()))
+        todo = [key for key in dict.fromkeys(keys.values()) if key not in found]
+        if todo:
+            fetched: dict[str, dict[str, Any] | None] = {}
+            for key, user in zip(todo, self._map_concurrent(self._lookup, todo, max_workers)):
+                fetched.update(_aliases(key, user))
+            for key, user in fetched.items():
+                _remember(self._lookups, self._misses, key, user)
+            if self._store is not None:
+                self._store.put_users({key: user for key, user in fetched.items() if user})
+            found.update(fetched)
+        return {
+            query: User.from_dict(u) if (u := found[key]) else None for query, key in keys.items()
+        }
+
+    def resolve_many(
+        self, queries: Iterable[str], max_workers: int | None = None
+    ) -> dict[str, str | None]:
+        """Map each email or display name to an account id (None if not resolvable)."""
+        users = self.find_many(queries, max_workers)
+        return {query: user.account_id if user else None for query, user in users.items()}
+
+    def invalidate(self) -> int:
+        """Forget every lookup result, also in the persistent store.
+
+        Returns how many in-process results were dropped.
+        """
+        if self._store is not None:
+            self._store.invalidate_users()
+        return self._lookups.invalidate() + self._misses.invalidate()
+
+    def _cached(self, keys: set[str]) -> dict[str, dict[str, Any] | None]:
+        found = _recalled(self._lookups, self._misses, keys)
+        if self._store is not None and (missing := keys - found.keys()):
+            stored = self._store.get_users(missing, self._config.user_cache_ttl)
+            for key, user in stored.items():
+                if user:  # misses stored by older versions are looked up again
+                    self._lookups.set(key, user)
+                    found[key] = user
+        return found
+
+    def _lookup(self, key: str) -> dict[str, Any] | None:
+        params = {"query": key, "maxResults": _LOOKUP_RESULTS}
+        return _pick(key, self._get("user/search", params=params))
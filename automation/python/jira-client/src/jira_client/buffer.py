@@ -0,0 +1,238 @@
+"""Write buffering: coalesce many small writes to the same issues into few requests.
+
+A job step that updates an issue's fields, assigns it and adds watchers usually sends
+one request per call. Inside a :class:`WriteBuffer` those calls are queued instead and
+merged per issue when the buffer is flushed:
+
+- every ``update`` of an issue becomes one ``PUT issue/{key}``, later values winning
+  field by field;
+- assignments, including an assignee set through ``update``, collapse to the last one,
+  sent as its own ``PUT issue/{key}/assignee`` so that it needs only the Assign
+  permission and a rejected assignee does not fail the field changes;
+- duplicate watchers are dropped.
+
+The merged requests are sent concurrently. Usage::
+
+    with client.buffered() as writes:
+        for key in keys:
+            writes.update(key, IssueUpdate(labels=["triaged"]))
+            writes.assign(key, owner_id)
+            writes.add_watcher(key, lead_id)
+    print(writes.result.requests, writes.result.failures)
+"""
+
+import threading
+from dataclasses import dataclass, field
+from types import TracebackType
+from typing import TYPE_CHECKING, Any
+
+import requests
+
+from jira_client.exceptions import JiraClientError
+from jira_client.models.issue import IssueUpdate
+
+if TYPE_CHECKING:
+    from jira_client.api.issues import IssuesAPI
+
+_UNSET = object()
+
+
+@dataclass
+class WriteFailure:
+    """A merged write that Jira rejected, or that could not be sent, during a flush.
+
+    ``status`` is None when no response arrived (a connection error or timeout);
+    those writes stay queued for the next flush.
+    """
+
+    key: str
+    operation: str  # "update" | "assign" | "watcher"
+    status: int | None
+    message: str
+    account_id: str | None = None  # the watcher, for "watcher" failures
+
+
+@dataclass
+class FlushResult:
+    """What one or more flushes sent: requests made, writes merged away, failures."""
+
+    writes: int = 0  # calls queued on the buffer
+    requests: int = 0  # requests actually sent
+    failures: list[WriteFailure] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return not self.failures
+
+    def _add(self, other: "FlushResult") -> None:
+        self.writes += other.writes
+        self.requests += other.requests
+        self.failures.extend(other.failures)
+
+
+class _Pending:
+    """The merged writes queued for one issue."""
+
+    __slots__ = ("fields", "assignee", "watchers", "writes")
+
+    def __init__(self) -> None:
+        self.fields: dict[str, Any] = {}
+        self.assignee: Any = _UNSET  # account id, or None to unassign
+        self.watchers: dict[str, None] = {}  # ordered set
+        self.writes = 0
+
+    def operations(self, key: str) -> list[tuple[str, str, Any]]:
+        """Return the requests to send as ``(key, operation, argument)`` tuples."""
+        ops: list[tuple[str, str, Any]] = []
+        if self.fields:
+            ops.append((key, "update", dict(self.fields)))
+        if self.assignee is not _UNSET:
+            ops.append((key, "assign", self.assignee))
+        ops.extend((key, "watcher", account_id) for account_id in self.watchers)
+        return ops
+
+    def restore(self, operation: str, argument: Any) -> None:
+        """Queue again an operation returned by :meth:`operations` that was not sent."""
+        if operation == "update":
+            self.fields.update(argument)
+        elif operation == "assign":
+            self.assignee = argument
+        else:
+            self.watchers[argument] = None
+
+    def merge(self, newer: "_Pending") -> None:
+        """Apply writes queued after this entry's on top of it."""
+        self.fields.update(newer.fields)
+        if newer.assignee is not _UNSET:
+            self.assignee = newer.assignee
+        self.watchers.update(newer.watchers)
+        self.writes += newer.writes
+
+
+class WriteBuffer:
+    """Queues issue writes and sends them merged per issue (see the module docstring).
+
+    The buffer flushes itself when ``max_pending`` distinct issues are queued, when
+    :meth:`flush` is called, and when its ``with`` block exits (also on an exception,
+    so writes queued before it are not lost). Failures never raise: each flush returns
+    a :class:`FlushResult`, and ``result`` accumulates all flushes so far. Writes that
+    could not be sent (connection errors, timeouts) stay queued and are retried by the
+    next flush; ``len(buffer)`` is then non-zero.
+
+    Writes are sent at flush time, so reads in between do not see them yet. Safe to
+    use from many threads.
+    """
+
+    def __init__(
+        self, issues: "IssuesAPI", max_pending: int = 100, max_workers: int | None = None
+    ) -> None:
+        if max_pending < 1:
+            raise ValueError("max_pending must be at least 1")
+        self._issues = issues
+        self.max_pending = max_pending
+        self.max_workers = max_workers
+        self.result = FlushResult()
+        self._lock = threading.Lock()
+        self._pending: dict[str, _Pending] = {}
+
+    def __enter__(self) -> "WriteBuffer":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.flush()
+
+    def __len__(self) -> int:
+        """Number of issues with queued writes."""
+        return len(self._pending)
+
+    def update(self, issue_key: str, update: IssueUpdate) -> None:
+        """Queue a field update; merged with earlier updates of the same issue."""
+        fields = dict(update.to_payload()["fields"])
+        assignee = fields.pop("assignee", _UNSET)
+        with self._lock:
+            pending = self._queue(issue_key)
+            pending.fields.update(fields)
+            if assignee is not _UNSET:
+                pending.assignee = assignee["accountId"]
+        self._maybe_flush()
+
+    def assign(self, issue_key: str, account_id: str | None) -> None:
+        """Queue an assignment (None to unassign); only the last one is sent."""
+        with self._lock:
+            self._queue(issue_key).assignee = account_id
+        self._maybe_flush()
+
+    def add_watcher(self, issue_key: str, account_id: str) -> None:
+        """Queue adding a watcher; repeats of the same watcher are sent once."""
+        with self._lock:
+            self._queue(issue_key).watchers[account_id] = None
+        self._maybe_flush()
+
+    def flush(self) -> FlushResult:
+        """Send everything queued so far, concurrently, and return what happened.
+
+        Only writes that reached Jira are dropped from the buffer; the others are
+        queued again, also if an unexpected error escapes the flush.
+        """
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        flushed = FlushResult(writes=sum(p.writes for p in pending.values()))
+        ops = [op for key, p in pending.items() for op in p.operations(key)]
+        flushed.requests = len(ops)
+        sent: set[int] = set()  # indexes of the ops that got a response
+        try:
+            failures = self._issues._map_concurrent(
+                lambda item: self._send(item, sent), enumerate(ops), self.max_workers
+            )
+        finally:
+            self._requeue([op for i, op in enumerate(ops) if i not in sent])
+        flushed.failures = [f for f in failures if f is not None]
+        with self._lock:
+            self.result._add(flushed)
+        return flushed
+
+    def _queue(self, issue_key: str) -> _Pending:
+        key = issue_key.strip().upper()
+        pending = self._pending.get(key)
+        if pending is None:
+            pending = self._pending[key] = _Pending()
+        pending.writes += 1
+        return pending
+
+    def _requeue(self, ops: list[tuple[str, str, Any]]) -> None:
+        """Queue unsent ops again, beneath any writes queued since the flush began."""
+        restored: dict[str, _Pending] = {}
+        for key, operation, argument in ops:
+            restored.setdefault(key, _Pending()).restore(operation, argument)
+        with self._lock:
+            for key, pending in restored.items():
+                if (newer := self._pending.get(key)) is not None:
+                    pending.merge(newer)
+                self._pending[key] = pending
+
+    def _maybe_flush(self) -> None:
+        if len(self._pending) >= self.max_pending:
+            self.flush()
+
+    def _send(self, item: tuple[int, tuple[str, str, Any]], sent: set[int]) -> WriteFailure | None:
+        index, (key, operation, argument) = item
+        watcher = argument if operation == "watcher" else None
+        try:
+            if operation == "update":
+                self._issues.update_fields(key, argument)
+            elif operation == "assign":
+                self._issues.assign(key, argument)
+            else:
+                self._issues.add_watcher(key, argument)
+        except requests.RequestException as exc:
+            return WriteFailure(key, operation, None, str(exc), watcher)
+        except JiraClientError as exc:
+            sent.add(index)
+            return WriteFailure(key, operation, exc.status_code, str(exc), watcher)
+        sent.add(index)
+        return None
@@ -0,0 +1,4 @@
+from jira_client.cache.issue_cache import IssueCache
+from jira_client.cache.ttl import CacheEntry, TTLCache
+
+__all__ = ["IssueCache", "TTLCache", "CacheEntry"]
@@ -0,0 +1,231 @@
+"""Persistent on-disk store of raw issue payloads, backed by SQLite."""
+
+import sqlite3
+import threading
+import time
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import Any
+
+from jira_client.codec import JsonCodec, get_codec
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS issues (
+    key        TEXT PRIMARY KEY,
+    id         TEXT NOT NULL,
+    project    TEXT NOT NULL,
+    updated    TEXT,
+    fetched_at REAL NOT NULL,
+    data       TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS issues_project ON issues (project);
+CREATE TABLE IF NOT EXISTS sync_state (
+    project   TEXT PRIMARY KEY,
+    watermark REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS queries (
+    query      TEXT PRIMARY KEY,
+    fetched_at REAL NOT NULL,
+    data       TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS users (
+    query      TEXT PRIMARY KEY,
+    fetched_at REAL NOT NULL,
+    data       TEXT NOT NULL
+);
+"""
+
+
+class IssueCache:
+    """SQLite-backed cache of full issue payloads keyed by issue key.
+
+    Each row keeps the raw REST payload, the issue's ``updated`` timestamp and the
+    time it was fetched. An entry is fresh if it was fetched, or its project was
+    last synced, less than ``max_age`` seconds ago. Search result pages are cached
+    under the same staleness bound; user lookups (see ``UsersAPI``) under their own.
+
+    Payloads are serialized with ``codec`` (the fastest installed JSON backend by
+    default); rows written by any backend can be read by any other.
+
+    The cache is safe to share between threads.
+    """
+
+    def __init__(
+        self,
+        path: str | Path = "jira_cache.sqlite3",
+        max_age: float = 300.0,
+        codec: JsonCodec | None = None,
+    ) -> None:
+        self.path = Path(path)
+        self.max_age = max_age
+        self._codec = codec or get_codec()
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(_SCHEMA)
+
+    # ------------------------------------------------------------------
+    # Issues
+    # ------------------------------------------------------------------
+
+    def get(self, key: str, max_age: float | None = None) -> dict[str, Any] | None:
+        """Return the cached payload for ``key`` if it is fresh, else None."""
+        return self.get_many([key], max_age).get(key)
+
+    def get_many(
+        self, keys: Iterable[str], max_age: float | None = None
+    ) -> dict[str, dict[str, Any]]:
+        """Return fresh cached payloads for the given keys (missing/stale keys are omitted)."""
+        keys = list(keys)
+        if not keys:
+            return {}
+        oldest = time.time() - (self.max_age if max_age is None else max_age)
+        placeholders = ",".join("?" * len(keys))
+        with self._lock:
+            rows = self._db.execute(
+                f"""
+                SELECT i.key, i.data FROM issues i
+                LEFT JOIN sync_state s ON s.project = i.project
+                WHERE i.key IN ({placeholders})
+                  AND MAX(i.fetched_at, COALESCE(s.watermark, 0)) >= ?
+                """,
+                [*keys, oldest],
+            ).fetchall()
+        return {key: self._codec.loads(data) for key, data in rows}
+
+    def put_many(self, issues: Iterable[dict[str, Any]]) -> int:
+        """Insert or replace full issue payloads; return how many were written."""
+        now = time.time()
+        rows = [
+            (
+                item["key"],
+                item["id"],
+                ((item.get("fields") or {}).get("project") or {}).get("key")
+                or item["key"].rsplit("-", 1)[0],
+                (item.get("fields") or {}).get("updated"),
+                now,
+                self._codec.dumps(item),
+            )
+            for item in issues
+        ]
+        with self._lock, self._db:
+            self._db.executemany(
+                "INSERT OR REPLACE INTO issues VALUES (?, ?, ?, ?, ?, ?)", rows
+            )
+        return len(rows)
+
+    def iter_project(self, project_key: str) -> Iterator[dict[str, Any]]:
+        """Yield every cached payload of a project, regardless of freshness."""
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT data FROM issues WHERE project = ? ORDER BY updated", [project_key]
+            ).fetchall()
+        for (data,) in rows:
+            yield self._codec.loads(data)
+
+    def prune(self, project_key: str, fetched_before: float) -> int:
+        """Delete a project's rows not refreshed since ``fetched_before`` (after a full sync)."""
+        with self._lock, self._db:
+            cursor = self._db.execute(
+                "DELETE FROM issues WHERE project = ? AND fetched_at < ?",
+                [project_key, fetched_before],
+            )
+        return cursor.rowcount
+
+    # ------------------------------------------------------------------
+    # Sync watermarks
+    # ------------------------------------------------------------------
+
+    def watermark(self, project_key: str) -> float | None:
+        """Return the epoch time the last sync of ``project_key`` started, if any."""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT watermark FROM sync_state WHERE project = ?", [project_key]
+            ).fetchone()
+        return row[0] if row else None
+
+    def set_watermark(self, project_key: str, watermark: float) -> None:
+        with self._lock, self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO sync_state VALUES (?, ?)", [project_key, watermark]
+            )
+
+    # ------------------------------------------------------------------
+    # Search pages
+    # ------------------------------------------------------------------
+
+    def get_query(self, query: str, max_age: float | None = None) -> dict[str, Any] | None:
+        """Return a fresh cached search page for ``query`` (a canonical request string)."""
+        oldest = time.time() - (self.max_age if max_age is None else max_age)
+        with self._lock:
+            row = self._db.execute(
+                "SELECT data FROM queries WHERE query = ? AND fetched_at >= ?", [query, oldest]
+            ).fetchone()
+        return self._codec.loads(row[0]) if row else None
+
+    def put_query(self, query: str, page: dict[str, Any]) -> None:
+        with self._lock, self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO queries VALUES (?, ?, ?)",
+                [query, time.time(), self._codec.dumps(page)],
+            )
+
+    def invalidate_queries(self) -> None:
+        """Drop every cached search page (e.g. after a write that may change results)."""
+        with self._lock, self._db:
+            self._db.execute("DELETE FROM queries")
+
+    # ------------------------------------------------------------------
+    # User lookups
+    # ------------------------------------------------------------------
+
+    def get_users(self, queries: Iterable[str], max_age: float) -> dict[str, dict[str, Any] | None]:
+        """Return fresh lookup results (user payload, or None for no match) by query."""
+        queries = list(queries)
+        if not queries:
+            return {}
+        placeholders = ",".join("?" * len(queries))
+        with self._lock:
+            rows = self._db.execute(
+                f"SELECT query, data FROM users WHERE query IN ({placeholders})"
+                " AND fetched_at >= ?",
+                [*queries, time.time() - max_age],
+            ).fetchall()
+        return {query: self._codec.loads(data) for query, data in rows}
+
+    def put_users(self, results: dict[str, dict[str, Any] | None]) -> None:
+        now = time.time()
+        rows = [(query, now, self._codec.dumps(user)) for query, user in results.items()]
+        with self._lock, self._db:
+            self._db.executemany("INSERT OR REPLACE INTO users VALUES (?, ?, ?)", rows)
+
+    def invalidate_users(self) -> int:
+        """Drop every stored user lookup result; return how many were dropped."""
+        with self._lock, self._db:
+            return self._db.execute("DELETE FROM users").rowcount
+
+    # ------------------------------------------------------------------
+    # Housekeeping
+    # ------------------------------------------------------------------
+
+    def invalidate(self, key: str | None = None) -> None:
+        """Drop one issue, or everything (issues, watermarks, searches, user lookups)."""
+        with self._lock, self._db:
+            if key is not None:
+                self._db.execute("DELETE FROM issues WHERE key = ?", [key])
+                return
+            self._db.execute("DELETE FROM issues")
+            self._db.execute("DELETE FROM sync_state")
+            self._db.execute("DELETE FROM queries")
+            self._db.execute("DELETE FROM users")
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+    def __enter__(self) -> "IssueCache":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
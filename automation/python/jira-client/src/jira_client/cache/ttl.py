@@ -0,0 +1,77 @@
+"""In-process cache with per-entry time-to-live and LRU eviction."""
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass
+class CacheEntry:
+    """A cached value with its expiry time and optional HTTP validator."""
+
+    value: Any
+    expires_at: float
+    etag: str | None = None
+
+    @property
+    def expired(self) -> bool:
+        return time.monotonic() >= self.expires_at
+
+
+class TTLCache:
+    """Thread-safe mapping whose entries expire after ``ttl`` seconds.
+
+    At most ``maxsize`` entries are kept; the least recently used one is evicted
+    first. Expired entries are kept (until evicted) so that callers can revalidate
+    them with their ETag instead of downloading them again.
+    """
+
+    def __init__(self, maxsize: int = 256, ttl: float = 600.0) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[Hashable, CacheEntry] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the value for ``key`` if present and not expired, else ``default``."""
+        entry = self.entry(key)
+        return default if entry is None or entry.expired else entry.value
+
+    def entry(self, key: Hashable) -> CacheEntry | None:
+        """Return the raw entry for ``key``, expired or not, marking it recently used."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None:
+                self._data.move_to_end(key)
+            return entry
+
+    def set(self, key: Hashable, value: Any, etag: str | None = None) -> None:
+        with self._lock:
+            self._data[key] = CacheEntry(value, time.monotonic() + self.ttl, etag)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def refresh(self, key: Hashable) -> None:
+        """Restart the TTL of an entry (e.g. after a 304 Not Modified)."""
+        with self._lock:
+            if (entry := self._data.get(key)) is not None:
+                entry.expires_at = time.monotonic() + self.ttl
+
+    def invalidate(self, match: Callable[[Hashable], bool] | None = None) -> int:
+        """Drop entries whose key satisfies ``match`` (all entries if None); return the count."""
+        with self._lock:
+            if match is None:
+                count = len(self._data)
+                self._data.clear()
+                return count
+            doomed = [key for key in self._data if match(key)]
+            for key in doomed:
+                del self._data[key]
+            return len(doomed)
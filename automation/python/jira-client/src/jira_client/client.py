@@ -1,10 +1,19 @@
 import requests
+from requests.adapters import HTTPAdapter
 from requests.auth import HTTPBasicAuth
 
+from jira_client.api.changelog import ChangelogAPI
 from jira_client.api.comments import CommentsAPI
 from jira_client.api.issues import IssuesAPI
 from jira_client.api.projects import ProjectsAPI
+from jira_client.api.upsert import UpsertAPI
+from jira_client.api.users import UsersAPI
+from jira_client.buffer import WriteBuffer
+from jira_client.cache.issue_cache import IssueCache
+from jira_client.codec import JsonCodec
 from jira_client.config import AUTH_BEARER, JiraConfig
+from jira_client.instrumentation import RequestHook
+from jira_client.transport import Transport, accept_encoding
 
 
 class JiraClient:
@@ -17,17 +26,63 @@ class JiraClient:
         client = JiraClient.from_env()            # loads .env automatically
         projects = client.projects.get_all()
         issue = client.issues.get("PROJ-1")
+
+    Thread safety: a single client may be shared by many worker threads. The
+    session's connection pool is sized from ``JiraConfig.pool_maxsize`` (never below
+    ``max_workers``); for large worker pools set ``pool_maxsize`` to the number of
+    threads and ``pool_block=True`` so connections are reused instead of churned.
+    Do not mutate the session (headers, auth) while requests are in flight.
+
+    JSON bodies are encoded and decoded with ``codec`` (by default the backend named
+    by ``JiraConfig.json_backend``); the codec in use is available as ``client.codec``.
+
+    ``hooks`` observe every request (see :mod:`jira_client.instrumentation`); more
+    can be added later with ``client.hooks.append(hook)``.
     """
 
-    def __init__(self, config: JiraConfig) -> None:
+    def __init__(
+        self,
+        config: JiraConfig,
+        codec: JsonCodec | None = None,
+        hooks: list[RequestHook] | None = None,
+    ) -> None:
         self._config = config
         self._session = self._build_session()
-        self.projects = ProjectsAPI(config, self._session)
-        self.issues = IssuesAPI(config, self._session)
-        self.comments = CommentsAPI(config, self._session)
+        # One transport per client: retries and rate-limit pacing are shared by all groups.
+        self._transport = Transport.from_config(self._session, config, codec, hooks)
+        self.codec = self._transport.codec
+        self.hooks = self._transport.hooks
+        self.cache = (
+            IssueCache(config.cache_path, config.cache_max_age, self.codec)
+            if config.cache_path
+            else None
+        )
+        self.projects = ProjectsAPI(config, self._session, self._transport)
+        self.issues = IssuesAPI(config, self._session, self._transport, self.cache)
+        self.comments = CommentsAPI(config, self._session, self._transport)
+        self.changelog = ChangelogAPI(config, self._session, self._transport, self.issues)
+        self.users = UsersAPI(config, self._session, self._transport, self.cache)
+        self.upsert = UpsertAPI(config, self._session, self._transport, self.issues)
+
+    def buffered(self, max_pending: int = 100, max_workers: int | None = None) -> WriteBuffer:
+        """Return a :class:`~jira_client.buffer.WriteBuffer` over this client's issues.
+
+        Use it as a context manager: updates, assignments and watchers queued inside the
+        block are merged per issue and sent concurrently when it exits (or whenever
+        ``max_pending`` issues are queued).
+        """
+        return WriteBuffer(self.issues, max_pending, max_workers)
 
     def _build_session(self) -> requests.Session:
         session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self._config.pool_connections,
+            pool_maxsize=max(self._config.pool_maxsize, self._config.max_workers),
+            pool_block=self._config.pool_block,
+            max_retries=0,  # retries are handled by Transport
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
         if self._config.auth_type == AUTH_BEARER:
             session.headers["Authorization"] = f"Bearer {self._config.api_token}"
         else:
@@ -36,6 +91,7 @@ class JiraClient:
             {
                 "Accept": "application/json",
                 "Content-Type": "application/json",
+                "Accept-Encoding": accept_encoding() if self._config.compression else "identity",
             }
         )
         return session
@@ -0,0 +1,98 @@
+"""Single-flight coalescing of identical concurrent reads."""
+
+import json
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Hashable
+from typing import Any, TypeVar
+
+R = TypeVar("R")
+
+
+class _Call:
+    __slots__ = ("done", "result", "error", "expires")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+        self.expires = 0.0
+
+
+class SingleFlight:
+    """Runs one call per key at a time and shares its outcome with concurrent callers.
+
+    The first caller for a key (the leader) runs ``fn``; callers arriving while it is
+    in flight wait and receive the same result, or the same exception. With a
+    ``window`` > 0, a successful result keeps being served for that many seconds
+    after the call completes. Results are shared objects: treat them as read-only.
+
+    Safe to use from many threads.
+    """
+
+    def __init__(self, window: float = 0.0) -> None:
+        self.window = window
+        self._lock = threading.Lock()
+        self._calls: dict[Hashable, _Call] = {}
+        self._expiry: deque[tuple[float, Hashable, _Call]] = deque()
+
+    def do(self, key: Hashable, fn: Callable[[], R]) -> R:
+        """Return ``fn()``, sharing one execution among concurrent callers of ``key``."""
+        now = time.monotonic()
+        with self._lock:
+            self._prune(now)
+            call = self._calls.get(key)
+            leader = call is None or (call.done.is_set() and call.expires <= now)
+            if leader:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = result = fn()
+        except BaseException as exc:
+            call.error = exc
+            raise
+        finally:
+            with self._lock:
+                current = self._calls.get(key) is call  # False once forgotten
+                if current and self.window > 0 and call.error is None:
+                    call.expires = time.monotonic() + self.window
+                    self._expiry.append((call.expires, key, call))
+                elif current:
+                    del self._calls[key]
+            call.done.set()
+        return result
+
+    def forget(self) -> None:
+        """Drop every result, so the next call of each key runs again.
+
+        Calls still in flight become stale: they answer the callers already waiting
+        on them, but later callers start a new call and the stale result is not kept.
+        """
+        with self._lock:
+            self._calls.clear()
+            self._expiry.clear()
+
+    def _prune(self, now: float) -> None:
+        expiry = self._expiry
+        while expiry and expiry[0][0] <= now:
+            _, key, call = expiry.popleft()
+            if self._calls.get(key) is call:
+                del self._calls[key]
+
+
+def request_key(
+    path: str, params: dict[str, Any] | None, body: Any = None
+) -> tuple[str, tuple[Any, ...], str | None]:
+    """Return the coalescing key of a read: path, sorted query parameters and body."""
+    return (
+        path,
+        tuple(sorted((name, str(value)) for name, value in (params or {}).items())),
+        None if body is None else json.dumps(body, sort_keys=True),
+    )
@@ -0,0 +1,79 @@
+"""Pluggable JSON codec used for request bodies, response bodies and cached payloads.
+
+``orjson`` and ``msgspec`` decode and encode Jira's large search pages several times
+faster than the standard library; the client uses whichever is installed and falls
+back to :mod:`json` otherwise. Every codec works on ``bytes``: responses are decoded
+straight from the raw body and request bodies are encoded once, up front, so retries
+resend the same bytes.
+
+Install the fast backend with ``pip install "jira-client[fast-json]"``.
+"""
+
+import json
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+BACKENDS = ("orjson", "msgspec", "stdlib")
+
+
+@dataclass(frozen=True)
+class JsonCodec:
+    """A named pair of JSON functions.
+
+    ``loads`` accepts ``bytes`` or ``str``; ``dumps`` returns compact UTF-8 ``bytes``.
+    """
+
+    name: str
+    loads: Callable[[bytes | str], Any]
+    dumps: Callable[[Any], bytes]
+
+
+def _stdlib_dumps(obj: Any) -> bytes:
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+STDLIB = JsonCodec("stdlib", json.loads, _stdlib_dumps)
+
+
+def _orjson() -> JsonCodec:
+    import orjson
+
+    return JsonCodec("orjson", orjson.loads, orjson.dumps)
+
+
+def _msgspec() -> JsonCodec:
+    import msgspec
+
+    return JsonCodec("msgspec", msgspec.json.decode, msgspec.json.encode)
+
+
+_FACTORIES: dict[str, Callable[[], JsonCodec]] = {
+    "orjson": _orjson,
+    "msgspec": _msgspec,
+    "stdlib": lambda: STDLIB,
+}
+
+
+def get_codec(backend: str = "auto") -> JsonCodec:
+    """Return the codec for ``backend``.
+
+    ``"auto"`` picks the fastest installed library (orjson, then msgspec, then the
+    standard library). Naming a backend that is not installed raises ImportError.
+    """
+    backend = backend.lower()
+    if backend == "auto":
+        for name in BACKENDS:
+            try:
+                return _FACTORIES[name]()
+            except ImportError:
+                continue
+    if backend not in _FACTORIES:
+        raise ValueError(f"Unknown JSON backend {backend!r}; expected 'auto' or one of {BACKENDS}")
+    try:
+        return _FACTORIES[backend]()
+    except ImportError as exc:
+        raise ImportError(
+            f"The {backend!r} JSON backend is not installed. Install it with: "
+            f"pip install {backend}"
+        ) from exc
@@ -11,11 +11,82 @@ AUTH_BEARER = "bearer"
 class JiraConfig:
     """Jira Cloud connection configuration.
 
+    domain:
+        Host name of the Jira Cloud site (``your-org.atlassian.net``). A value that
+        starts with ``http://`` or ``https://`` is used as the base URL as-is.
+
     auth_type:
         "basic"  — classic API token, uses HTTP Basic Auth (email + token).
                    Generate at https://id.atlassian.com/manage-profile/security/api-tokens
         "bearer" — OAuth 2.0 / scoped token, sent as 'Authorization: Bearer <token>'.
                    email is not required in this mode.
+
+    max_workers:
+        Default size of the thread pool used by concurrent operations
+        (parallel search, batched fetches, bulk writes).
+
+    max_retries / backoff_factor / max_backoff:
+        Retry policy for throttled (429) and transient (502/503/504, connection)
+        failures. ``Retry-After`` is honoured up to ``max_backoff`` (a longer one is
+        not waited for: the 429 is raised as ``JiraRateLimitError``); otherwise
+        full-jitter exponential backoff is used. Non-idempotent requests are only
+        retried on 429.
+
+    rate_limit / rate_limit_burst:
+        Client-wide pacing in requests per second (None disables pacing) and the
+        allowed burst. The rate adapts down on 429 and recovers on success.
+
+    pool_connections / pool_maxsize / pool_block:
+        HTTP connection pooling. ``pool_connections`` is the number of per-host pools
+        kept, ``pool_maxsize`` the number of keep-alive connections per host (raised
+        to at least ``max_workers``). With ``pool_block=True`` a thread waits for a
+        free connection instead of opening a throwaway one, which is the recommended
+        setting when one client is shared by a large worker pool.
+
+    connect_timeout / read_timeout:
+        Seconds to wait for a connection and for each read (None waits forever).
+
+    compression:
+        Negotiate compressed responses (gzip/deflate, plus brotli when the ``brotli``
+        or ``brotlicffi`` package is installed).
+
+    coalesce_reads / coalesce_window:
+        Opt-in single-flight coalescing of GETs: concurrent identical reads (same
+        path and query parameters) share one request and its decoded result. With
+        ``coalesce_window`` > 0 a result keeps being shared for that many seconds
+        after it arrives; any write through the client discards shared results.
+
+    json_backend:
+        JSON library used for request and response bodies and cached payloads:
+        ``"orjson"``, ``"msgspec"``, ``"stdlib"`` or ``"auto"`` (the fastest one
+        installed).
+
+    cache_path / cache_max_age:
+        Optional SQLite issue cache. When ``cache_path`` is set, ``issues.get``,
+        ``get_many`` and ``search`` read through the cache, serving entries younger
+        than ``cache_max_age`` seconds, and ``issues.sync(project)`` refreshes it
+        incrementally.
+
+    metadata_cache_ttl / metadata_cache_size / metadata_cache_etag:
+        In-process cache for project metadata (key → id, issue types, components,
+        versions, priorities): entry lifetime in seconds (0 disables caching),
+        maximum number of entries (LRU eviction), and whether expired entries are
+        revalidated with ``If-None-Match`` instead of being downloaded again.
+
+    user_cache_ttl / user_cache_size:
+        Lifetime in seconds and maximum entry count (LRU eviction) of ``users`` lookup
+        results (email or name → account). With ``cache_path`` set, results are also
+        persisted in the SQLite cache and reused across runs for the same lifetime.
+
+    user_miss_ttl:
+        Lifetime in seconds of ``users`` lookups that matched no single account, kept
+        short so that an account created or fixed meanwhile is found; 0 disables
+        caching them. Misses are never persisted.
+
+    issue_fields:
+        Default field projection for issue reads (``get``, ``get_many`` and the
+        searches) when a call does not pass ``fields``. None fetches every field the
+        ``Issue`` model uses; a subset returns partial issues with smaller payloads.
     """
 
     domain: str
@@ -23,9 +94,37 @@ class JiraConfig:
     email: str = ""
     auth_type: str = AUTH_BASIC
     default_project: str | None = None
+    max_workers: int = 8
+    max_retries: int = 4
+    backoff_factor: float = 0.5
+    max_backoff: float = 30.0
+    rate_limit: float | None = None
+    rate_limit_burst: int | None = None
+    pool_connections: int = 10
+    pool_maxsize: int = 32
+    pool_block: bool = False
+    connect_timeout: float | None = 10.0
+    read_timeout: float | None = 60.0
+    compression: bool = True
+    json_backend: str = "auto"
+    coalesce_reads: bool = False
+    coalesce_window: float = 0.0
+    cache_path: str | None = None
+    cache_max_age: float = 300.0
+    metadata_cache_ttl: float = 600.0
+    metadata_cache_size: int = 256
+    metadata_cache_etag: bool = True
+    user_cache_ttl: float = 86400.0
+    user_cache_size: int = 4096
+    user_miss_ttl: float = 300.0
+    issue_fields: list[str] | None = None
 
     @property
     def base_url(self) -> str:
+        # A domain may carry its own scheme (e.g. "http://127.0.0.1:8080" for a local
+        # stand-in server); a bare host name is served over HTTPS.
+        if self.domain.startswith(("http://", "https://")):
+            return f"{self.domain.rstrip('/')}/rest/api/3"
         return f"https://{self.domain}/rest/api/3"
 
     @classmethod
@@ -56,4 +155,21 @@ class JiraConfig:
             email=email,
             auth_type=auth_type,
             default_project=os.getenv("JIRA_PROJECT"),
+            max_workers=int(os.getenv("JIRA_MAX_WORKERS", "8")),
+            max_retries=int(os.getenv("JIRA_MAX_RETRIES", "4")),
+            rate_limit=float(rate) if (rate := os.getenv("JIRA_RATE_LIMIT")) else None,
+            pool_maxsize=int(os.getenv("JIRA_POOL_MAXSIZE", "32")),
+            connect_timeout=float(os.getenv("JIRA_CONNECT_TIMEOUT", "10")),
+            read_timeout=float(os.getenv("JIRA_READ_TIMEOUT", "60")),
+            json_backend=os.getenv("JIRA_JSON_BACKEND", "auto"),
+            coalesce_reads=os.getenv("JIRA_COALESCE_READS", "").lower() in ("1", "true", "yes"),
+            coalesce_window=float(os.getenv("JIRA_COALESCE_WINDOW", "0")),
+            cache_path=os.getenv("JIRA_CACHE_PATH") or None,
+            cache_max_age=float(os.getenv("JIRA_CACHE_MAX_AGE", "300")),
+            metadata_cache_ttl=float(os.getenv("JIRA_METADATA_CACHE_TTL", "600")),
+            user_cache_ttl=float(os.getenv("JIRA_USER_CACHE_TTL", "86400")),
+            user_miss_ttl=float(os.getenv("JIRA_USER_MISS_TTL", "300")),
+            issue_fields=[f.strip() for f in fields.split(",") if f.strip()]
+            if (fields := os.getenv("JIRA_ISSUE_FIELDS"))
+            else None,
         )
@@ -18,5 +18,15 @@ class JiraValidationError(JiraClientError):
     """Raised when the request payload is invalid (400)."""
 
 
+class JiraFieldNotLoadedError(JiraClientError, AttributeError):
+    """Raised when reading an Issue field that was not included in the requested fields."""
+
+
 class JiraRateLimitError(JiraClientError):
-    """Raised when the API rate limit is exceeded (429)."""
+    """Raised when the API rate limit is exceeded (429) and retries are exhausted."""
+
+    def __init__(
+        self, message: str, status_code: int | None = None, retry_after: float | None = None
+    ) -> None:
+        super().__init__(message, status_code)
+        self.retry_after = retry_after
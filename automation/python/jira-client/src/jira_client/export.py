@@ -0,0 +1,359 @@
+"""Stream the results of a JQL query to JSONL, CSV or Parquet files.
+
+Issues are fetched page by page and written as they arrive, so memory use does not
+grow with the size of the result. Each row holds ``id``, ``key`` and one column per
+requested field, flattened to plain values:
+
+- objects become their display value (``displayName``, ``name``, ``value`` or ``key``),
+  except ``project`` and ``parent`` which become their key;
+- ADF rich text becomes plain text;
+- lists become lists of such values (joined with ``"; "`` in CSV).
+
+With a checkpoint file, an interrupted export resumes after the last page that was
+safely written instead of starting over::
+
+    from jira_client.export import export_issues
+
+    export_issues(client, "project = MYPROJ ORDER BY key", "myproj.jsonl",
+                  checkpoint="myproj.ckpt")
+"""
+
+import csv
+import json
+import os
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from jira_client.api.issues import _ISSUE_FIELDS
+from jira_client.exceptions import JiraClientError
+from jira_client.models.issue import _parse_datetime
+from jira_client.utils import adf_to_text
+
+if TYPE_CHECKING:
+    from jira_client.client import JiraClient
+
+FORMATS = ("jsonl", "csv", "parquet")
+
+_DATETIME_FIELDS = frozenset(
+    {"created", "updated", "resolutiondate", "lastViewed", "statuscategorychangedate"}
+)
+_LIST_FIELDS = frozenset({"labels", "components", "fixVersions", "versions", "subtasks"})
+_KEY_FIELDS = frozenset({"project", "parent"})
+_DISPLAY_KEYS = ("displayName", "name", "value", "key")
+
+# Rows held in memory before they are written out as one Parquet row group.
+_ROW_GROUP_ROWS = 10_000
+
+
+@dataclass
+class ExportResult:
+    """Summary of a finished export."""
+
+    path: Path
+    format: str
+    rows: int
+    pages: int
+    resumed: bool = False
+
+
+def export_issues(
+    client: "JiraClient",
+    jql: str,
+    path: str | Path,
+    format: str | None = None,
+    fields: list[str] | None = None,
+    page_size: int = 100,
+    checkpoint: str | Path | None = None,
+    rows_per_file: int = 100_000,
+) -> ExportResult:
+    """Export every issue matching ``jql`` to ``path``.
+
+    ``format`` is one of ``"jsonl"``, ``"csv"`` or ``"parquet"`` and defaults to the
+    suffix of ``path``. Parquet output (requires ``pyarrow``) is a directory of
+    ``part-NNNNN.parquet`` files of about ``rows_per_file`` rows each, written in
+    row groups of at most 10,000 rows so memory use stays bounded.
+
+    When ``checkpoint`` is given, progress is saved there after every durable write
+    and an existing checkpoint for the same query resumes the export; the file is
+    removed once the export completes. Pagination tokens are short-lived, so resume
+    an interrupted export soon, and use a JQL with a stable ``ORDER BY``.
+    """
+    path = Path(path)
+    format = (format or path.suffix.lstrip(".")).lower()
+    if format not in FORMATS:
+        raise ValueError(f"Unsupported export format {format!r}; expected one of {FORMATS}")
+    fields = list(fields or _ISSUE_FIELDS.split(","))
+    columns = ["id", "key", *fields]
+
+    job = {"jql": jql, "fields": fields, "format": format, "path": str(path)}
+    state = _load_checkpoint(checkpoint, job) if checkpoint else None
+    resumed = state is not None
+    state = state or {"start_at": 0, "next_page_token": None, "rows": 0, "pages": 0}
+
+    writer = _WRITERS[format](path, columns, state.get("writer"), rows_per_file)
+    try:
+        pages = client.issues._iter_pages(
+            jql,
+            page_size,
+            fields,
+            start_at=state["start_at"],
+            next_page_token=state["next_page_token"],
+        )
+        start_at = state["start_at"]
+        for page in pages:
+            issues = page.get("issues", [])
+            start_at += len(issues)
+            state["rows"] += len(issues)
+            state["pages"] += 1
+            durable = writer.write([_flatten(issue, fields) for issue in issues])
+            if checkpoint and durable:
+                state.update(
+                    start_at=start_at,
+                    next_page_token=page.get("nextPageToken"),
+                    writer=writer.state(),
+                )
+                _save_checkpoint(checkpoint, {**job, **state})
+        writer.close()
+    except BaseException:
+        writer.abort()
+        raise
+
+    if checkpoint:
+        Path(checkpoint).unlink(missing_ok=True)
+    return ExportResult(path, format, state["rows"], state["pages"], resumed)
+
+
+# ----------------------------------------------------------------------
+# Rows
+# ----------------------------------------------------------------------
+
+
+def _flatten(issue: dict[str, Any], fields: list[str]) -> dict[str, Any]:
+    """Turn a raw search result into a flat row."""
+    values = issue.get("fields") or {}
+    row: dict[str, Any] = {"id": issue["id"], "key": issue["key"]}
+    for name in fields:
+        value = values.get(name)
+        if name in _KEY_FIELDS and isinstance(value, dict):
+            value = value.get("key")
+        row[name] = _plain(value)
+    return row
+
+
+def _plain(value: Any) -> Any:
+    if isinstance(value, dict):
+        if value.get("type") == "doc":
+            return adf_to_text(value)
+        for key in _DISPLAY_KEYS:
+            if key in value:
+                return value[key]
+        return json.dumps(value, separators=(",", ":"))
+    if isinstance(value, list):
+        return [_plain(item) for item in value]
+    return value
+
+
+# ----------------------------------------------------------------------
+# Checkpoints
+# ----------------------------------------------------------------------
+
+
+def _load_checkpoint(checkpoint: str | Path, job: dict[str, Any]) -> dict[str, Any] | None:
+    try:
+        with open(checkpoint, encoding="utf-8") as fh:
+            state = json.load(fh)
+    except FileNotFoundError:
+        return None
+    if any(state.get(name) != value for name, value in job.items()):
+        raise JiraClientError(
+            f"Checkpoint {checkpoint} belongs to a different export; delete it to start over"
+        )
+    return state
+
+
+def _save_checkpoint(checkpoint: str | Path, state: dict[str, Any]) -> None:
+    """Write the checkpoint atomically, so a crash never leaves it half-written."""
+    tmp = f"{checkpoint}.tmp"
+    with open(tmp, "w", encoding="utf-8") as fh:
+        json.dump(state, fh)
+        fh.flush()
+        os.fsync(fh.fileno())
+    os.replace(tmp, checkpoint)
+
+
+# ----------------------------------------------------------------------
+# Writers
+# ----------------------------------------------------------------------
+
+
+class _FileWriter(ABC):
+    """Appends rows to a single text file; durable after every page.
+
+    On resume, anything written after the last checkpoint is truncated away first.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        columns: list[str],
+        state: dict[str, Any] | None,
+        rows_per_file: int,
+    ) -> None:
+        self._columns = columns
+        if state is not None:
+            with open(path, "r+b") as fh:
+                fh.truncate(state["offset"])
+            self._file = open(path, "a", encoding="utf-8", newline="")
+        else:
+            self._file = open(path, "w", encoding="utf-8", newline="")
+            self._start()
+
+    def _start(self) -> None:
+        """Write whatever precedes the rows in a new file (nothing by default)."""
+
+    @abstractmethod
+    def _write_rows(self, rows: list[dict[str, Any]]) -> None:
+        """Append ``rows`` to the file."""
+
+    def write(self, rows: list[dict[str, Any]]) -> bool:
+        self._write_rows(rows)
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        return True
+
+    def state(self) -> dict[str, Any]:
+        return {"offset": os.fstat(self._file.fileno()).st_size}
+
+    def close(self) -> None:
+        self._file.close()
+
+    def abort(self) -> None:
+        self._file.close()
+
+
+class _JsonlWriter(_FileWriter):
+    def _write_rows(self, rows: list[dict[str, Any]]) -> None:
+        self._file.writelines(json.dumps(row, ensure_ascii=False) + "\n" for row in rows)
+
+
+class _CsvWriter(_FileWriter):
+    def _start(self) -> None:
+        csv.writer(self._file).writerow(self._columns)
+
+    def _write_rows(self, rows: list[dict[str, Any]]) -> None:
+        writer = csv.writer(self._file)
+        writer.writerows(
+            ["; ".join(map(str, v)) if isinstance(v, list) else v for v in row.values()]
+            for row in rows
+        )
+
+
+class _ParquetWriter:
+    """Streams rows into ``part-NNNNN.parquet`` files of about ``rows_per_file`` rows.
+
+    Rows are converted to columns as they arrive and written as a row group whenever
+    ``_ROW_GROUP_ROWS`` of them are buffered. A part file is written under a temporary
+    name and renamed into place once it holds ``rows_per_file`` rows, so the
+    directory only ever contains complete files; a write is durable when a part file
+    has just been completed.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        columns: list[str],
+        state: dict[str, Any] | None,
+        rows_per_file: int,
+    ) -> None:
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as exc:
+            raise ImportError(
+                "Parquet export requires pyarrow. Install it with: "
+                "pip install 'jira-client[parquet]'"
+            ) from exc
+        self._pa, self._pq = pa, pq
+        self._path = path
+        self._rows_per_file = rows_per_file
+        self._group_rows = min(_ROW_GROUP_ROWS, rows_per_file)
+        self._schema = pa.schema([(name, _arrow_type(pa, name)) for name in columns])
+        self._columns: dict[str, list[Any]] = {name: [] for name in columns}
+        self._buffered = 0  # rows in self._columns
+        self._part: Any = None  # pq.ParquetWriter for the part being written
+        self._part_rows = 0
+        self._parts = state["parts"] if state else 0
+        path.mkdir(parents=True, exist_ok=True)
+        for stale in path.glob("part-*.parquet"):
+            if int(stale.stem.split("-")[1]) >= self._parts:
+                stale.unlink()
+
+    def write(self, rows: list[dict[str, Any]]) -> bool:
+        for row in rows:
+            for name, value in row.items():
+                self._columns[name].append(_arrow_value(name, value))
+        self._buffered += len(rows)
+        part_full = self._part_rows + self._buffered >= self._rows_per_file
+        if part_full or self._buffered >= self._group_rows:
+            self._write_group()
+        if not part_full:
+            return False
+        self._finish_part()
+        return True
+
+    def state(self) -> dict[str, Any]:
+        return {"parts": self._parts}
+
+    def close(self) -> None:
+        if self._buffered or (self._part is None and not self._parts):
+            self._write_group()
+        if self._part is not None:
+            self._finish_part()
+
+    def abort(self) -> None:
+        if self._part is not None:
+            self._part.close()
+            self._tmp().unlink(missing_ok=True)
+            self._part = None
+
+    def _tmp(self) -> Path:
+        return self._path / f"part-{self._parts:05d}.tmp"
+
+    def _write_group(self) -> None:
+        table = self._pa.table(self._columns, schema=self._schema)
+        if self._part is None:
+            self._part = self._pq.ParquetWriter(self._tmp(), self._schema)
+        self._part.write_table(table)
+        self._part_rows += self._buffered
+        self._columns = {name: [] for name in self._schema.names}
+        self._buffered = 0
+
+    def _finish_part(self) -> None:
+        self._part.close()
+        self._part = None
+        os.replace(self._tmp(), self._path / f"part-{self._parts:05d}.parquet")
+        self._parts += 1
+        self._part_rows = 0
+
+
+def _arrow_type(pa: Any, name: str) -> Any:
+    if name in _DATETIME_FIELDS:
+        return pa.timestamp("ms", tz="UTC")
+    if name in _LIST_FIELDS:
+        return pa.list_(pa.string())
+    return pa.string()
+
+
+def _arrow_value(name: str, value: Any) -> Any:
+    if value is None:
+        return None
+    if name in _DATETIME_FIELDS:
+        return _parse_datetime(value)
+    if name in _LIST_FIELDS:
+        return [str(item) for item in (value if isinstance(value, list) else [value])]
+    return value if isinstance(value, str) else json.dumps(value)
+
+
+_WRITERS: dict[str, Any] = {"jsonl": _JsonlWriter, "csv": _CsvWriter, "parquet": _ParquetWriter}
@@ -0,0 +1,254 @@
+"""Per-request instrumentation: hooks, an in-memory metrics collector and tracing.
+
+Every request sent through a client's transport can be observed by hooks. A hook
+subclasses :class:`RequestHook` and overrides ``before_request`` and/or
+``after_request``; both receive the same :class:`RequestEvent`, filled in with the
+outcome before ``after_request`` runs. Without hooks nothing is recorded and no
+event is created. Hooks run on the thread (or event loop) that sends the request,
+so they should be quick; an exception raised by a hook propagates to the caller.
+
+Typical use::
+
+    from jira_client.instrumentation import MetricsCollector
+
+    metrics = MetricsCollector()
+    client = JiraClient(config, hooks=[metrics])
+    ...
+    print(metrics.report())
+"""
+
+import re
+import threading
+import time
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from typing import Any
+
+# Upper bounds, in seconds, of the latency histogram buckets (the last one is open).
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, float("inf"))
+
+_ISSUE_KEY_RE = re.compile(r"^[A-Z][A-Z0-9_]*-\d+$")
+_PROJECT_KEY_RE = re.compile(r"^[A-Z][A-Z0-9_]*$")
+
+
+def path_template(path: str) -> str:
+    """Collapse the ids in an API path so that requests group by endpoint.
+
+    ``issue/PROJ-12/comment/10001`` becomes ``issue/{key}/comment/{id}`` and
+    ``project/PROJ/versions`` becomes ``project/{key}/versions``.
+    """
+    segments = path.strip("/").split("?", 1)[0].split("/")
+    for index, segment in enumerate(segments):
+        if segment.isdigit():
+            segments[index] = "{id}"
+        elif _ISSUE_KEY_RE.match(segment) or (
+            index and segments[index - 1] == "project" and _PROJECT_KEY_RE.match(segment)
+        ):
+            segments[index] = "{key}"
+    return "/".join(segments)
+
+
+@dataclass
+class RequestEvent:
+    """One logical request, including any retries.
+
+    ``latency`` is the wall time of the whole call in seconds, including pacing
+    waits and retry backoff; ``retries`` counts the attempts after the first.
+    ``status`` is None when no response was received, in which case ``error``
+    holds the exception. ``context`` is scratch space for hooks, e.g. to carry a
+    span from ``before_request`` to ``after_request``.
+    """
+
+    method: str
+    path: str
+    url: str
+    status: int | None = None
+    latency: float = 0.0
+    bytes_sent: int = 0
+    bytes_received: int = 0
+    retries: int = 0
+    error: BaseException | None = None
+    context: dict[Any, Any] = field(default_factory=dict, repr=False)
+    started: float = field(default_factory=time.perf_counter, repr=False)
+
+    @property
+    def ok(self) -> bool:
+        return self.status is not None and self.status < 400
+
+
+class RequestHook:
+    """Base class for request hooks; both callbacks do nothing by default."""
+
+    def before_request(self, event: RequestEvent) -> None:
+        """Called before the first attempt; only ``method``, ``path`` and ``url`` are set."""
+
+    def after_request(self, event: RequestEvent) -> None:
+        """Called once the request has completed, failed or run out of retries."""
+
+
+# ----------------------------------------------------------------------
+# Metrics
+# ----------------------------------------------------------------------
+
+
+class EndpointStats:
+    """Running totals and a latency histogram for one ``METHOD path`` endpoint."""
+
+    __slots__ = (
+        "count",
+        "errors",
+        "retries",
+        "bytes_sent",
+        "bytes_received",
+        "latency_sum",
+        "latency_max",
+        "buckets",
+    )
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.errors = 0
+        self.retries = 0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.latency_sum = 0.0
+        self.latency_max = 0.0
+        self.buckets = [0] * len(LATENCY_BUCKETS)
+
+    def add(self, event: RequestEvent) -> None:
+        self.count += 1
+        self.errors += not event.ok
+        self.retries += event.retries
+        self.bytes_sent += event.bytes_sent
+        self.bytes_received += event.bytes_received
+        self.latency_sum += event.latency
+        self.latency_max = max(self.latency_max, event.latency)
+        self.buckets[bisect_left(LATENCY_BUCKETS, event.latency)] += 1
+
+    def quantile(self, q: float) -> float:
+        """Estimate a latency quantile as the upper bound of the bucket it falls in."""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for bound, n in zip(LATENCY_BUCKETS, self.buckets):
+            seen += n
+            if seen >= rank:
+                return min(bound, self.latency_max)
+        return self.latency_max
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "retries": self.retries,
+            "bytes_sent": self.bytes_sent,
+            "bytes_received": self.bytes_received,
+            "latency_total": self.latency_sum,
+            "latency_mean": self.latency_sum / self.count if self.count else 0.0,
+            "latency_p50": self.quantile(0.5),
+            "latency_p99": self.quantile(0.99),
+            "latency_max": self.latency_max,
+            "histogram": dict(zip(map(str, LATENCY_BUCKETS), self.buckets)),
+        }
+
+
+class MetricsCollector(RequestHook):
+    """Thread-safe in-memory metrics per endpoint (``"GET issue/{key}"``).
+
+    Records counts, errors (status >= 400 or no response), retries, bytes in and
+    out, and a latency histogram. Percentiles are estimated from the histogram.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._endpoints: dict[str, EndpointStats] = {}
+
+    def after_request(self, event: RequestEvent) -> None:
+        name = f"{event.method} {event.path}"
+        with self._lock:
+            stats = self._endpoints.get(name)
+            if stats is None:
+                stats = self._endpoints[name] = EndpointStats()
+            stats.add(event)
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        """Return the metrics of every endpoint, busiest (by total latency) first."""
+        with self._lock:
+            items = [(name, stats.as_dict()) for name, stats in self._endpoints.items()]
+        return dict(sorted(items, key=lambda item: -item[1]["latency_total"]))
+
+    def reset(self) -> None:
+        with self._lock:
+            self._endpoints.clear()
+
+    def report(self, top: int | None = None) -> str:
+        """Return a plain-text table of the endpoints with the most total latency."""
+        rows = list(self.snapshot().items())[:top]
+        lines = [
+            f"{'endpoint':<40} {'count':>7} {'errors':>6} {'retries':>7} "
+            f"{'total s':>9} {'p50 ms':>8} {'p99 ms':>8} {'KiB in':>9}"
+        ]
+        for name, m in rows:
+            lines.append(
+                f"{name:<40} {m['count']:>7} {m['errors']:>6} {m['retries']:>7} "
+                f"{m['latency_total']:>9.2f} {m['latency_p50'] * 1000:>8.1f} "
+                f"{m['latency_p99'] * 1000:>8.1f} {m['bytes_received'] / 1024:>9.1f}"
+            )
+        return "\n".join(lines)
+
+
+# ----------------------------------------------------------------------
+# Tracing
+# ----------------------------------------------------------------------
+
+
+class OpenTelemetryHook(RequestHook):
+    """Wraps every request in an OpenTelemetry client span.
+
+    Spans are named ``"{METHOD} {path}"`` and carry the HTTP semantic-convention
+    attributes (method, URL, status code, resend count, body sizes); responses with
+    status >= 400 and failed requests mark the span as an error. Spans started from
+    a thread with an active span become its children.
+
+    Requires ``opentelemetry-api`` (``pip install "jira-client[otel]"``); pass a
+    ``tracer`` or let one be obtained from the global tracer provider.
+    """
+
+    def __init__(self, tracer: Any = None) -> None:
+        try:
+            from opentelemetry import trace
+        except ImportError as exc:
+            raise ImportError(
+                "OpenTelemetryHook requires opentelemetry-api. Install it with: "
+                "pip install 'jira-client[otel]'"
+            ) from exc
+        self._trace = trace
+        self._tracer = tracer or trace.get_tracer("jira_client")
+
+    def before_request(self, event: RequestEvent) -> None:
+        event.context[self] = self._tracer.start_span(
+            f"{event.method} {event.path}",
+            kind=self._trace.SpanKind.CLIENT,
+            attributes={
+                "http.request.method": event.method,
+                "url.full": event.url,
+                "url.template": event.path,
+            },
+        )
+
+    def after_request(self, event: RequestEvent) -> None:
+        span = event.context.pop(self, None)
+        if span is None:
+            return
+        span.set_attribute("http.request.body.size", event.bytes_sent)
+        span.set_attribute("http.response.body.size", event.bytes_received)
+        if event.retries:
+            span.set_attribute("http.request.resend_count", event.retries)
+        if event.status is not None:
+            span.set_attribute("http.response.status_code", event.status)
+        if event.error is not None:
+            span.record_exception(event.error)
+        if not event.ok:
+            span.set_status(self._trace.Status(self._trace.StatusCode.ERROR))
+        span.end()
@@ -1,14 +1,22 @@
+from jira_client.models.changelog import FieldChange
 from jira_client.models.comment import Comment, CommentCreate, CommentUpdate
 from jira_client.models.issue import (
+    BulkCreateError,
+    BulkCreateResult,
+    BulkTransitionResult,
+    CreatedIssue,
     Issue,
+    IssueBatchResult,
     IssueCreate,
     IssueSearchResult,
     IssueType,
     IssueUpdate,
     Priority,
     Status,
+    TransitionOutcome,
 )
 from jira_client.models.project import Project, ProjectCategory
+from jira_client.models.user import User
 
 __all__ = [
     "Project",
@@ -20,7 +28,15 @@ __all__ = [
     "Priority",
     "Status",
     "IssueSearchResult",
+    "CreatedIssue",
+    "BulkCreateError",
+    "BulkCreateResult",
+    "IssueBatchResult",
+    "BulkTransitionResult",
+    "TransitionOutcome",
     "Comment",
     "CommentCreate",
     "CommentUpdate",
+    "FieldChange",
+    "User",
 ]
@@ -0,0 +1,48 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+from jira_client.models.issue import _parse_datetime
+
+
+@dataclass(frozen=True, slots=True)
+class FieldChange:
+    """One field change from an issue's changelog.
+
+    ``field`` is the field id when Jira reports one (``"status"``, ``"assignee"``,
+    ``"customfield_10010"``), else the field name. ``from_value`` / ``to_value`` hold
+    the raw values (status ids, account ids) and ``from_string`` / ``to_string`` their
+    display form (``"In Progress"``). ``history_id`` identifies the changelog entry;
+    several changes made together share it and its ``created`` timestamp.
+    """
+
+    issue_key: str
+    field: str
+    from_value: str | None
+    from_string: str | None
+    to_value: str | None
+    to_string: str | None
+    created: datetime
+    author: str = ""  # account id; empty for changes made by automation
+    history_id: str = ""
+
+    @classmethod
+    def from_history(cls, issue_key: str, history: dict[str, Any]) -> list["FieldChange"]:
+        """Return the changes of one changelog entry (a "history" in Jira terms)."""
+        created = _parse_datetime(history["created"])
+        author = (history.get("author") or {}).get("accountId", "")
+        history_id = history.get("id", "")
+        return [
+            cls(
+                issue_key,
+                item.get("fieldId") or item.get("field", ""),
+                item.get("from"),
+                item.get("fromString"),
+                item.get("to"),
+                item.get("toString"),
+                created,
+                author,
+                history_id,
+            )
+            for item in history.get("items", [])
+        ]
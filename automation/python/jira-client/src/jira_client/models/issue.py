@@ -1,11 +1,68 @@
+from collections.abc import Callable, Iterable, Iterator
 from dataclasses import dataclass, field
+from dataclasses import fields as dataclass_fields
 from datetime import datetime
+from functools import lru_cache
 from typing import Any
 
+from jira_client.exceptions import JiraFieldNotLoadedError
 from jira_client.utils import adf_to_text, text_to_adf
 
+# Issue types, statuses and priorities repeat across thousands of issues; identical
+# ones are shared (they are immutable) instead of being rebuilt for every issue. The
+# least recently used are dropped first, so hot values stay shared on large scans.
+_INTERN_LIMIT = 4096
 
-@dataclass
+
+@lru_cache(maxsize=_INTERN_LIMIT)
+def _intern(cls: type, *values: Any) -> Any:
+    return cls(*values)
+
+
+# Issue attribute → Jira field to request for it.
+_API_FIELDS = {
+    "summary": "summary",
+    "issue_type": "issuetype",
+    "status": "status",
+    "project_key": "project",
+    "description": "description",
+    "priority": "priority",
+    "assignee": "assignee",
+    "reporter": "reporter",
+    "labels": "labels",
+    "components": "components",
+    "created": "created",
+    "updated": "updated",
+    "resolved": "resolutiondate",
+}
+
+# Jira field → Issue attribute; Jira leaves out empty fields, and a requested list
+# field it left out is an empty list rather than None.
+_ATTRS = {api: attr for attr, api in _API_FIELDS.items()}
+_LIST_ATTRS = frozenset({"labels", "components"})
+
+_NOT_LOADED = object()
+
+
+@lru_cache(maxsize=256)
+def _requested(fields: tuple[str, ...] | None) -> frozenset[str]:
+    """Return the ``_ATTRS`` fields a projection asks for (None: the full default set)."""
+    if fields is None:
+        return frozenset(_ATTRS)
+    wanted = set(_ATTRS) if {"*all", "*navigable"} & set(fields) else set()
+    wanted.update(f for f in fields if f in _ATTRS)
+    wanted.difference_update(f[1:] for f in fields if f.startswith("-"))
+    return frozenset(wanted)
+
+
+_ALL_REQUESTED = _requested(None)
+
+
+def _parse_datetime(value: str | None) -> datetime | None:
+    return datetime.fromisoformat(value.replace("Z", "+00:00")) if value else None
+
+
+@dataclass(frozen=True, slots=True)
 class IssueType:
     """Represents a Jira issue type (Bug, Story, Task, …)."""
 
@@ -16,15 +73,16 @@ class IssueType:
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "IssueType":
-        return cls(
-            id=data["id"],
-            name=data["name"],
-            description=data.get("description", ""),
-            subtask=data.get("subtask", False),
+        return _intern(
+            cls,
+            data["id"],
+            data["name"],
+            data.get("description", ""),
+            data.get("subtask", False),
         )
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Priority:
     """Represents an issue priority (Highest, High, Medium, Low, Lowest)."""
 
@@ -33,10 +91,10 @@ class Priority:
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "Priority":
-        return cls(id=data["id"], name=data["name"])
+        return _intern(cls, data["id"], data["name"])
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Status:
     """Represents the workflow status of an issue."""
 
@@ -46,16 +104,64 @@ class Status:
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "Status":
-        return cls(
-            id=data["id"],
-            name=data["name"],
-            category=data.get("statusCategory", {}).get("key", ""),
-        )
+        category = (data.get("statusCategory") or {}).get("key", "")
+        return _intern(cls, data["id"], data["name"], category)
 
 
-@dataclass
+class _LazyField:
+    """Wraps the slot of an attribute converted from its raw API value on first access.
+
+    The slot holds the raw value (recognised by its type, e.g. an ISO 8601 ``str``
+    for a timestamp) until the first read converts it and stores the result instead.
+    """
+
+    def __init__(self, slot: Any, raw_type: type, convert: Callable[[Any], Any]) -> None:
+        self._slot = slot
+        self._raw_type = raw_type
+        self._convert = convert
+
+    def __get__(self, obj: Any, objtype: type | None = None) -> Any:
+        if obj is None:
+            return self
+        value = self._slot.__get__(obj, objtype)  # unset slot: AttributeError
+        if type(value) is self._raw_type:
+            value = self._convert(value)
+            self._slot.__set__(obj, value)
+        return value
+
+    def __set__(self, obj: Any, value: Any) -> None:
+        self._slot.__set__(obj, value)
+
+    def __delete__(self, obj: Any) -> None:
+        self._slot.__delete__(obj)
+
+
+def _lazy(**converters: tuple[type, Callable[[Any], Any]]) -> Callable[[type], type]:
+    """Make slotted attributes convert lazily: ``name=(raw_type, convert)``."""
+
+    def wrap(cls: type) -> type:
+        for name, (raw_type, convert) in converters.items():
+            setattr(cls, name, _LazyField(getattr(cls, name), raw_type, convert))
+        return cls
+
+    return wrap
+
+
+@_lazy(
+    description=(dict, adf_to_text),
+    created=(str, _parse_datetime),
+    updated=(str, _parse_datetime),
+    resolved=(str, _parse_datetime),
+)
+@dataclass(slots=True, repr=False, eq=False)
 class Issue:
-    """Represents a Jira issue."""
+    """Represents a Jira issue.
+
+    A slotted dataclass, to keep large result sets compact. ``description`` and the
+    ``created`` / ``updated`` / ``resolved`` timestamps of issues built by
+    :meth:`from_dict` are converted from ADF / ISO 8601 on first access only.
+    Issues fetched with a field subset are partial; see :meth:`from_dict`.
+    """
 
     id: str
     key: str
@@ -73,35 +179,89 @@ class Issue:
     updated: datetime | None = None
     resolved: datetime | None = None
 
-    @classmethod
-    def from_dict(cls, data: dict[str, Any]) -> "Issue":
-        fields = data["fields"]
-
-        def _parse_dt(val: str | None) -> datetime | None:
-            return datetime.fromisoformat(val.replace("Z", "+00:00")) if val else None
+    def __repr__(self) -> str:
+        args = ", ".join(
+            f"{f.name}={getattr(self, f.name)!r}"
+            for f in dataclass_fields(self)
+            if self.is_loaded(f.name)
+        )
+        return f"{type(self).__name__}({args})"
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return all(
+            getattr(self, f.name, _NOT_LOADED) == getattr(other, f.name, _NOT_LOADED)
+            for f in dataclass_fields(self)
+        )
 
-        assignee = fields.get("assignee") or {}
-        reporter = fields.get("reporter") or {}
-        priority = Priority.from_dict(fields["priority"]) if fields.get("priority") else None
-        components = [c["name"] for c in fields.get("components", [])]
+    __hash__ = None  # type: ignore[assignment]  # mutable, like other dataclasses
 
-        return cls(
-            id=data["id"],
-            key=data["key"],
-            summary=fields["summary"],
-            issue_type=IssueType.from_dict(fields["issuetype"]),
-            status=Status.from_dict(fields["status"]),
-            project_key=fields["project"]["key"],
-            description=adf_to_text(fields.get("description")),
-            priority=priority,
-            assignee=assignee.get("displayName"),
-            reporter=reporter.get("displayName"),
-            labels=fields.get("labels", []),
-            components=components,
-            created=_parse_dt(fields.get("created")),
-            updated=_parse_dt(fields.get("updated")),
-            resolved=_parse_dt(fields.get("resolutiondate")),
-        )
+    @classmethod
+    def from_dict(cls, data: dict[str, Any], fields: Iterable[str] | None = None) -> "Issue":
+        """Build an issue from an API payload.
+
+        ``fields`` is the projection the payload was requested with (None for the full
+        default set). Jira omits empty fields, so a requested field missing from
+        ``data["fields"]`` is set to its empty value (None, or [] for lists). Fields
+        that were not requested are left unset: reading one raises
+        :class:`JiraFieldNotLoadedError`.
+        """
+        payload = data.get("fields") or {}
+        issue = cls.__new__(cls)
+        issue.id = data["id"]
+        issue.key = data["key"]
+        if "summary" in payload:
+            issue.summary = payload["summary"]
+        if "issuetype" in payload:
+            issue.issue_type = IssueType.from_dict(payload["issuetype"])
+        if "status" in payload:
+            issue.status = Status.from_dict(payload["status"])
+        if "project" in payload:
+            issue.project_key = payload["project"]["key"]
+        if "priority" in payload:
+            priority = payload["priority"]
+            issue.priority = Priority.from_dict(priority) if priority else None
+        if "assignee" in payload:
+            issue.assignee = (payload["assignee"] or {}).get("displayName")
+        if "reporter" in payload:
+            issue.reporter = (payload["reporter"] or {}).get("displayName")
+        if "labels" in payload:
+            issue.labels = list(payload["labels"] or [])  # payloads may be shared
+        if "components" in payload:
+            issue.components = [c["name"] for c in payload["components"] or []]
+        # Raw ADF / ISO 8601 values; converted by _LazyField when first read.
+        if "description" in payload:
+            issue.description = payload["description"]
+        if "created" in payload:
+            issue.created = payload["created"]
+        if "updated" in payload:
+            issue.updated = payload["updated"]
+        if "resolutiondate" in payload:
+            issue.resolved = payload["resolutiondate"]
+        requested = _ALL_REQUESTED if fields is None else _requested(tuple(fields))
+        for name in requested.difference(payload):
+            attr = _ATTRS[name]
+            setattr(issue, attr, [] if attr in _LIST_ATTRS else None)
+        return issue
+
+    def is_loaded(self, name: str) -> bool:
+        """Return True if attribute ``name`` was fetched (always True for id and key)."""
+        try:
+            getattr(self, name)
+        except JiraFieldNotLoadedError:
+            return False
+        return True
+
+    def __getattr__(self, name: str) -> Any:
+        # Only reached when a slot is unset, i.e. the field was not fetched.
+        if name in _API_FIELDS:
+            key = object.__getattribute__(self, "key")
+            raise JiraFieldNotLoadedError(
+                f"Field '{name}' was not fetched for {key}; "
+                f"include '{_API_FIELDS[name]}' in the requested fields"
+            )
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
 
 
 @dataclass
@@ -140,6 +300,100 @@ class IssueCreate:
         return {"fields": issue_fields}
 
 
+@dataclass
+class CreatedIssue:
+    """Lightweight reference to a newly created issue, returned without a follow-up GET."""
+
+    id: str
+    key: str
+    self_url: str = ""
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "CreatedIssue":
+        return cls(id=data["id"], key=data["key"], self_url=data.get("self", ""))
+
+
+@dataclass
+class BulkCreateError:
+    """An input item that Jira rejected during a bulk create."""
+
+    index: int  # position of the item in the list passed to bulk_create
+    status: int | None
+    message: str
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any], offset: int = 0) -> "BulkCreateError":
+        element = data.get("elementErrors") or {}
+        messages = list(element.get("errorMessages", []))
+        messages += [f"{name}: {msg}" for name, msg in element.get("errors", {}).items()]
+        return cls(
+            index=offset + data.get("failedElementNumber", 0),
+            status=data.get("status"),
+            message="; ".join(messages),
+        )
+
+
+@dataclass
+class BulkCreateResult:
+    """Outcome of a bulk create: created issues in input order, plus per-item errors.
+
+    Iterating, indexing and ``len()`` go to ``issues``, so code written against the
+    plain ``list[Issue]`` that ``bulk_create`` used to return keeps working.
+    """
+
+    issues: list["Issue | CreatedIssue"] = field(default_factory=list)
+    errors: list[BulkCreateError] = field(default_factory=list)
+    # Keys of created issues that could not be fetched; they are CreatedIssue in issues.
+    unhydrated: list[str] = field(default_factory=list)
+
+    def __iter__(self) -> Iterator["Issue | CreatedIssue"]:
+        return iter(self.issues)
+
+    def __len__(self) -> int:
+        return len(self.issues)
+
+    def __getitem__(self, index: int) -> "Issue | CreatedIssue":
+        return self.issues[index]
+
+
+@dataclass
+class IssueBatchResult:
+    """Issues fetched by key, in input order, plus the keys that could not be found."""
+
+    issues: list["Issue"] = field(default_factory=list)
+    missing: list[str] = field(default_factory=list)
+
+
+@dataclass
+class TransitionOutcome:
+    """What happened to one issue during a bulk transition."""
+
+    key: str
+    result: str  # "transitioned" | "skipped" (already in the target status) | "failed"
+    from_status: str | None = None  # None when the issue could not be read
+    message: str = ""
+    status_code: int | None = None  # HTTP status of the failing request, if any
+
+
+@dataclass
+class BulkTransitionResult:
+    """Outcome of a bulk transition: one entry per distinct input key, in input order."""
+
+    outcomes: list[TransitionOutcome] = field(default_factory=list)
+
+    @property
+    def transitioned(self) -> list[str]:
+        return [o.key for o in self.outcomes if o.result == "transitioned"]
+
+    @property
+    def skipped(self) -> list[str]:
+        return [o.key for o in self.outcomes if o.result == "skipped"]
+
+    @property
+    def failed(self) -> list[TransitionOutcome]:
+        return [o for o in self.outcomes if o.result == "failed"]
+
+
 @dataclass
 class IssueUpdate:
     """Data transfer object for updating an existing Jira issue.
@@ -183,13 +437,18 @@ class IssueSearchResult:
     start_at: int
     max_results: int
     issues: list[Issue]
+    next_page_token: str | None = None
 
     @classmethod
-    def from_dict(cls, data: dict[str, Any]) -> "IssueSearchResult":
-        issues = [Issue.from_dict(i) for i in data.get("issues", [])]
+    def from_dict(
+        cls, data: dict[str, Any], fields: Iterable[str] | None = None
+    ) -> "IssueSearchResult":
+        """Build a result page; ``fields`` is the projection, as for ``Issue.from_dict``."""
+        issues = [Issue.from_dict(i, fields) for i in data.get("issues", [])]
         return cls(
             total=data.get("total", len(issues)),
             start_at=data.get("startAt", 0),
             max_results=data.get("maxResults", len(issues)),
             issues=issues,
+            next_page_token=data.get("nextPageToken"),
         )
@@ -0,0 +1,23 @@
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass
+class User:
+    """A Jira user account."""
+
+    account_id: str
+    display_name: str
+    email: str | None  # None when hidden by the user's profile visibility settings
+    active: bool = True
+    account_type: str = "atlassian"  # "atlassian", "app" or "customer"
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "User":
+        return cls(
+            account_id=data["accountId"],
+            display_name=data.get("displayName", ""),
+            email=data.get("emailAddress") or None,
+            active=data.get("active", True),
+            account_type=data.get("accountType", "atlassian"),
+        )
@@ -0,0 +1,339 @@
+"""HTTP transport shared by every API group: retries, backoff and client-wide pacing."""
+
+import math
+import random
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any
+from urllib.parse import urlsplit
+
+import requests
+
+from jira_client.coalesce import SingleFlight
+from jira_client.codec import JsonCodec, get_codec
+from jira_client.config import JiraConfig
+from jira_client.instrumentation import RequestEvent, RequestHook, path_template
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+# 429 means the request was rejected before being processed, so it is safe to retry
+# for any method. Gateway errors are only retried for idempotent requests.
+_THROTTLED = 429
+_TRANSIENT_STATUSES = frozenset({502, 503, 504})
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Parse a ``Retry-After`` header (delta-seconds or HTTP-date) into seconds."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+def parse_rate_limit_reset(value: str | None) -> float | None:
+    """Parse an ``X-RateLimit-Reset`` header (ISO 8601 timestamp) into seconds from now."""
+    if not value:
+        return None
+    try:
+        when = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+def accept_encoding() -> str:
+    """Return the ``Accept-Encoding`` value for the codecs this interpreter can decode."""
+    encodings = ["gzip", "deflate"]
+    for module in ("brotli", "brotlicffi"):
+        try:
+            __import__(module)
+        except ImportError:
+            continue
+        encodings.append("br")
+        break
+    return ", ".join(encodings)
+
+
+def encode_body(codec: JsonCodec, kwargs: dict[str, Any]) -> None:
+    """Replace a ``json=`` request argument with a body encoded by ``codec``.
+
+    The body is encoded once, before the first attempt, and resent as-is on retries.
+    The session already sends ``Content-Type: application/json``.
+    """
+    if "json" in kwargs:
+        body = kwargs.pop("json")
+        if body is not None:
+            kwargs["data"] = codec.dumps(body)
+
+
+def start_event(
+    hooks: list[RequestHook], method: str, url: str, path: str | None, kwargs: dict[str, Any]
+) -> RequestEvent:
+    """Create the event for a request about to be sent and run the ``before`` hooks."""
+    body = kwargs.get("data")
+    event = RequestEvent(
+        method,
+        path_template(path if path is not None else urlsplit(url).path),
+        url,
+        bytes_sent=len(body) if isinstance(body, (bytes, str)) else 0,
+    )
+    for hook in hooks:
+        hook.before_request(event)
+    return event
+
+
+def finish_event(
+    hooks: list[RequestHook], event: RequestEvent, response: Any, error: BaseException | None
+) -> None:
+    """Record the outcome of a request on its event and run the ``after`` hooks."""
+    event.latency = time.perf_counter() - event.started
+    if response is not None:
+        event.status = response.status_code
+        event.bytes_received = len(response.content)
+    event.error = error
+    for hook in hooks:
+        hook.after_request(event)
+
+
+def is_retryable(status: int, idempotent: bool) -> bool:
+    return status == _THROTTLED or (idempotent and status in _TRANSIENT_STATUSES)
+
+
+def observe_response(
+    bucket: "TokenBucket", response: Any, max_pause: float | None = None
+) -> float | None:
+    """Feed a response's rate-limit headers into ``bucket``; return its Retry-After.
+
+    The bucket is paused for at most ``max_pause`` seconds, however long the server
+    asks to wait. Works with any response exposing ``status_code`` and ``headers``.
+    """
+    headers = response.headers
+    retry_after = parse_retry_after(headers.get("Retry-After"))
+    cap = math.inf if max_pause is None else max_pause
+    if response.status_code == _THROTTLED:
+        bucket.throttled()
+        if retry_after is not None:
+            bucket.pause(min(retry_after, cap))
+    else:
+        bucket.succeeded()
+    if headers.get("X-RateLimit-Remaining") == "0":
+        reset = parse_rate_limit_reset(headers.get("X-RateLimit-Reset"))
+        if reset is not None:
+            bucket.pause(min(reset, cap))
+            if retry_after is None and response.status_code == _THROTTLED:
+                retry_after = reset
+    return retry_after
+
+
+class TokenBucket:
+    """Thread-safe token bucket that paces requests across all API groups of a client.
+
+    ``rate`` is the steady-state number of requests per second (None disables pacing)
+    and ``capacity`` the burst size. When the server throttles, the rate is halved and
+    then recovers additively on each success (AIMD), so throughput settles just under
+    the server's limit. ``pause`` blocks every caller until a given time has passed.
+    """
+
+    def __init__(self, rate: float | None = None, capacity: int | None = None) -> None:
+        self._max_rate = rate
+        self._rate = rate
+        self._capacity = float(capacity or max(1, int(rate or 1)))
+        self._tokens = self._capacity
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def rate(self) -> float | None:
+        return self._rate
+
+    def reserve(self) -> float:
+        """Take one token and return how many seconds the caller must wait before sending."""
+        with self._lock:
+            now = time.monotonic()
+            wait = max(0.0, self._blocked_until - now)
+            if self._rate:
+                elapsed = now - self._updated
+                self._tokens = min(self._capacity, self._tokens + elapsed * self._rate)
+                self._tokens -= 1
+                if self._tokens < 0:
+                    wait = max(wait, -self._tokens / self._rate)
+            self._updated = now
+            return wait
+
+    def acquire(self) -> None:
+        """Block until a request may be sent."""
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    def pause(self, seconds: float) -> None:
+        """Hold back every caller for ``seconds`` (e.g. until a rate-limit window resets)."""
+        with self._lock:
+            self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+
+    def throttled(self) -> None:
+        """Record a 429: multiplicatively decrease the pacing rate."""
+        with self._lock:
+            if self._rate and self._max_rate:
+                self._rate = max(self._max_rate / 32, self._rate / 2)
+
+    def succeeded(self) -> None:
+        """Record a successful request: additively recover the pacing rate."""
+        if self._rate is None or self._rate == self._max_rate:
+            return
+        with self._lock:
+            if self._rate and self._max_rate:
+                self._rate = min(self._max_rate, self._rate + self._max_rate / 100)
+
+
+@dataclass
+class RetryPolicy:
+    """How many times, and after how long, a failed request is retried."""
+
+    max_retries: int = 4
+    backoff_factor: float = 0.5
+    max_backoff: float = 30.0
+
+    def should_retry(self, attempt: int, retry_after: float | None = None) -> bool:
+        """Return whether retry number ``attempt`` (0-based) may be made.
+
+        Not when the retries are used up, nor when the server asks to wait longer
+        than ``max_backoff``: the caller then gets the response (a 429 surfaces as
+        ``JiraRateLimitError`` carrying ``retry_after``) instead of a silent stall.
+        """
+        return attempt < self.max_retries and (
+            retry_after is None or retry_after <= self.max_backoff
+        )
+
+    def delay(self, attempt: int, retry_after: float | None = None) -> float:
+        """Return the sleep before retry number ``attempt`` (0-based).
+
+        A server-provided ``Retry-After`` wins, capped at ``max_backoff`` (plus a
+        little jitter so that waiting workers do not all fire at once); otherwise
+        full-jitter exponential backoff.
+        """
+        if retry_after is not None:
+            return min(retry_after, self.max_backoff) + random.uniform(0, self.backoff_factor)
+        return random.uniform(0, min(self.max_backoff, self.backoff_factor * 2**attempt))
+
+
+class Transport:
+    """Sends requests through a shared session, bucket, retry policy and JSON codec.
+
+    One instance is created per ``JiraClient`` and shared by its API groups, so the
+    pacing applies to the client as a whole.
+    """
+
+    def __init__(
+        self,
+        session: requests.Session,
+        retry: RetryPolicy | None = None,
+        bucket: TokenBucket | None = None,
+        timeout: tuple[float | None, float | None] | None = None,
+        codec: JsonCodec | None = None,
+        hooks: list[RequestHook] | None = None,
+        flight: SingleFlight | None = None,
+    ) -> None:
+        self.session = session
+        self.retry = retry or RetryPolicy()
+        self.bucket = bucket or TokenBucket()
+        self.timeout = timeout
+        self.codec = codec or get_codec()
+        self.hooks = list(hooks or [])
+        # Shared by the API groups to coalesce identical GETs (None = disabled).
+        self.flight = flight
+
+    @classmethod
+    def from_config(
+        cls,
+        session: requests.Session,
+        config: JiraConfig,
+        codec: JsonCodec | None = None,
+        hooks: list[RequestHook] | None = None,
+    ) -> "Transport":
+        return cls(
+            session,
+            RetryPolicy(config.max_retries, config.backoff_factor, config.max_backoff),
+            TokenBucket(config.rate_limit, config.rate_limit_burst),
+            (config.connect_timeout, config.read_timeout),
+            codec or get_codec(config.json_backend),
+            hooks,
+            SingleFlight(config.coalesce_window) if config.coalesce_reads else None,
+        )
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        idempotent: bool | None = None,
+        path: str | None = None,
+        **kwargs: Any,
+    ) -> requests.Response:
+        """Send a request, retrying throttled and transient failures.
+
+        ``idempotent`` overrides the method-based default, e.g. for POST endpoints
+        that only read data. A ``json=`` body is encoded with the transport's codec.
+        ``path`` (the API path relative to the base URL) names the endpoint in the
+        events passed to hooks. The last response is returned once retries run out.
+        """
+        method = method.upper()
+        if idempotent is None:
+            idempotent = method in IDEMPOTENT_METHODS
+        kwargs.setdefault("timeout", self.timeout)
+        encode_body(self.codec, kwargs)
+        if not self.hooks:
+            return self._send(method, url, idempotent, kwargs, None)
+
+        event = start_event(self.hooks, method, url, path, kwargs)
+        try:
+            response = self._send(method, url, idempotent, kwargs, event)
+        except BaseException as exc:
+            finish_event(self.hooks, event, None, exc)
+            raise
+        finish_event(self.hooks, event, response, None)
+        return response
+
+    def _send(
+        self,
+        method: str,
+        url: str,
+        idempotent: bool,
+        kwargs: dict[str, Any],
+        event: RequestEvent | None,
+    ) -> requests.Response:
+        attempt = 0
+        while True:
+            self.bucket.acquire()
+            try:
+                response = self.session.request(method, url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout):
+                if not idempotent or attempt >= self.retry.max_retries:
+                    raise
+                time.sleep(self.retry.delay(attempt))
+                attempt += 1
+                if event is not None:
+                    event.retries = attempt
+                continue
+
+            retry_after = observe_response(self.bucket, response, self.retry.max_backoff)
+            if not is_retryable(response.status_code, idempotent) or not self.retry.should_retry(
+                attempt, retry_after
+            ):
+                return response
+            time.sleep(self.retry.delay(attempt, retry_after))
+            attempt += 1
+            if event is not None:
+                event.retries = attempt
@@ -0,0 +1,99 @@
+"""Declarative bulk upsert: bring Jira issues in line with rows from another system.
+
+Each row describes the wanted state of one issue with the column names of
+:class:`~jira_client.models.issue.IssueUpdate` (``summary``, ``description``,
+``priority``, ``assignee_account_id``, ``labels``, ``components``, ``due_date``);
+``labels`` and ``components`` may be lists or ``";"``-separated strings, as written
+by :mod:`jira_client.export`. Missing columns and empty cells leave a field as it is.
+
+Rows are matched to existing issues either by Jira key (``match="key"``, from a
+``key`` column) or by an external id stored as a label (``match="label"``: the id in
+``id_column`` becomes the label ``label_prefix + id``). Existing issues are found with
+a few batched JQL searches, the wanted values are diffed against the current ones,
+and only the fields that really differ are sent, concurrently. Unmatched rows are
+created (with the external-id label) unless ``create=False``; a later row with the
+same external id fails instead of creating a second issue. With ``dry_run=True``
+nothing is written and the result reports what would happen. The engine is
+:class:`~jira_client.api.upsert.UpsertAPI` (``client.upsert``)::
+
+    from jira_client.upsert import read_rows, upsert_issues
+
+    result = upsert_issues(client, read_rows("tracker.csv"), "MYPROJ",
+                           match="label", id_column="ticket", dry_run=True)
+    print(result.counts())
+"""
+
+import csv
+import json
+from collections.abc import Iterable, Iterator, Mapping
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from jira_client.api.upsert import (
+    MATCH_MODES,
+    UPSERT_COLUMNS,
+    UpsertAction,
+    UpsertResult,
+    diff_fields,
+)
+
+if TYPE_CHECKING:
+    from jira_client.client import JiraClient
+
+__all__ = [
+    "MATCH_MODES",
+    "UPSERT_COLUMNS",
+    "UpsertAction",
+    "UpsertResult",
+    "diff_fields",
+    "read_rows",
+    "upsert_issues",
+]
+
+
+def read_rows(path: str | Path) -> Iterator[dict[str, Any]]:
+    """Stream rows from a ``.csv``, ``.jsonl`` or ``.json`` (list of objects) file."""
+    path = Path(path)
+    suffix = path.suffix.lower()
+    if suffix == ".csv":
+        with path.open(newline="", encoding="utf-8") as f:
+            yield from csv.DictReader(f)
+    elif suffix == ".jsonl":
+        with path.open(encoding="utf-8") as f:
+            yield from (json.loads(line) for line in f if line.strip())
+    elif suffix == ".json":
+        yield from json.loads(path.read_text(encoding="utf-8"))
+    else:
+        raise ValueError(f"Unsupported row file {path.name!r}; expected .csv, .jsonl or .json")
+
+
+def upsert_issues(
+    client: "JiraClient",
+    rows: Iterable[Mapping[str, Any]],
+    project_key: str | None = None,
+    match: str = "key",
+    id_column: str = "external_id",
+    label_prefix: str = "ext-",
+    issue_type: str = "Task",
+    create: bool = True,
+    dry_run: bool = False,
+    batch_size: int = 500,
+    max_workers: int | None = None,
+) -> UpsertResult:
+    """Apply ``rows`` to Jira with as few writes as possible; see the module docstring.
+
+    Shorthand for ``client.upsert.apply(...)``. Rows are consumed ``batch_size`` at a
+    time, so any iterable (e.g. :func:`read_rows`) can be streamed.
+    """
+    return client.upsert.apply(
+        rows,
+        project_key,
+        match,
+        id_column,
+        label_prefix,
+        issue_type,
+        create,
+        dry_run,
+        batch_size,
+        max_workers,
+    )
@@ -1,7 +1,33 @@
 """Utilities for converting between plain text and Atlassian Document Format (ADF)."""
 
+import json
+from datetime import datetime, timezone
 from typing import Any
 
+# Marker pushed on the conversion stack to close a paragraph-like block.
+_END_BLOCK = object()
+
+_CONTAINERS = frozenset(
+    {
+        "doc",
+        "panel",
+        "expand",
+        "nestedExpand",
+        "layoutSection",
+        "layoutColumn",
+        "bodiedExtension",
+        "table",
+        "mediaSingle",
+        "mediaGroup",
+        "decisionList",
+        "taskList",
+    }
+)
+_INLINE_ATOMS = frozenset(
+    {"mention", "emoji", "status", "date", "inlineCard", "blockCard", "embedCard"}
+)
+_BLOCKS = frozenset({"paragraph", "heading", "codeBlock", "decisionItem", "taskItem"})
+
 
 def text_to_adf(text: str) -> dict[str, Any]:
     """Convert plain text to Atlassian Document Format (ADF).
@@ -10,15 +36,15 @@ def text_to_adf(text: str) -> dict[str, Any]:
     """
     paragraphs = []
     for para in text.split("\n\n"):
-        lines = para.strip().split("\n")
+        para = para.strip()
+        if not para:
+            continue
         content: list[dict[str, Any]] = []
-        for i, line in enumerate(lines):
-            if line:
-                content.append({"type": "text", "text": line})
-            if i < len(lines) - 1 and line:
+        for line in para.split("\n"):
+            if content:
                 content.append({"type": "hardBreak"})
-        if content:
-            paragraphs.append({"type": "paragraph", "content": content})
+            content.append({"type": "text", "text": line})
+        paragraphs.append({"type": "paragraph", "content": content})
 
     if not paragraphs:
         paragraphs = [{"type": "paragraph", "content": [{"type": "text", "text": text}]}]
@@ -26,28 +52,210 @@ def text_to_adf(text: str) -> dict[str, Any]:
     return {"type": "doc", "version": 1, "content": paragraphs}
 
 
-def adf_to_text(adf: dict[str, Any] | str | None) -> str | None:
+def adf_to_text(adf: dict[str, Any] | str | bytes | None) -> str | None:
     """Extract plain text from an ADF document.
 
+    Besides paragraphs and hard breaks, headings, code blocks, bullet / ordered /
+    task lists (indented per level), tables (cells joined with `` | ``), block
+    quotes (``> `` prefix), mentions, emoji, dates, status lozenges and smart links
+    are rendered. ``adf`` may also be the raw JSON bytes of an ADF document.
+    The document is walked with an explicit stack, so deeply nested content cannot
+    hit the recursion limit.
+
     Returns None if the input is empty or None.
     """
     if not adf:
         return None
+    if isinstance(adf, (bytes, bytearray, memoryview)):
+        adf = json.loads(adf)
     if isinstance(adf, str):
         return adf or None
 
-    texts: list[str] = []
-
-    def _traverse(node: dict[str, Any]) -> None:
-        node_type = node.get("type")
-        if node_type == "text":
-            texts.append(node.get("text", ""))
-        elif node_type == "hardBreak":
-            texts.append("\n")
-        for child in node.get("content", []):
-            _traverse(child)
-        if node_type == "paragraph" and texts and texts[-1] != "\n":
-            texts.append("\n")
-
-    _traverse(adf)
-    return "".join(texts).strip() or None
+    out: list[str] = []
+    prefix = ""  # written at the start of every line inside lists and quotes
+    saved: list[tuple[list[str], str]] = []  # enclosing (out, prefix) of open nodes
+    stack: list[Any] = [adf]
+    pop, push, extend = stack.pop, stack.append, stack.extend
+
+    while stack:
+        node = pop()
+        if node.__class__ is dict:
+            node_type = node.get("type")
+            if node_type == "text":
+                _write(out, prefix, node.get("text", ""))
+                continue
+            if node_type == "hardBreak":
+                out.append("\n")
+                continue
+
+            children = node.get("content") or ()
+            if node_type in _BLOCKS:
+                if node_type == "taskItem":
+                    done = (node.get("attrs") or {}).get("state") == "DONE"
+                    _write(out, prefix, "[x] " if done else "[ ] ")
+                # Inline content is written directly; the stack is only used for the
+                # rest of the block once a child needs more than text handling.
+                done_upto = _write_inline(out, prefix, children)
+                push(_END_BLOCK)
+                if done_upto < len(children):
+                    extend(reversed(children[done_upto:]))
+            elif node_type in _CONTAINERS:
+                extend(reversed(children))
+            elif node_type in ("bulletList", "orderedList"):
+                start = (node.get("attrs") or {}).get("order", 1) or 1
+                for index in range(len(children) - 1, -1, -1):
+                    marker = f"{start + index}. " if node_type == "orderedList" else "- "
+                    item = children[index].get("content") or ()
+                    text = _simple_line(item)
+                    if text is not None:  # the common one-paragraph item
+                        push(("line", "", prefix + marker + text + "\n"))
+                        continue
+                    push(("close", "item", marker))
+                    extend(reversed(item))
+                    push(("open", "item", marker))
+            elif node_type == "blockquote":
+                push(("close", "quote", "> "))
+                extend(reversed(children))
+                push(("open", "quote", "> "))
+            elif node_type == "tableRow":
+                cells = [_simple_cell(cell.get("content") or ()) for cell in children]
+                if None not in cells:
+                    push(" | ".join(cells) + "\n")  # type: ignore[arg-type]
+                    continue
+                push("\n")
+                for index in range(len(children) - 1, -1, -1):
+                    if cells[index] is not None:
+                        push(cells[index])
+                    else:
+                        push(("close", "cell", ""))
+                        extend(reversed(children[index].get("content") or ()))
+                        push(("open", "cell", ""))
+                    if index:
+                        push(" | ")
+            elif node_type in _INLINE_ATOMS:
+                push(_atom_text(node_type, node.get("attrs") or {}))
+            elif node_type == "rule":
+                push(_END_BLOCK)
+            else:
+                extend(reversed(children))
+        elif node.__class__ is str:
+            _write(out, prefix, node)
+        elif node is _END_BLOCK:
+            if out and out[-1][-1:] != "\n":
+                out.append("\n")
+        else:
+            # ("open" | "close", kind, marker) around list items, quotes and table cells,
+            # or ("line", "", text) for a pre-rendered list item.
+            action, kind, marker = node
+            if action == "line":
+                if out and out[-1][-1:] != "\n":
+                    out.append("\n")
+                out.append(marker)
+            elif action == "open":
+                saved.append((out, prefix))
+                if kind == "cell":
+                    out, prefix = [], ""
+                    continue
+                if out and out[-1][-1:] != "\n":
+                    out.append("\n")
+                if kind == "item":
+                    out.append(prefix + marker)
+                    prefix += " " * len(marker)
+                else:
+                    prefix += marker
+            elif kind == "cell":
+                text = " ".join("".join(out).split())
+                out, prefix = saved.pop()
+                push(text)
+            else:
+                if out and out[-1][-1:] != "\n":
+                    out.append("\n")
+                prefix = saved.pop()[1]
+
+    return "".join(out).strip() or None
+
+
+def _write(out: list[str], prefix: str, text: str) -> None:
+    """Append ``text``, starting each of its non-empty lines with ``prefix``."""
+    if not prefix:
+        out.append(text)
+        return
+    if "\n" not in text:
+        if text:
+            if not out or out[-1][-1:] == "\n":
+                out.append(prefix)
+            out.append(text)
+        return
+    for i, line in enumerate(text.split("\n")):
+        if i:
+            out.append("\n")
+        if line:
+            if not out or out[-1][-1:] == "\n":
+                out.append(prefix)
+            out.append(line)
+
+
+def _write_inline(out: list[str], prefix: str, children: Any) -> int:
+    """Write leading inline children; return the index of the first block-level one."""
+    for index, child in enumerate(children):
+        child_type = child.get("type")
+        if child_type == "text":
+            text = child.get("text", "")
+        elif child_type == "hardBreak":
+            out.append("\n")
+            continue
+        elif child_type in _INLINE_ATOMS:
+            text = _atom_text(child_type, child.get("attrs") or {})
+        else:
+            return index
+        if prefix:
+            _write(out, prefix, text)
+        else:
+            out.append(text)
+    return len(children)
+
+
+def _atom_text(node_type: str, attrs: dict[str, Any]) -> str:
+    """Render an inline atom: mention, emoji, status lozenge, date or smart link."""
+    if node_type == "date":
+        return _adf_date(attrs.get("timestamp"))
+    if node_type in ("inlineCard", "blockCard", "embedCard"):
+        return attrs.get("url", "")
+    return attrs.get("text") or attrs.get("shortName") or ""
+
+
+def _simple_line(content: Any) -> str | None:
+    """Return the text of content that is a single one-line paragraph, else None."""
+    if len(content) != 1 or content[0].get("type") != "paragraph":
+        return None
+    children = content[0].get("content") or ()
+    if len(children) == 1 and children[0].get("type") == "text":
+        text = children[0].get("text", "")
+        return None if "\n" in text else text
+    parts: list[str] = []
+    if _write_inline(parts, "", children) < len(children):
+        return None
+    text = "".join(parts)
+    return None if "\n" in text else text
+
+
+def _simple_cell(content: Any) -> str | None:
+    """Return the one-line text of a table cell made of plain paragraphs, else None."""
+    text = _simple_line(content)
+    if text is not None:
+        return text.strip()
+    parts: list[str] = []
+    for block in content:
+        children = block.get("content") or ()
+        if block.get("type") != "paragraph" or _write_inline(parts, "", children) < len(children):
+            return None
+        parts.append(" ")
+    return " ".join("".join(parts).split())
+
+
+def _adf_date(timestamp: Any) -> str:
+    try:
+        when = datetime.fromtimestamp(int(timestamp) / 1000, tz=timezone.utc)
+    except (TypeError, ValueError):
+        return ""
+    return when.date().isoformat()
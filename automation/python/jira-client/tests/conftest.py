@@ -0,0 +1,31 @@
+from collections.abc import Callable, Iterator
+from typing import Any
+
+import pytest
+
+from benchmarks.fake_jira import FakeJiraServer, serve
+from jira_client import JiraClient, JiraConfig
+
+
+@pytest.fixture()
+def server() -> Iterator[FakeJiraServer]:
+    with serve(issues=20) as server:
+        yield server
+
+
+@pytest.fixture()
+def make_client(server: FakeJiraServer) -> Callable[..., JiraClient]:
+    """Return a factory of clients for ``server``; keyword arguments go to JiraConfig."""
+
+    def make(**options: Any) -> JiraClient:
+        options = {"default_project": "BENCH", **options}
+        return JiraClient(
+            JiraConfig(domain=server.url, email="e@example.com", api_token="x", **options)
+        )
+
+    return make
+
+
+@pytest.fixture()
+def client(make_client: Callable[..., JiraClient]) -> JiraClient:
+    return make_client()
@@ -0,0 +1,82 @@
+import pytest
+import requests
+
+from benchmarks.fake_jira import FakeJiraServer
+from jira_client import JiraClient
+from jira_client.exceptions import JiraValidationError
+from jira_client.models import IssueUpdate
+
+OWNER = "user-0001"
+LEAD = "user-0002"
+
+
+def test_writes_are_merged_per_issue(client: JiraClient, server: FakeJiraServer) -> None:
+    with client.buffered() as writes:
+        for key in ("BENCH-1", "BENCH-2"):
+            writes.update(key, IssueUpdate(labels=["triaged"]))
+            writes.update(key, IssueUpdate(summary="Merged", assignee_account_id=LEAD))
+            writes.assign(key, OWNER)
+            writes.add_watcher(key, LEAD)
+            writes.add_watcher(key, LEAD)
+
+    assert writes.result.ok
+    assert (writes.result.writes, writes.result.requests) == (10, 6)
+    assert server.stats["PUT issue/{key}"] == 2
+    assert server.stats["PUT issue/{key}/assignee"] == 2
+    assert server.stats["POST issue/{key}/watchers"] == 2
+    issue = client.issues.get("BENCH-2")
+    assert (issue.summary, issue.labels) == ("Merged", ["triaged"])
+    assert server.store.issues["BENCH-2"]["fields"]["assignee"]["accountId"] == OWNER
+
+
+def test_rejected_assignee_does_not_fail_field_changes(
+    client: JiraClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    def reject(key: str, account_id: str | None) -> None:
+        raise JiraValidationError("User cannot be assigned issues.", status_code=400)
+
+    monkeypatch.setattr(client.issues, "assign", reject)
+    with client.buffered() as writes:
+        writes.update("BENCH-1", IssueUpdate(labels=["triaged"]))
+        writes.assign("BENCH-1", OWNER)
+
+    (failure,) = writes.result.failures
+    assert (failure.key, failure.operation, failure.status) == ("BENCH-1", "assign", 400)
+    assert client.issues.get("BENCH-1").labels == ["triaged"]
+    assert len(writes) == 0
+
+
+def test_failures_are_reported_and_not_requeued(client: JiraClient) -> None:
+    with client.buffered() as writes:
+        writes.update("BENCH-9999", IssueUpdate(summary="Nope"))
+        writes.add_watcher("BENCH-9999", LEAD)
+        writes.update("BENCH-3", IssueUpdate(summary="Fine"))
+
+    failures = {(f.operation, f.status, f.account_id) for f in writes.result.failures}
+    assert failures == {("update", 404, None), ("watcher", 404, LEAD)}
+    assert {f.key for f in writes.result.failures} == {"BENCH-9999"}
+    assert len(writes) == 0
+    assert client.issues.get("BENCH-3").summary == "Fine"
+
+
+def test_unsent_writes_are_requeued(client: JiraClient, monkeypatch: pytest.MonkeyPatch) -> None:
+    def offline(key: str, fields: dict) -> None:
+        raise requests.ConnectionError("connection refused")
+
+    writes = client.buffered()
+    writes.update("BENCH-1", IssueUpdate(labels=["triaged"]))
+    writes.add_watcher("BENCH-1", LEAD)
+    with monkeypatch.context() as patch:
+        patch.setattr(client.issues, "update_fields", offline)
+        flushed = writes.flush()
+
+    (failure,) = flushed.failures
+    assert (failure.operation, failure.status) == ("update", None)
+    assert len(writes) == 1
+    writes.update("BENCH-1", IssueUpdate(summary="Later"))
+
+    flushed = writes.flush()
+    assert flushed.ok and flushed.requests == 1
+    issue = client.issues.get("BENCH-1")
+    assert (issue.summary, issue.labels) == ("Later", ["triaged"])
+    assert writes.result.writes == 3
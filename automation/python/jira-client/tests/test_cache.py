@@ -0,0 +1,78 @@
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+from benchmarks.fake_jira import FakeJiraServer
+from jira_client import JiraClient
+from jira_client.cache import IssueCache
+from jira_client.models import IssueUpdate
+
+
+@pytest.fixture()
+def cached_client(make_client: Callable[..., JiraClient], tmp_path: Path) -> JiraClient:
+    return make_client(cache_path=str(tmp_path / "cache.sqlite3"))
+
+
+def test_get_reads_cache_whatever_the_key_case(
+    cached_client: JiraClient, server: FakeJiraServer
+) -> None:
+    first = cached_client.issues.get("BENCH-4")
+    again = cached_client.issues.get(" bench-4 ")
+
+    assert again.summary == first.summary
+    assert server.stats["GET issue/{key}"] == 1
+
+
+def test_stale_entries_are_fetched_again(
+    make_client: Callable[..., JiraClient], server: FakeJiraServer, tmp_path: Path
+) -> None:
+    client = make_client(cache_path=str(tmp_path / "cache.sqlite3"), cache_max_age=0.05)
+    client.issues.get("BENCH-4")
+    client.issues.get("BENCH-4")
+    assert server.stats["GET issue/{key}"] == 1
+
+    time.sleep(0.1)
+    client.issues.get("BENCH-4")
+    assert server.stats["GET issue/{key}"] == 2
+
+
+def test_sync_refreshes_entries_and_stores_a_watermark(
+    cached_client: JiraClient, server: FakeJiraServer
+) -> None:
+    before = time.time()
+    assert cached_client.issues.sync("BENCH") == 20
+    cache = cached_client.cache
+    assert before <= cache.watermark("BENCH") <= time.time()
+
+    keys = [f"BENCH-{n}" for n in range(1, 21)]
+    assert len(cache.get_many(keys)) == 20
+    assert len(cache.get_many(keys, max_age=0)) == 0
+    issues = cached_client.issues.get_many(keys)
+    assert not issues.missing
+    assert server.stats["GET issue/{key}"] == 0
+
+
+def test_incremental_sync_fetches_only_issues_updated_since_the_watermark(
+    cached_client: JiraClient,
+) -> None:
+    cached_client.issues.sync("BENCH")
+    watermark = cached_client.cache.watermark("BENCH")
+    cached_client.issues.update("BENCH-3", IssueUpdate(summary="Changed"))
+
+    assert cached_client.issues.sync("BENCH") == 1
+    assert cached_client.cache.watermark("BENCH") > watermark
+    assert cached_client.cache.get("BENCH-3")["fields"]["summary"] == "Changed"
+
+
+def test_full_sync_prunes_deleted_issues(
+    cached_client: JiraClient, server: FakeJiraServer, tmp_path: Path
+) -> None:
+    cached_client.issues.sync("BENCH")
+    del server.store.issues["BENCH-5"]
+
+    assert cached_client.issues.sync("BENCH", full=True) == 19
+    with IssueCache(tmp_path / "cache.sqlite3") as cache:
+        keys = {issue["key"] for issue in cache.iter_project("BENCH")}
+    assert len(keys) == 19 and "BENCH-5" not in keys
@@ -0,0 +1,75 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from jira_client.aio.coalesce import AsyncSingleFlight
+from jira_client.coalesce import SingleFlight
+
+
+def test_forget_does_not_keep_an_in_flight_result() -> None:
+    flight = SingleFlight(window=10)
+    calls: list[int] = []
+    started = threading.Event()
+
+    def slow() -> int:
+        calls.append(1)
+        started.set()
+        time.sleep(0.1)
+        return len(calls)
+
+    leader = threading.Thread(target=flight.do, args=("k", slow))
+    leader.start()
+    started.wait()
+    flight.forget()
+    assert flight.do("k", slow) == 2  # a new call, not the stale one
+    leader.join()
+    assert flight.do("k", slow) == 2  # the new result is the one kept
+
+
+def test_cancelled_leader_does_not_cancel_waiters() -> None:
+    async def main() -> None:
+        flight = AsyncSingleFlight()
+        release = asyncio.Event()
+
+        async def fetch() -> str:
+            await release.wait()
+            return "result"
+
+        leader = asyncio.create_task(flight.do("k", fetch))
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(flight.do("k", fetch))
+        await asyncio.sleep(0)
+        leader.cancel()
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await waiter == "result"
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+
+    asyncio.run(main())
+
+
+def test_failed_call_is_shared_and_not_kept() -> None:
+    async def main() -> None:
+        flight = AsyncSingleFlight(window=10)
+        calls = 0
+
+        async def fail() -> None:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            raise ValueError("boom")
+
+        results = await asyncio.gather(
+            flight.do("k", fail), flight.do("k", fail), return_exceptions=True
+        )
+        assert [type(r) for r in results] == [ValueError, ValueError]
+        assert calls == 1
+        with pytest.raises(ValueError):
+            await flight.do("k", fail)
+        assert calls == 2
+
+    asyncio.run(main())
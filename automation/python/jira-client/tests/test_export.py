@@ -0,0 +1,103 @@
+import json
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from benchmarks.fake_jira import FakeJiraServer, serve
+from jira_client import JiraClient
+from jira_client.exceptions import JiraClientError
+from jira_client.export import export_issues
+
+JQL = "project = BENCH ORDER BY key"
+
+
+class Interrupted(Exception):
+    pass
+
+
+@pytest.fixture()
+def server() -> Iterator[FakeJiraServer]:
+    with serve(issues=250) as server:
+        yield server
+
+
+def _interrupt_after(client: JiraClient, monkeypatch: pytest.MonkeyPatch, pages: int) -> None:
+    """Make the search fail once ``pages`` pages have been fetched."""
+    search_page = client.issues._search_page
+    calls = 0
+
+    def flaky(*args: Any, **kwargs: Any) -> dict[str, Any]:
+        nonlocal calls
+        calls += 1
+        if calls > pages:
+            raise Interrupted
+        return search_page(*args, **kwargs)
+
+    monkeypatch.setattr(client.issues, "_search_page", flaky)
+
+
+def _export(client: JiraClient, path: Path, tmp_path: Path, **options: Any) -> Any:
+    options = {"fields": ["summary"], "page_size": 50, **options}
+    return export_issues(client, JQL, path, checkpoint=tmp_path / "export.ckpt", **options)
+
+
+def _interrupted_export(
+    client: JiraClient, path: Path, tmp_path: Path, pages: int, **options: Any
+) -> None:
+    with pytest.MonkeyPatch.context() as patch:
+        _interrupt_after(client, patch, pages)
+        with pytest.raises(Interrupted):
+            _export(client, path, tmp_path, **options)
+
+
+def test_resume_continues_after_the_checkpoint(client: JiraClient, tmp_path: Path) -> None:
+    path = tmp_path / "issues.jsonl"
+    _interrupted_export(client, path, tmp_path, pages=3)
+    checkpoint = json.loads((tmp_path / "export.ckpt").read_text())
+    assert checkpoint["start_at"] == checkpoint["rows"] > 0
+
+    result = _export(client, path, tmp_path)
+
+    keys = [json.loads(line)["key"] for line in path.read_text().splitlines()]
+    assert result.resumed and result.rows == 250
+    assert sorted(keys) == sorted(f"BENCH-{n}" for n in range(1, 251))
+    assert not (tmp_path / "export.ckpt").exists()
+
+
+def test_resume_truncates_rows_written_after_the_checkpoint(
+    client: JiraClient, tmp_path: Path
+) -> None:
+    path = tmp_path / "issues.csv"
+    _interrupted_export(client, path, tmp_path, pages=2)
+    with open(path, "a", encoding="utf-8") as fh:
+        fh.write("10001,BENCH-1,torn ro")  # a page cut short by the crash
+
+    _export(client, path, tmp_path)
+
+    lines = path.read_text().splitlines()
+    assert lines[0] == "id,key,summary"
+    assert len(lines) == 251
+    assert len({line.split(",")[1] for line in lines[1:]}) == 250
+    assert not any(line.endswith("torn ro") for line in lines)
+
+
+def test_parquet_resume_keeps_only_finished_row_groups(client: JiraClient, tmp_path: Path) -> None:
+    pq = pytest.importorskip("pyarrow.parquet")
+    path = tmp_path / "issues"
+    _interrupted_export(client, path, tmp_path, pages=3, format="parquet", rows_per_file=100)
+
+    result = _export(client, path, tmp_path, format="parquet", rows_per_file=100)
+
+    table = pq.read_table(path)
+    assert result.resumed and table.num_rows == 250
+    assert len(set(table.column("key").to_pylist())) == 250
+
+
+def test_checkpoint_of_another_export_is_rejected(client: JiraClient, tmp_path: Path) -> None:
+    path = tmp_path / "issues.jsonl"
+    _interrupted_export(client, path, tmp_path, pages=1)
+
+    with pytest.raises(JiraClientError, match="different export"):
+        _export(client, path, tmp_path, fields=["summary", "status"])
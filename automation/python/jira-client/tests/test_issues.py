@@ -0,0 +1,56 @@
+from collections.abc import Callable
+
+import pytest
+
+from jira_client import JiraClient
+from jira_client.exceptions import JiraNotFoundError
+from jira_client.models import CreatedIssue, Issue, IssueCreate, IssueUpdate
+
+
+def test_coalesced_reads_do_not_share_mutable_values(
+    make_client: Callable[..., JiraClient],
+) -> None:
+    client = make_client(coalesce_reads=True, coalesce_window=5)
+    client.issues.update("BENCH-2", IssueUpdate(labels=["one"]))
+
+    first, second = client.issues.get("BENCH-2"), client.issues.get("BENCH-2")
+    assert first.labels is not second.labels
+    first.labels.append("local")
+    assert client.issues.get("BENCH-2").labels == ["one"]
+
+    transitions = client.issues.get_transitions("BENCH-2")
+    transitions[0]["name"] = "changed"
+    assert client.issues.get_transitions("BENCH-2")[0]["name"] != "changed"
+
+    client.issues.add_watcher("BENCH-2", "5b10ac8d82e05b22cc7d0001")
+    watchers = client.issues.get_watchers("BENCH-2")
+    watchers[0]["accountId"] = "changed"
+    assert client.issues.get_watchers("BENCH-2")[0]["accountId"] != "changed"
+
+
+def test_bulk_create_fetches_issues_the_search_missed(
+    client: JiraClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(client.issues, "_fetch_by_keys", lambda keys: {})
+    result = client.issues.bulk_create(
+        [IssueCreate("BENCH", summary="One"), IssueCreate("BENCH", summary="Two")]
+    )
+
+    assert [issue.summary for issue in result.issues] == ["One", "Two"]
+    assert all(isinstance(issue, Issue) for issue in result.issues)
+    assert result.unhydrated == []
+
+
+def test_bulk_create_reports_unhydrated_issues(
+    client: JiraClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    def missing(key: str) -> Issue:
+        raise JiraNotFoundError(f"Issue {key} not found", status_code=404)
+
+    monkeypatch.setattr(client.issues, "_fetch_by_keys", lambda keys: {})
+    monkeypatch.setattr(client.issues, "get", missing)
+    result = client.issues.bulk_create([IssueCreate("BENCH", summary="One")])
+
+    (created,) = result.issues
+    assert isinstance(created, CreatedIssue)
+    assert result.unhydrated == [created.key]
@@ -0,0 +1,42 @@
+from typing import Any
+
+import pytest
+
+from jira_client import JiraClient
+from jira_client.api.issues import _split_order_by
+
+
+@pytest.mark.parametrize(
+    ("jql", "expected"),
+    [
+        ("project = A ORDER BY key", ("project = A", "ORDER BY key")),
+        ("ORDER BY created DESC", ("", "ORDER BY created DESC")),
+        ("  order by created", ("", "order by created")),
+        ("project = A", ("project = A", "")),
+        ("(project = A)ORDER BY key", ("(project = A)", "ORDER BY key")),
+        (
+            'summary ~ "sort order by date" ORDER BY key',
+            ('summary ~ "sort order by date"', "ORDER BY key"),
+        ),
+        ("summary ~ 'order by \\' x' ", ("summary ~ 'order by \\' x'", "")),
+        ("labels = border ORDER BY key", ("labels = border", "ORDER BY key")),
+    ],
+)
+def test_split_order_by(jql: str, expected: tuple[str, str]) -> None:
+    assert _split_order_by(jql) == expected
+
+
+def test_created_ranges_of_an_order_only_query(
+    client: JiraClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    sent: list[str] = []
+
+    def search_page(jql: str, *args: Any, **kwargs: Any) -> dict[str, Any]:
+        sent.append(jql)
+        return {"issues": [], "isLast": True}  # everything was deleted meanwhile
+
+    monkeypatch.setattr(client.issues, "_search_page", search_page)
+    result = client.issues._search_created_ranges("ORDER BY created DESC", 50, None, None)
+
+    assert result == []
+    assert sent == ["ORDER BY created ASC", "ORDER BY created DESC"]
@@ -0,0 +1,94 @@
+import time
+from typing import Any
+
+import pytest
+
+from benchmarks.fake_jira import serve
+from jira_client import JiraClient, JiraConfig
+from jira_client.exceptions import JiraRateLimitError
+from jira_client.transport import RetryPolicy, TokenBucket
+
+
+def _client(url: str, **options: Any) -> JiraClient:
+    options = {"default_project": "BENCH", "backoff_factor": 0.01, **options}
+    return JiraClient(JiraConfig(domain=url, email="e@example.com", api_token="x", **options))
+
+
+def test_throttled_requests_are_retried() -> None:
+    with serve(issues=5, throttle=0.5) as server:
+        client = _client(server.url)
+        issues = [client.issues.get(f"BENCH-{n}") for n in range(1, 6)]
+
+    assert [issue.key for issue in issues] == [f"BENCH-{n}" for n in range(1, 6)]
+    assert server.stats["throttled"] == 4  # every other request
+    assert server.stats["GET issue/{key}"] == 5
+
+
+def test_retries_run_out() -> None:
+    with serve(issues=5, throttle=1.0) as server:
+        client = _client(server.url, max_retries=2)
+        with pytest.raises(JiraRateLimitError) as raised:
+            client.issues.get("BENCH-1")
+
+    assert raised.value.status_code == 429
+    assert server.stats["requests"] == 3
+
+
+def test_long_retry_after_is_raised_not_waited_for() -> None:
+    with serve(issues=5, throttle=1.0, retry_after=120) as server:
+        client = _client(server.url, max_backoff=1.0)
+        started = time.monotonic()
+        with pytest.raises(JiraRateLimitError) as raised:
+            client.issues.get("BENCH-1")
+
+    assert raised.value.retry_after == 120
+    assert server.stats["requests"] == 1
+    assert time.monotonic() - started < 1.0
+    assert client._transport.bucket.reserve() <= 1.0
+
+
+def test_short_retry_after_is_honoured() -> None:
+    with serve(issues=5, throttle=0.5, retry_after=0.2) as server:
+        client = _client(server.url)
+        client.issues.get("BENCH-1")
+        started = time.monotonic()
+        client.issues.get("BENCH-2")  # throttled once
+
+    assert server.stats["throttled"] == 1
+    assert time.monotonic() - started >= 0.2
+
+
+def test_delay_is_capped_at_max_backoff() -> None:
+    policy = RetryPolicy(backoff_factor=0.5, max_backoff=2.0)
+
+    assert all(0 <= policy.delay(attempt) <= 2.0 for attempt in range(10))
+    assert 2.0 <= policy.delay(0, retry_after=600) <= 2.5
+    assert policy.should_retry(0, retry_after=2.0)
+    assert not policy.should_retry(0, retry_after=2.5)
+    assert not policy.should_retry(policy.max_retries)
+
+
+def test_bucket_halves_on_throttle_and_recovers_additively() -> None:
+    bucket = TokenBucket(rate=100.0)
+    bucket.throttled()
+    assert bucket.rate == 50.0
+    bucket.succeeded()
+    assert bucket.rate == 51.0
+
+    for _ in range(10):
+        bucket.throttled()
+    assert bucket.rate == 100.0 / 32
+
+    for _ in range(200):
+        bucket.succeeded()
+    assert bucket.rate == 100.0
+
+
+def test_throttling_slows_the_client_down() -> None:
+    with serve(issues=5, throttle=0.25) as server:
+        client = _client(server.url, rate_limit=200.0)
+        for _ in range(4):
+            client.issues.get("BENCH-1")
+
+    assert server.stats["throttled"] >= 1
+    assert client._transport.bucket.rate < 200.0
@@ -0,0 +1,69 @@
+from jira_client import JiraClient
+from jira_client.upsert import upsert_issues
+
+
+def _labelled(client: JiraClient, label: str) -> list[str]:
+    result = client.issues.search(f'labels in ("{label}")', fields=["labels"])
+    return [issue.key for issue in result.issues]
+
+
+def test_duplicate_external_id_in_batch_creates_one_issue(client: JiraClient) -> None:
+    rows = [
+        {"ticket": "T1", "summary": "First"},
+        {"ticket": "T2", "summary": "Other"},
+        {"ticket": "T1", "summary": "Second"},
+    ]
+    result = upsert_issues(client, rows, match="label", id_column="ticket")
+
+    first, other, duplicate = result.actions
+    assert (first.action, other.action, duplicate.action) == ("create", "create", "failed")
+    assert "row 0" in duplicate.message
+    assert duplicate.key is None
+    assert _labelled(client, "ext-T1") == [first.key]
+
+
+def test_duplicate_external_id_in_later_batch_creates_one_issue(client: JiraClient) -> None:
+    rows = [{"ticket": "T1", "summary": "First"}, {"ticket": "T1", "summary": "Second"}]
+    result = upsert_issues(client, rows, match="label", id_column="ticket", batch_size=1)
+
+    first, later = result.actions
+    assert first.action == "create"
+    assert later.action != "create"
+    assert _labelled(client, "ext-T1") == [first.key]
+
+
+def test_duplicate_external_id_in_dry_run(client: JiraClient) -> None:
+    rows = [{"ticket": "T1", "summary": "First"}, {"ticket": "T1", "summary": "Second"}]
+    result = upsert_issues(client, rows, match="label", id_column="ticket", dry_run=True)
+
+    assert result.counts() == {"create": 1, "update": 0, "unchanged": 0, "failed": 1}
+    assert _labelled(client, "ext-T1") == []
+
+
+def test_rejected_create_fails_only_its_row(client: JiraClient) -> None:
+    rows = [
+        {"ticket": "T1", "summary": "Good"},
+        {"ticket": "T2", "summary": "FAIL this one"},
+        {"ticket": "T3", "summary": "Also good"},
+    ]
+    result = upsert_issues(client, rows, match="label", id_column="ticket")
+
+    good, rejected, also_good = result.actions
+    assert (good.action, rejected.action, also_good.action) == ("create", "failed", "create")
+    assert "Rejected" in rejected.message
+    assert _labelled(client, "ext-T1") == [good.key]
+    assert _labelled(client, "ext-T3") == [also_good.key]
+
+
+def test_key_match_skips_unknown_keys(client: JiraClient) -> None:
+    rows = [
+        {"key": "BENCH-1", "labels": "synced"},
+        {"key": "BENCH-9999", "summary": "Nope"},
+        {"key": "bench-2", "labels": "synced"},
+    ]
+    result = upsert_issues(client, rows)
+
+    known, unknown, lower = result.actions
+    assert (known.action, unknown.action, lower.action) == ("update", "failed", "update")
+    assert "does not exist" in unknown.message
+    assert client.issues.get("BENCH-2").labels == ["synced"]
@@ -0,0 +1,37 @@
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from benchmarks.fake_jira import FakeJiraServer
+from jira_client import JiraClient
+
+
+def test_misses_expire_sooner_than_found_users(
+    make_client: Callable[..., JiraClient], server: FakeJiraServer
+) -> None:
+    client = make_client(user_miss_ttl=0.05)
+    queries = ["user3@example.com", "nobody@example.com"]
+    assert client.users.resolve_many(queries) == {
+        "user3@example.com": "5b10ac8d82e05b22cc7d0003",
+        "nobody@example.com": None,
+    }
+    client.users.resolve_many(queries)
+    assert server.stats["GET user/search"] == 2
+
+    time.sleep(0.1)
+    client.users.resolve_many(queries)
+    assert server.stats["GET user/search"] == 3  # only the miss is looked up again
+
+
+def test_only_found_users_are_persisted(
+    make_client: Callable[..., JiraClient], server: FakeJiraServer, tmp_path: Path
+) -> None:
+    cache_path = str(tmp_path / "cache.sqlite3")
+    queries = ["User 3", "nobody@example.com"]
+    make_client(cache_path=cache_path).users.resolve_many(queries)
+    assert server.stats["GET user/search"] == 2
+
+    later = make_client(cache_path=cache_path)
+    assert later.users.find("User 3").account_id == "5b10ac8d82e05b22cc7d0003"
+    assert later.users.resolve_many(queries)["nobody@example.com"] is None
+    assert server.stats["GET user/search"] == 3